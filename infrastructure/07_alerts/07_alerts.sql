@@ -5,25 +5,51 @@
 -- Script: 07_alerts.sql
 --
 -- Description:
---   Implements automated Snowflake ALERT objects for proactive
+--   Implements a consolidated alert evaluator for proactive
 --   monitoring of credit usage, query performance, warehouse
---   capacity, and cost governance. Alerts query Phase 06
---   monitoring views and send notifications via email.
+--   capacity, and cost governance. A single scheduled task
+--   evaluates every alert rule in one pass over the Phase 06
+--   monitoring views, persists alert state for deduplication
+--   and cooldown, and sends notifications via email.
 --
--- Alerts Created:
+-- Alert Rules Evaluated:
 --   1. ALERT_RESOURCE_MONITOR_CRITICAL - Resource monitor >= 90%
 --   2. ALERT_LONG_RUNNING_QUERY        - Queries > 5 minutes
 --   3. ALERT_FAILED_QUERY_SPIKE        - Failed query threshold
 --   4. ALERT_HIGH_WAREHOUSE_QUEUE      - Queue overload detection
 --   5. ALERT_MONTHLY_COST_SPIKE        - Month-over-month spike
 --
+-- Objects Created:
+--   - ALERT_RULES            - Rule thresholds, cooldowns, recipients
+--   - ALERT_STATE            - Last known state per rule (dedup/cooldown)
+--   - ALERT_EVALUATION_LOG   - One row per rule per evaluation
+--   - SP_EVALUATE_ALERTS_IN_SCHEMA - Single-pass evaluator logic
+--                            (internal, not granted)
+--   - SP_EVALUATE_ALERTS     - Production entry point (AUDIT schema)
+--   - TASK_ALERT_EVALUATOR   - Schedule for the evaluator (15 min)
+--
+-- Why Consolidated:
+--   The previous design used five ALERT objects, each on its
+--   own schedule, each waking MEDICORE_ADMIN_WH and scanning
+--   its source view up to three times (condition, count,
+--   sample). The evaluator scans each monitoring view exactly
+--   once per run and wakes the warehouse 4 times per hour
+--   instead of up to 12.
+--
 -- Notification:
---   All alerts send email via SYSTEM$SEND_EMAIL to:
---   platform-alerts@medicore-health.com
+--   Recipients are configured per rule in ALERT_RULES.
+--   Default: platform-alerts@medicore-health.com
 --
 -- Security:
---   - Alerts owned by ACCOUNTADMIN
---   - Only MEDICORE_PLATFORM_ADMIN can ENABLE/DISABLE
+--   - All objects owned by ACCOUNTADMIN
+--   - Only MEDICORE_PLATFORM_ADMIN can RESUME/SUSPEND the task
+--     and tune thresholds in ALERT_RULES
+--   - SP_EVALUATE_ALERTS runs with owner's rights against the
+--     fixed AUDIT schema at the current time only; a dry run
+--     (P_SEND_NOTIFICATIONS => FALSE) does not write ALERT_STATE.
+--     The schema-parameterized
+--     SP_EVALUATE_ALERTS_IN_SCHEMA runs with caller's rights
+--     and is not granted to any role
 --   - No access to clinical, billing, or analyst roles
 --
 -- Execution Requirements:
@@ -34,8 +60,8 @@
 --   - Compatible with MEDICORE_SVC_GITHUB_ACTIONS
 --
 -- Initial State:
---   All alerts created in SUSPENDED state.
---   Enable statements provided in Section 5.
+--   TASK_ALERT_EVALUATOR created in SUSPENDED state.
+--   Enable statement provided in Section 6.
 --
 -- Author: MediCore Platform Team
 -- Date: 2026-02-25
@@ -48,373 +74,710 @@ USE SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 
 -- ============================================================
--- SECTION 1: RESOURCE MONITOR ALERTS
+-- SECTION 1: RETIRE LEGACY ALERT OBJECTS
 -- ============================================================
--- Alerts for credit consumption and resource monitor thresholds.
+-- The five standalone ALERT objects are replaced by the
+-- consolidated evaluator below. Dropping them here keeps
+-- redeployments idempotent on accounts that ran version 2.0.
 -- ============================================================
 
--- ------------------------------------------------------------
--- ALERT_RESOURCE_MONITOR_CRITICAL
--- Purpose: Detect resource monitors at >= 90% consumption
--- Schedule: Every 30 minutes
--- Severity: CRITICAL
--- Action: Immediate attention required to prevent suspension
--- ------------------------------------------------------------
-CREATE OR REPLACE ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL
-    WAREHOUSE = MEDICORE_ADMIN_WH
-    SCHEDULE = 'USING CRON 0,30 * * * * UTC'
-    COMMENT = 'CRITICAL: Detects resource monitors at or above 90% credit consumption. Triggers every 30 minutes. Immediate attention required to prevent warehouse suspension. Query source: V_RESOURCE_MONITOR_STATUS.'
-    IF (EXISTS (
-        SELECT 1
-        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_RESOURCE_MONITOR_STATUS
-        WHERE PERCENTAGE_USED >= 90
-    ))
-    THEN
-        CALL SYSTEM$SEND_EMAIL(
-            'platform-alerts@medicore-health.com',
-            'CRITICAL: MediCore Resource Monitor Alert - Near Suspension Threshold',
-            (SELECT OBJECT_CONSTRUCT(
-                'severity', 'CRITICAL',
-                'alert_name', 'ALERT_RESOURCE_MONITOR_CRITICAL',
-                'event_timestamp', CURRENT_TIMESTAMP()::VARCHAR,
-                'description', 'One or more resource monitors have reached 90% or higher credit consumption',
-                'monitors_affected', (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
-                        'monitor_name', MONITOR_NAME,
-                        'percentage_used', PERCENTAGE_USED,
-                        'credit_quota', CREDIT_QUOTA,
-                        'remaining_credits', REMAINING_CREDITS,
-                        'health_status', HEALTH_STATUS
-                    ))
-                    FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_RESOURCE_MONITOR_STATUS
-                    WHERE PERCENTAGE_USED >= 90
-                ),
-                'recommended_action', 'Review credit consumption immediately. Consider increasing quota or optimizing workloads.'
-            )::VARCHAR)
-        );
+DROP ALERT IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL;
+DROP ALERT IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_LONG_RUNNING_QUERY;
+DROP ALERT IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_FAILED_QUERY_SPIKE;
+DROP ALERT IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_HIGH_WAREHOUSE_QUEUE;
+DROP ALERT IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_MONTHLY_COST_SPIKE;
+
+-- Earlier evaluator signatures that accepted a source schema or
+-- an evaluation time. Dropped so the owner's-rights overloads and
+-- their grants do not survive the redeployment.
+DROP PROCEDURE IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS(TIMESTAMP_LTZ, VARCHAR, BOOLEAN);
+DROP PROCEDURE IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS(TIMESTAMP_LTZ, BOOLEAN);
+DROP PROCEDURE IF EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(TIMESTAMP_LTZ, VARCHAR, BOOLEAN);
 
 
 -- ============================================================
--- SECTION 2: QUERY ALERTS
+-- SECTION 2: ALERT RULE CONFIGURATION
 -- ============================================================
--- Alerts for query performance and failure monitoring.
+-- One row per alert rule. THRESHOLD_VALUE meaning per rule:
+--   ALERT_RESOURCE_MONITOR_CRITICAL - minimum PERCENTAGE_USED
+--   ALERT_LONG_RUNNING_QUERY        - query count must exceed
+--   ALERT_FAILED_QUERY_SPIKE        - failed count must exceed
+--   ALERT_HIGH_WAREHOUSE_QUEUE      - AVG_QUERIES_QUEUED must exceed
+--   ALERT_MONTHLY_COST_SPIKE        - current / previous month ratio
 -- ============================================================
 
--- ------------------------------------------------------------
--- ALERT_LONG_RUNNING_QUERY
--- Purpose: Detect queries exceeding 5 minutes in last 15 min
--- Schedule: Every 15 minutes
--- Severity: WARNING
--- Action: Review and optimize long-running queries
--- ------------------------------------------------------------
-CREATE OR REPLACE ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_LONG_RUNNING_QUERY
-    WAREHOUSE = MEDICORE_ADMIN_WH
-    SCHEDULE = 'USING CRON 0,15,30,45 * * * * UTC'
-    COMMENT = 'WARNING: Detects queries exceeding 5 minutes execution time in the last 15 minutes. Triggers every 15 minutes. Review query patterns for optimization opportunities. Query source: V_LONG_RUNNING_QUERIES.'
-    IF (EXISTS (
-        SELECT 1
-        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_LONG_RUNNING_QUERIES
-        WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-    ))
-    THEN
-        CALL SYSTEM$SEND_EMAIL(
-            'platform-alerts@medicore-health.com',
-            'WARNING: MediCore Long Running Query Alert',
-            (SELECT OBJECT_CONSTRUCT(
-                'severity', 'WARNING',
-                'alert_name', 'ALERT_LONG_RUNNING_QUERY',
-                'event_timestamp', CURRENT_TIMESTAMP()::VARCHAR,
-                'description', 'Long-running queries detected in the last 15 minutes',
-                'query_count', (
-                    SELECT COUNT(*)
-                    FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_LONG_RUNNING_QUERIES
-                    WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-                ),
-                'sample_queries', (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
-                        'query_id', QUERY_ID,
-                        'user_name', USER_NAME,
-                        'warehouse_name', WAREHOUSE_NAME,
-                        'execution_time_minutes', EXECUTION_TIME_MINUTES
-                    ))
-                    FROM (
-                        SELECT QUERY_ID, USER_NAME, WAREHOUSE_NAME, EXECUTION_TIME_MINUTES
-                        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_LONG_RUNNING_QUERIES
-                        WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-                        ORDER BY EXECUTION_TIME_MINUTES DESC
-                        LIMIT 5
-                    )
-                ),
-                'recommended_action', 'Review query patterns and consider optimization or warehouse sizing adjustments.'
-            )::VARCHAR)
-        );
+CREATE TABLE IF NOT EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES (
+    ALERT_NAME              VARCHAR(100)    NOT NULL    COMMENT 'Alert rule identifier',
+    SEVERITY                VARCHAR(20)     NOT NULL    COMMENT 'CRITICAL or WARNING',
+    SOURCE_VIEW             VARCHAR(100)    NOT NULL    COMMENT 'Phase 06 monitoring view evaluated by this rule',
+    THRESHOLD_VALUE         NUMBER(18,4)    NOT NULL    COMMENT 'Trigger threshold (meaning is rule-specific)',
+    LOOKBACK_MINUTES        NUMBER(10,0)                COMMENT 'Evaluation window for time-bounded rules',
+    COOLDOWN_MINUTES        NUMBER(10,0)    NOT NULL    COMMENT 'Minimum minutes between notifications for this rule',
+    IS_ENABLED              BOOLEAN         NOT NULL    DEFAULT TRUE COMMENT 'Disabled rules are not evaluated',
+    NOTIFICATION_EMAIL      VARCHAR(255)    NOT NULL    COMMENT 'Notification recipient',
+    EMAIL_SUBJECT           VARCHAR(255)    NOT NULL    COMMENT 'Notification subject line',
+    DESCRIPTION             VARCHAR(1000)               COMMENT 'Human-readable description included in payload',
+    RECOMMENDED_ACTION      VARCHAR(1000)               COMMENT 'Suggested remediation included in payload',
+    UPDATED_AT              TIMESTAMP_LTZ   DEFAULT CURRENT_TIMESTAMP() COMMENT 'Last configuration change',
+    CONSTRAINT PK_ALERT_RULES PRIMARY KEY (ALERT_NAME)
+)
+COMMENT = 'Alert rule configuration for SP_EVALUATE_ALERTS. Thresholds, cooldowns, and recipients per rule.';
+
+MERGE INTO MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES AS tgt
+USING (
+    SELECT * FROM VALUES
+        ('ALERT_RESOURCE_MONITOR_CRITICAL', 'CRITICAL', 'V_RESOURCE_MONITOR_STATUS', 90,  NULL, 30,
+         'CRITICAL: MediCore Resource Monitor Alert - Near Suspension Threshold',
+         'One or more resource monitors have reached 90% or higher credit consumption',
+         'Review credit consumption immediately. Consider increasing quota or optimizing workloads.'),
+        ('ALERT_LONG_RUNNING_QUERY',        'WARNING',  'V_LONG_RUNNING_QUERIES',    0,   15,   15,
+         'WARNING: MediCore Long Running Query Alert',
+         'Long-running queries detected in the last 15 minutes',
+         'Review query patterns and consider optimization or warehouse sizing adjustments.'),
+        ('ALERT_FAILED_QUERY_SPIKE',        'WARNING',  'V_FAILED_QUERIES',          10,  15,   15,
+         'WARNING: MediCore Failed Query Spike Alert',
+         'More than 10 failed queries detected in the last 15 minutes',
+         'Review error codes and investigate affected users or workloads.'),
+        ('ALERT_HIGH_WAREHOUSE_QUEUE',      'WARNING',  'V_ACTIVE_WAREHOUSE_LOAD',   5,   NULL, 30,
+         'WARNING: MediCore High Warehouse Queue Alert',
+         'One or more warehouses have high query queue load',
+         'Consider increasing warehouse size or enabling multi-cluster scaling.'),
+        ('ALERT_MONTHLY_COST_SPIKE',        'CRITICAL', 'V_COST_BY_WAREHOUSE_MONTH', 1.2, NULL, 1440,
+         'CRITICAL: MediCore Monthly Cost Spike Alert',
+         'Current month credit consumption exceeds 120% of previous month',
+         'Review warehouse usage patterns and identify cost drivers immediately.')
+        AS v (ALERT_NAME, SEVERITY, SOURCE_VIEW, THRESHOLD_VALUE, LOOKBACK_MINUTES, COOLDOWN_MINUTES,
+              EMAIL_SUBJECT, DESCRIPTION, RECOMMENDED_ACTION)
+) AS src
+ON tgt.ALERT_NAME = src.ALERT_NAME
+WHEN MATCHED THEN UPDATE SET
+    tgt.SEVERITY            = src.SEVERITY,
+    tgt.SOURCE_VIEW         = src.SOURCE_VIEW,
+    tgt.THRESHOLD_VALUE     = src.THRESHOLD_VALUE,
+    tgt.LOOKBACK_MINUTES    = src.LOOKBACK_MINUTES,
+    tgt.COOLDOWN_MINUTES    = src.COOLDOWN_MINUTES,
+    tgt.EMAIL_SUBJECT       = src.EMAIL_SUBJECT,
+    tgt.DESCRIPTION         = src.DESCRIPTION,
+    tgt.RECOMMENDED_ACTION  = src.RECOMMENDED_ACTION,
+    tgt.UPDATED_AT          = CURRENT_TIMESTAMP()
+WHEN NOT MATCHED THEN INSERT (
+    ALERT_NAME, SEVERITY, SOURCE_VIEW, THRESHOLD_VALUE, LOOKBACK_MINUTES, COOLDOWN_MINUTES,
+    IS_ENABLED, NOTIFICATION_EMAIL, EMAIL_SUBJECT, DESCRIPTION, RECOMMENDED_ACTION
+) VALUES (
+    src.ALERT_NAME, src.SEVERITY, src.SOURCE_VIEW, src.THRESHOLD_VALUE, src.LOOKBACK_MINUTES, src.COOLDOWN_MINUTES,
+    TRUE, 'platform-alerts@medicore-health.com', src.EMAIL_SUBJECT, src.DESCRIPTION, src.RECOMMENDED_ACTION
+);
 
 
--- ------------------------------------------------------------
--- ALERT_FAILED_QUERY_SPIKE
--- Purpose: Detect > 10 failed queries in last 15 minutes
--- Schedule: Every 15 minutes
--- Severity: WARNING
--- Action: Investigate error patterns
--- ------------------------------------------------------------
-CREATE OR REPLACE ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_FAILED_QUERY_SPIKE
-    WAREHOUSE = MEDICORE_ADMIN_WH
-    SCHEDULE = 'USING CRON 0,15,30,45 * * * * UTC'
-    COMMENT = 'WARNING: Detects more than 10 failed queries in the last 15 minutes. Triggers every 15 minutes. Investigate error patterns and user issues. Query source: V_FAILED_QUERIES.'
-    IF (EXISTS (
-        SELECT 1
-        FROM (
-            SELECT COUNT(*) AS failed_count
-            FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_FAILED_QUERIES
-            WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-        )
-        WHERE failed_count > 10
-    ))
-    THEN
-        CALL SYSTEM$SEND_EMAIL(
-            'platform-alerts@medicore-health.com',
-            'WARNING: MediCore Failed Query Spike Alert',
-            (SELECT OBJECT_CONSTRUCT(
-                'severity', 'WARNING',
-                'alert_name', 'ALERT_FAILED_QUERY_SPIKE',
-                'event_timestamp', CURRENT_TIMESTAMP()::VARCHAR,
-                'description', 'More than 10 failed queries detected in the last 15 minutes',
-                'failed_query_count', (
-                    SELECT COUNT(*)
-                    FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_FAILED_QUERIES
-                    WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-                ),
-                'error_summary', (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
-                        'error_code', ERROR_CODE,
-                        'occurrence_count', cnt
-                    ))
-                    FROM (
-                        SELECT ERROR_CODE, COUNT(*) AS cnt
-                        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_FAILED_QUERIES
-                        WHERE START_TIME >= DATEADD('MINUTE', -15, CURRENT_TIMESTAMP())
-                        GROUP BY ERROR_CODE
-                        ORDER BY cnt DESC
-                        LIMIT 5
-                    )
-                ),
-                'recommended_action', 'Review error codes and investigate affected users or workloads.'
-            )::VARCHAR)
-        );
+-- ============================================================
+-- SECTION 3: ALERT STATE AND EVALUATION LOG
+-- ============================================================
+-- ALERT_STATE holds one row per rule and drives deduplication
+-- and cooldown. ALERT_EVALUATION_LOG records every evaluation,
+-- including suppressed notifications, for audit and tuning.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_STATE (
+    ALERT_NAME              VARCHAR(100)    NOT NULL    COMMENT 'Alert rule identifier',
+    IS_ACTIVE               BOOLEAN         NOT NULL    COMMENT 'Condition was true at the last evaluation',
+    LAST_EVALUATED_AT       TIMESTAMP_LTZ               COMMENT 'Last evaluation time',
+    LAST_TRIGGERED_AT       TIMESTAMP_LTZ               COMMENT 'Last time the condition was true',
+    LAST_NOTIFIED_AT        TIMESTAMP_LTZ               COMMENT 'Last time a notification was sent',
+    LAST_FINGERPRINT        VARCHAR(64)                 COMMENT 'SHA-256 of affected items in the last notification',
+    NOTIFICATION_COUNT      NUMBER(18,0)    NOT NULL    DEFAULT 0 COMMENT 'Total notifications sent',
+    UPDATED_AT              TIMESTAMP_LTZ   DEFAULT CURRENT_TIMESTAMP() COMMENT 'Row update timestamp',
+    CONSTRAINT PK_ALERT_STATE PRIMARY KEY (ALERT_NAME)
+)
+COMMENT = 'Per-rule alert state used by SP_EVALUATE_ALERTS for deduplication and cooldown.';
+
+CREATE TABLE IF NOT EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_EVALUATION_LOG (
+    EVALUATION_ID           VARCHAR(36)     NOT NULL    COMMENT 'Evaluator run identifier (shared by all rules in a run)',
+    EVALUATED_AT            TIMESTAMP_LTZ   NOT NULL    COMMENT 'Evaluation time',
+    ALERT_NAME              VARCHAR(100)    NOT NULL    COMMENT 'Alert rule identifier',
+    SEVERITY                VARCHAR(20)                 COMMENT 'Rule severity at evaluation time',
+    IS_TRIGGERED            BOOLEAN         NOT NULL    COMMENT 'Rule condition result',
+    METRIC_VALUE            NUMBER(18,4)                COMMENT 'Value compared against THRESHOLD_VALUE',
+    FINGERPRINT             VARCHAR(64)                 COMMENT 'SHA-256 of affected items',
+    SHOULD_NOTIFY           BOOLEAN         NOT NULL    COMMENT 'Notification dispatched (or would be, if sending disabled)',
+    SUPPRESSION_REASON      VARCHAR(20)                 COMMENT 'COOLDOWN or DUPLICATE when triggered but not notified',
+    NOTIFICATION_EMAIL      VARCHAR(255)                COMMENT 'Notification recipient',
+    EMAIL_SUBJECT           VARCHAR(255)                COMMENT 'Notification subject line',
+    PAYLOAD                 VARIANT                     COMMENT 'JSON notification payload'
+)
+COMMENT = 'Evaluation history for SP_EVALUATE_ALERTS. One row per rule per run.';
 
 
 -- ============================================================
--- SECTION 3: WAREHOUSE CAPACITY ALERTS
+-- SECTION 4: CONSOLIDATED EVALUATOR
 -- ============================================================
--- Alerts for warehouse load and queue monitoring.
+-- SP_EVALUATE_ALERTS_IN_SCHEMA computes every rule in a single
+-- statement. Each monitoring view is scanned once; counts,
+-- samples, and fingerprints are derived from that shared scan.
+--
+-- It runs with caller's rights and is not granted to any role:
+-- only ACCOUNTADMIN calls it directly (07_test_alerts.sql, against
+-- a fixture schema). Production runs go through
+-- SP_EVALUATE_ALERTS, which fixes the schema to
+-- MEDICORE_GOVERNANCE_DB.AUDIT.
+--
+-- Parameters:
+--   P_EVALUATION_TIME     - Reference time for windows and months
+--   P_SOURCE_SCHEMA       - Schema containing the monitoring views
+--                           and the ALERT_* tables
+--   P_SEND_NOTIFICATIONS  - FALSE evaluates and logs without
+--                           calling SYSTEM$SEND_EMAIL.
+--   P_UPDATE_STATE        - FALSE leaves ALERT_STATE untouched.
+--                           SP_EVALUATE_ALERTS passes
+--                           P_SEND_NOTIFICATIONS, so a run that
+--                           sends nothing cannot mark an alert as
+--                           notified. The fixture tests pass
+--                           FALSE, TRUE to exercise cooldown and
+--                           deduplication without email.
+--
+-- Notification Rules:
+--   A triggered rule notifies when its cooldown has elapsed AND
+--   either it was not active at the previous evaluation or the
+--   set of affected items (fingerprint) changed since the last
+--   notification. Otherwise it is logged as COOLDOWN/DUPLICATE.
+--   Resource monitors are keyed by name and trigger band, so
+--   escalating from 75% to 90% or 100% counts as a change. The
+--   monthly cost spike is keyed by month and evaluation day, so
+--   an ongoing spike notifies once a day.
 -- ============================================================
 
--- ------------------------------------------------------------
--- ALERT_HIGH_WAREHOUSE_QUEUE
--- Purpose: Detect warehouses with AVG_QUERIES_QUEUED > 5
--- Schedule: Every 30 minutes
--- Severity: WARNING
--- Action: Consider scaling warehouse
--- ------------------------------------------------------------
-CREATE OR REPLACE ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_HIGH_WAREHOUSE_QUEUE
-    WAREHOUSE = MEDICORE_ADMIN_WH
-    SCHEDULE = 'USING CRON 0,30 * * * * UTC'
-    COMMENT = 'WARNING: Detects warehouses with average queued queries exceeding 5. Triggers every 30 minutes. Indicates potential need for warehouse scaling or workload redistribution. Query source: V_ACTIVE_WAREHOUSE_LOAD.'
-    IF (EXISTS (
-        SELECT 1
-        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_ACTIVE_WAREHOUSE_LOAD
-        WHERE AVG_QUERIES_QUEUED > 5
-    ))
-    THEN
-        CALL SYSTEM$SEND_EMAIL(
-            'platform-alerts@medicore-health.com',
-            'WARNING: MediCore High Warehouse Queue Alert',
-            (SELECT OBJECT_CONSTRUCT(
-                'severity', 'WARNING',
-                'alert_name', 'ALERT_HIGH_WAREHOUSE_QUEUE',
-                'event_timestamp', CURRENT_TIMESTAMP()::VARCHAR,
-                'description', 'One or more warehouses have high query queue load',
-                'warehouses_affected', (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
-                        'warehouse_name', WAREHOUSE_NAME,
-                        'avg_queries_queued', AVG_QUERIES_QUEUED,
-                        'avg_queries_running', AVG_QUERIES_RUNNING,
-                        'peak_queries_queued', PEAK_QUERIES_QUEUED
-                    ))
-                    FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_ACTIVE_WAREHOUSE_LOAD
-                    WHERE AVG_QUERIES_QUEUED > 5
+CREATE OR REPLACE PROCEDURE MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    P_EVALUATION_TIME       TIMESTAMP_LTZ,
+    P_SOURCE_SCHEMA         VARCHAR,
+    P_SEND_NOTIFICATIONS    BOOLEAN,
+    P_UPDATE_STATE          BOOLEAN
+)
+RETURNS TABLE (
+    ALERT_NAME          VARCHAR,
+    SEVERITY            VARCHAR,
+    IS_TRIGGERED        BOOLEAN,
+    METRIC_VALUE        NUMBER(18,4),
+    SHOULD_NOTIFY       BOOLEAN,
+    SUPPRESSION_REASON  VARCHAR,
+    PAYLOAD             VARIANT
+)
+LANGUAGE SQL
+COMMENT = 'Alert evaluator logic for a given schema. Internal: called by SP_EVALUATE_ALERTS and by the Phase 07 fixture tests. Not granted to any role.'
+EXECUTE AS CALLER
+AS
+$$
+DECLARE
+    v_evaluation_id     VARCHAR DEFAULT UUID_STRING();
+    v_rules_table       VARCHAR;
+    v_state_table       VARCHAR;
+    v_log_table         VARCHAR;
+    v_rm_view           VARCHAR;
+    v_lrq_view          VARCHAR;
+    v_failed_view       VARCHAR;
+    v_load_view         VARCHAR;
+    v_cost_view         VARCHAR;
+    v_current_month     DATE;
+    v_previous_month    DATE;
+    v_recipient         VARCHAR;
+    v_subject           VARCHAR;
+    v_body              VARCHAR;
+BEGIN
+    v_rules_table    := P_SOURCE_SCHEMA || '.ALERT_RULES';
+    v_state_table    := P_SOURCE_SCHEMA || '.ALERT_STATE';
+    v_log_table      := P_SOURCE_SCHEMA || '.ALERT_EVALUATION_LOG';
+    v_rm_view        := P_SOURCE_SCHEMA || '.V_RESOURCE_MONITOR_STATUS';
+    v_lrq_view       := P_SOURCE_SCHEMA || '.V_LONG_RUNNING_QUERIES';
+    v_failed_view    := P_SOURCE_SCHEMA || '.V_FAILED_QUERIES';
+    v_load_view      := P_SOURCE_SCHEMA || '.V_ACTIVE_WAREHOUSE_LOAD';
+    v_cost_view      := P_SOURCE_SCHEMA || '.V_COST_BY_WAREHOUSE_MONTH';
+    v_current_month  := DATE_TRUNC('MONTH', P_EVALUATION_TIME::DATE);
+    v_previous_month := DATEADD('MONTH', -1, v_current_month);
+
+    -- --------------------------------------------------------
+    -- Step 1: Evaluate all rules in one statement
+    -- --------------------------------------------------------
+    INSERT INTO IDENTIFIER(:v_log_table) (
+        EVALUATION_ID, EVALUATED_AT, ALERT_NAME, SEVERITY, IS_TRIGGERED, METRIC_VALUE,
+        FINGERPRINT, SHOULD_NOTIFY, SUPPRESSION_REASON, NOTIFICATION_EMAIL, EMAIL_SUBJECT, PAYLOAD
+    )
+    WITH rules AS (
+        SELECT *
+        FROM IDENTIFIER(:v_rules_table)
+        WHERE IS_ENABLED
+    ),
+    params AS (
+        SELECT
+            MAX(IFF(ALERT_NAME = 'ALERT_RESOURCE_MONITOR_CRITICAL', THRESHOLD_VALUE, NULL))   AS RM_THRESHOLD,
+            MAX(IFF(ALERT_NAME = 'ALERT_LONG_RUNNING_QUERY', THRESHOLD_VALUE, NULL))          AS LRQ_THRESHOLD,
+            MAX(IFF(ALERT_NAME = 'ALERT_LONG_RUNNING_QUERY', LOOKBACK_MINUTES, NULL))         AS LRQ_LOOKBACK,
+            MAX(IFF(ALERT_NAME = 'ALERT_FAILED_QUERY_SPIKE', THRESHOLD_VALUE, NULL))          AS FAILED_THRESHOLD,
+            MAX(IFF(ALERT_NAME = 'ALERT_FAILED_QUERY_SPIKE', LOOKBACK_MINUTES, NULL))         AS FAILED_LOOKBACK,
+            MAX(IFF(ALERT_NAME = 'ALERT_HIGH_WAREHOUSE_QUEUE', THRESHOLD_VALUE, NULL))        AS QUEUE_THRESHOLD,
+            MAX(IFF(ALERT_NAME = 'ALERT_MONTHLY_COST_SPIKE', THRESHOLD_VALUE, NULL))          AS COST_THRESHOLD
+        FROM rules
+    ),
+    -- TRIGGER_BAND is the highest Phase 05 monitor trigger crossed
+    -- (75 NOTIFY, 90 NOTIFY, 100 SUSPEND). It is part of the hit key,
+    -- so a monitor that escalates while the rule stays active changes
+    -- the fingerprint and notifies again.
+    resource_monitors AS (
+        SELECT
+            v.MONITOR_NAME,
+            v.PERCENTAGE_USED,
+            v.CREDIT_QUOTA,
+            v.REMAINING_CREDITS,
+            v.HEALTH_STATUS,
+            CASE
+                WHEN v.PERCENTAGE_USED >= 100 THEN 100
+                WHEN v.PERCENTAGE_USED >= 90  THEN 90
+                WHEN v.PERCENTAGE_USED >= 75  THEN 75
+                ELSE 0
+            END                                                             AS TRIGGER_BAND
+        FROM IDENTIFIER(:v_rm_view) v
+        CROSS JOIN params p
+        WHERE v.PERCENTAGE_USED >= p.RM_THRESHOLD
+    ),
+    resource_monitor_summary AS (
+        SELECT
+            COUNT(*)                                                        AS HIT_COUNT,
+            ARRAY_AGG(MONITOR_NAME || ':' || TRIGGER_BAND)
+                WITHIN GROUP (ORDER BY MONITOR_NAME)                        AS HIT_KEYS,
+            ARRAY_AGG(OBJECT_CONSTRUCT(
+                'monitor_name', MONITOR_NAME,
+                'percentage_used', PERCENTAGE_USED,
+                'trigger_band_percent', TRIGGER_BAND,
+                'credit_quota', CREDIT_QUOTA,
+                'remaining_credits', REMAINING_CREDITS,
+                'health_status', HEALTH_STATUS
+            )) WITHIN GROUP (ORDER BY PERCENTAGE_USED DESC)                AS DETAILS
+        FROM resource_monitors
+    ),
+    long_running AS (
+        SELECT
+            v.QUERY_ID,
+            v.USER_NAME,
+            v.WAREHOUSE_NAME,
+            v.EXECUTION_TIME_MINUTES,
+            ROW_NUMBER() OVER (ORDER BY v.EXECUTION_TIME_MINUTES DESC, v.QUERY_ID) AS RN
+        FROM IDENTIFIER(:v_lrq_view) v
+        CROSS JOIN params p
+        WHERE v.START_TIME >= DATEADD('MINUTE', -p.LRQ_LOOKBACK, :P_EVALUATION_TIME)
+          AND v.START_TIME <= :P_EVALUATION_TIME
+    ),
+    long_running_summary AS (
+        SELECT
+            COUNT(*)                                                        AS HIT_COUNT,
+            ARRAY_AGG(QUERY_ID) WITHIN GROUP (ORDER BY QUERY_ID)            AS HIT_KEYS,
+            ARRAY_AGG(IFF(RN <= 5, OBJECT_CONSTRUCT(
+                'query_id', QUERY_ID,
+                'user_name', USER_NAME,
+                'warehouse_name', WAREHOUSE_NAME,
+                'execution_time_minutes', EXECUTION_TIME_MINUTES
+            ), NULL)) WITHIN GROUP (ORDER BY RN)                            AS DETAILS
+        FROM long_running
+    ),
+    failed_by_error AS (
+        SELECT
+            v.ERROR_CODE,
+            COUNT(*)                                                        AS OCCURRENCE_COUNT,
+            ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC, v.ERROR_CODE)        AS RN
+        FROM IDENTIFIER(:v_failed_view) v
+        CROSS JOIN params p
+        WHERE v.START_TIME >= DATEADD('MINUTE', -p.FAILED_LOOKBACK, :P_EVALUATION_TIME)
+          AND v.START_TIME <= :P_EVALUATION_TIME
+        GROUP BY v.ERROR_CODE
+    ),
+    failed_summary AS (
+        SELECT
+            COALESCE(SUM(OCCURRENCE_COUNT), 0)                              AS HIT_COUNT,
+            ARRAY_AGG(ERROR_CODE) WITHIN GROUP (ORDER BY ERROR_CODE)        AS HIT_KEYS,
+            ARRAY_AGG(IFF(RN <= 5, OBJECT_CONSTRUCT(
+                'error_code', ERROR_CODE,
+                'occurrence_count', OCCURRENCE_COUNT
+            ), NULL)) WITHIN GROUP (ORDER BY RN)                            AS DETAILS
+        FROM failed_by_error
+    ),
+    warehouse_queue_summary AS (
+        SELECT
+            COUNT(*)                                                        AS HIT_COUNT,
+            ARRAY_AGG(v.WAREHOUSE_NAME) WITHIN GROUP (ORDER BY v.WAREHOUSE_NAME) AS HIT_KEYS,
+            ARRAY_AGG(OBJECT_CONSTRUCT(
+                'warehouse_name', v.WAREHOUSE_NAME,
+                'avg_queries_queued', v.AVG_QUERIES_QUEUED,
+                'avg_queries_running', v.AVG_QUERIES_RUNNING,
+                'peak_queries_queued', v.PEAK_QUERIES_QUEUED
+            )) WITHIN GROUP (ORDER BY v.AVG_QUERIES_QUEUED DESC)           AS DETAILS
+        FROM IDENTIFIER(:v_load_view) v
+        CROSS JOIN params p
+        WHERE v.AVG_QUERIES_QUEUED > p.QUEUE_THRESHOLD
+    ),
+    monthly_cost AS (
+        SELECT
+            v.WAREHOUSE_NAME,
+            v.USAGE_MONTH::DATE                                             AS USAGE_MONTH,
+            v.TOTAL_CREDITS,
+            v.ESTIMATED_COST_USD,
+            ROW_NUMBER() OVER (PARTITION BY v.USAGE_MONTH ORDER BY v.TOTAL_CREDITS DESC) AS RN
+        FROM IDENTIFIER(:v_cost_view) v
+        WHERE v.USAGE_MONTH::DATE IN (:v_current_month, :v_previous_month)
+    ),
+    cost_summary AS (
+        SELECT
+            COALESCE(SUM(IFF(USAGE_MONTH = :v_current_month, TOTAL_CREDITS, 0)), 0)  AS CURRENT_MONTH_CREDITS,
+            COALESCE(SUM(IFF(USAGE_MONTH = :v_previous_month, TOTAL_CREDITS, 0)), 0) AS PREVIOUS_MONTH_CREDITS,
+            ARRAY_AGG(IFF(USAGE_MONTH = :v_current_month AND RN <= 5, OBJECT_CONSTRUCT(
+                'warehouse_name', WAREHOUSE_NAME,
+                'total_credits', TOTAL_CREDITS,
+                'estimated_cost_usd', ESTIMATED_COST_USD
+            ), NULL)) WITHIN GROUP (ORDER BY RN)                            AS TOP_CONSUMERS
+        FROM monthly_cost
+    ),
+    evaluations AS (
+        SELECT
+            'ALERT_RESOURCE_MONITOR_CRITICAL'                               AS ALERT_NAME,
+            s.HIT_COUNT > 0                                                 AS IS_TRIGGERED,
+            s.HIT_COUNT                                                     AS METRIC_VALUE,
+            s.HIT_KEYS                                                      AS HIT_KEYS,
+            OBJECT_CONSTRUCT('monitors_affected', s.DETAILS)                AS DETAILS
+        FROM resource_monitor_summary s
+
+        UNION ALL
+
+        SELECT
+            'ALERT_LONG_RUNNING_QUERY',
+            s.HIT_COUNT > p.LRQ_THRESHOLD,
+            s.HIT_COUNT,
+            s.HIT_KEYS,
+            OBJECT_CONSTRUCT('query_count', s.HIT_COUNT, 'sample_queries', s.DETAILS)
+        FROM long_running_summary s
+        CROSS JOIN params p
+
+        UNION ALL
+
+        SELECT
+            'ALERT_FAILED_QUERY_SPIKE',
+            s.HIT_COUNT > p.FAILED_THRESHOLD,
+            s.HIT_COUNT,
+            s.HIT_KEYS,
+            OBJECT_CONSTRUCT('failed_query_count', s.HIT_COUNT, 'error_summary', s.DETAILS)
+        FROM failed_summary s
+        CROSS JOIN params p
+
+        UNION ALL
+
+        SELECT
+            'ALERT_HIGH_WAREHOUSE_QUEUE',
+            s.HIT_COUNT > 0,
+            s.HIT_COUNT,
+            s.HIT_KEYS,
+            OBJECT_CONSTRUCT('warehouses_affected', s.DETAILS)
+        FROM warehouse_queue_summary s
+
+        UNION ALL
+
+        SELECT
+            'ALERT_MONTHLY_COST_SPIKE',
+            s.PREVIOUS_MONTH_CREDITS > 0
+                AND s.CURRENT_MONTH_CREDITS > s.PREVIOUS_MONTH_CREDITS * p.COST_THRESHOLD,
+            ROUND(s.CURRENT_MONTH_CREDITS / NULLIF(s.PREVIOUS_MONTH_CREDITS, 0), 4),
+            -- Keyed by day as well as month: an ongoing spike
+            -- re-notifies once a day (COOLDOWN_MINUTES = 1440).
+            ARRAY_CONSTRUCT(:v_current_month::VARCHAR, :P_EVALUATION_TIME::DATE::VARCHAR),
+            OBJECT_CONSTRUCT(
+                'cost_comparison', OBJECT_CONSTRUCT(
+                    'current_month', :v_current_month::VARCHAR,
+                    'current_month_credits', s.CURRENT_MONTH_CREDITS,
+                    'previous_month_credits', s.PREVIOUS_MONTH_CREDITS,
+                    'percentage_increase', ROUND((s.CURRENT_MONTH_CREDITS / NULLIF(s.PREVIOUS_MONTH_CREDITS, 0) - 1) * 100, 2)
                 ),
-                'recommended_action', 'Consider increasing warehouse size or enabling multi-cluster scaling.'
-            )::VARCHAR)
+                'top_consumers', s.TOP_CONSUMERS
+            )
+        FROM cost_summary s
+        CROSS JOIN params p
+    ),
+    scored AS (
+        SELECT
+            e.ALERT_NAME,
+            e.IS_TRIGGERED,
+            e.METRIC_VALUE,
+            e.DETAILS,
+            SHA2(ARRAY_TO_STRING(e.HIT_KEYS, ','), 256)                     AS FINGERPRINT,
+            r.SEVERITY,
+            r.NOTIFICATION_EMAIL,
+            r.EMAIL_SUBJECT,
+            r.DESCRIPTION,
+            r.RECOMMENDED_ACTION,
+            COALESCE(st.IS_ACTIVE, FALSE)                                   AS WAS_ACTIVE,
+            st.LAST_FINGERPRINT,
+            st.LAST_NOTIFIED_AT IS NULL
+                OR :P_EVALUATION_TIME >= DATEADD('MINUTE', r.COOLDOWN_MINUTES, st.LAST_NOTIFIED_AT)
+                                                                            AS COOLDOWN_ELAPSED
+        FROM evaluations e
+        JOIN rules r
+            ON r.ALERT_NAME = e.ALERT_NAME
+        LEFT JOIN IDENTIFIER(:v_state_table) st
+            ON st.ALERT_NAME = e.ALERT_NAME
+    )
+    SELECT
+        :v_evaluation_id,
+        :P_EVALUATION_TIME,
+        ALERT_NAME,
+        SEVERITY,
+        IS_TRIGGERED,
+        METRIC_VALUE,
+        FINGERPRINT,
+        IS_TRIGGERED
+            AND COOLDOWN_ELAPSED
+            AND (NOT WAS_ACTIVE OR FINGERPRINT IS DISTINCT FROM LAST_FINGERPRINT)
+                                                                            AS SHOULD_NOTIFY,
+        CASE
+            WHEN NOT IS_TRIGGERED THEN NULL
+            WHEN NOT COOLDOWN_ELAPSED THEN 'COOLDOWN'
+            WHEN WAS_ACTIVE AND FINGERPRINT IS NOT DISTINCT FROM LAST_FINGERPRINT THEN 'DUPLICATE'
+        END                                                                 AS SUPPRESSION_REASON,
+        NOTIFICATION_EMAIL,
+        EMAIL_SUBJECT,
+        OBJECT_CONSTRUCT(
+            'severity', SEVERITY,
+            'alert_name', ALERT_NAME,
+            'event_timestamp', :P_EVALUATION_TIME::VARCHAR,
+            'description', DESCRIPTION,
+            'details', DETAILS,
+            'recommended_action', RECOMMENDED_ACTION
+        )                                                                   AS PAYLOAD
+    FROM scored;
+
+    -- --------------------------------------------------------
+    -- Step 2: Persist state for dedup and cooldown
+    -- (skipped on dry runs, so state only records notifications
+    -- that were sent)
+    -- --------------------------------------------------------
+    IF (P_UPDATE_STATE) THEN
+        MERGE INTO IDENTIFIER(:v_state_table) AS tgt
+        USING (
+            SELECT ALERT_NAME, EVALUATED_AT, IS_TRIGGERED, SHOULD_NOTIFY, FINGERPRINT
+            FROM IDENTIFIER(:v_log_table)
+            WHERE EVALUATION_ID = :v_evaluation_id
+        ) AS src
+        ON tgt.ALERT_NAME = src.ALERT_NAME
+        WHEN MATCHED THEN UPDATE SET
+            tgt.IS_ACTIVE           = src.IS_TRIGGERED,
+            tgt.LAST_EVALUATED_AT   = src.EVALUATED_AT,
+            tgt.LAST_TRIGGERED_AT   = IFF(src.IS_TRIGGERED, src.EVALUATED_AT, tgt.LAST_TRIGGERED_AT),
+            tgt.LAST_NOTIFIED_AT    = IFF(src.SHOULD_NOTIFY, src.EVALUATED_AT, tgt.LAST_NOTIFIED_AT),
+            tgt.LAST_FINGERPRINT    = IFF(src.SHOULD_NOTIFY, src.FINGERPRINT, tgt.LAST_FINGERPRINT),
+            tgt.NOTIFICATION_COUNT  = tgt.NOTIFICATION_COUNT + IFF(src.SHOULD_NOTIFY, 1, 0),
+            tgt.UPDATED_AT          = CURRENT_TIMESTAMP()
+        WHEN NOT MATCHED THEN INSERT (
+            ALERT_NAME, IS_ACTIVE, LAST_EVALUATED_AT, LAST_TRIGGERED_AT, LAST_NOTIFIED_AT,
+            LAST_FINGERPRINT, NOTIFICATION_COUNT
+        ) VALUES (
+            src.ALERT_NAME, src.IS_TRIGGERED, src.EVALUATED_AT,
+            IFF(src.IS_TRIGGERED, src.EVALUATED_AT, NULL),
+            IFF(src.SHOULD_NOTIFY, src.EVALUATED_AT, NULL),
+            IFF(src.SHOULD_NOTIFY, src.FINGERPRINT, NULL),
+            IFF(src.SHOULD_NOTIFY, 1, 0)
+        );
+    END IF;
+
+    -- --------------------------------------------------------
+    -- Step 3: Dispatch notifications
+    -- --------------------------------------------------------
+    IF (P_SEND_NOTIFICATIONS) THEN
+        LET rs_notify RESULTSET := (
+            SELECT NOTIFICATION_EMAIL, EMAIL_SUBJECT, PAYLOAD::VARCHAR AS BODY
+            FROM IDENTIFIER(:v_log_table)
+            WHERE EVALUATION_ID = :v_evaluation_id
+              AND SHOULD_NOTIFY
         );
+        LET c_notify CURSOR FOR rs_notify;
+        FOR rec IN c_notify DO
+            v_recipient := rec.NOTIFICATION_EMAIL;
+            v_subject   := rec.EMAIL_SUBJECT;
+            v_body      := rec.BODY;
+            CALL SYSTEM$SEND_EMAIL(:v_recipient, :v_subject, :v_body);
+        END FOR;
+    END IF;
+
+    LET rs_result RESULTSET := (
+        SELECT ALERT_NAME, SEVERITY, IS_TRIGGERED, METRIC_VALUE, SHOULD_NOTIFY, SUPPRESSION_REASON, PAYLOAD
+        FROM IDENTIFIER(:v_log_table)
+        WHERE EVALUATION_ID = :v_evaluation_id
+        ORDER BY ALERT_NAME
+    );
+    RETURN TABLE(rs_result);
+END;
+$$;
+
+-- ------------------------------------------------------------
+-- SP_EVALUATE_ALERTS
+-- Purpose: Production entry point. Evaluates the rules in
+--          MEDICORE_GOVERNANCE_DB.AUDIT at the current time.
+--          Neither the schema nor the evaluation time is a
+--          parameter, so callers cannot redirect the owner's
+--          rights to tables they control or move
+--          LAST_NOTIFIED_AT into the future. With
+--          P_SEND_NOTIFICATIONS => FALSE it is a dry run: the
+--          results are logged, ALERT_STATE is not updated.
+-- ------------------------------------------------------------
+CREATE OR REPLACE PROCEDURE MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS(
+    P_SEND_NOTIFICATIONS    BOOLEAN         DEFAULT TRUE
+)
+RETURNS TABLE (
+    ALERT_NAME          VARCHAR,
+    SEVERITY            VARCHAR,
+    IS_TRIGGERED        BOOLEAN,
+    METRIC_VALUE        NUMBER(18,4),
+    SHOULD_NOTIFY       BOOLEAN,
+    SUPPRESSION_REASON  VARCHAR,
+    PAYLOAD             VARIANT
+)
+LANGUAGE SQL
+COMMENT = 'Consolidated alert evaluator. Computes all ALERT_RULES in one pass over Phase 06 monitoring views, persists ALERT_STATE for dedup/cooldown, and dispatches email notifications.'
+EXECUTE AS OWNER
+AS
+$$
+BEGIN
+    CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+        CURRENT_TIMESTAMP(), 'MEDICORE_GOVERNANCE_DB.AUDIT', :P_SEND_NOTIFICATIONS, :P_SEND_NOTIFICATIONS);
+    LET rs_result RESULTSET := (SELECT * FROM TABLE(RESULT_SCAN(LAST_QUERY_ID())));
+    RETURN TABLE(rs_result);
+END;
+$$;
 
 
 -- ============================================================
--- SECTION 4: COST GOVERNANCE ALERTS
+-- SECTION 5: EVALUATOR SCHEDULE
 -- ============================================================
--- Alerts for cost anomaly detection and budget management.
+-- One task replaces five alert schedules. Rules that were
+-- previously evaluated less often (30 minutes, daily) are
+-- rate-limited by COOLDOWN_MINUTES instead of by schedule.
 -- ============================================================
 
 -- ------------------------------------------------------------
--- ALERT_MONTHLY_COST_SPIKE
--- Purpose: Detect current month > 120% of previous month
--- Schedule: Daily at 08:00 UTC
--- Severity: CRITICAL
--- Action: Review cost drivers immediately
+-- TASK_ALERT_EVALUATOR
+-- Purpose: Run SP_EVALUATE_ALERTS for all enabled rules
+-- Schedule: Every 15 minutes
 -- ------------------------------------------------------------
-CREATE OR REPLACE ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_MONTHLY_COST_SPIKE
+CREATE OR REPLACE TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR
     WAREHOUSE = MEDICORE_ADMIN_WH
-    SCHEDULE = 'USING CRON 0 8 * * * UTC'
-    COMMENT = 'CRITICAL: Detects when current month credit consumption exceeds 120% of the previous month. Triggers daily at 08:00 UTC. Indicates potential cost anomaly or unexpected workload increase. Query source: V_COST_BY_WAREHOUSE_MONTH.'
-    IF (EXISTS (
-        SELECT 1
-        FROM (
-            SELECT
-                SUM(CASE WHEN USAGE_MONTH = DATE_TRUNC('MONTH', CURRENT_DATE()) THEN TOTAL_CREDITS ELSE 0 END) AS current_month_credits,
-                SUM(CASE WHEN USAGE_MONTH = DATE_TRUNC('MONTH', DATEADD('MONTH', -1, CURRENT_DATE())) THEN TOTAL_CREDITS ELSE 0 END) AS previous_month_credits
-            FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_COST_BY_WAREHOUSE_MONTH
-        )
-        WHERE current_month_credits > previous_month_credits * 1.2
-          AND previous_month_credits > 0
-    ))
-    THEN
-        CALL SYSTEM$SEND_EMAIL(
-            'platform-alerts@medicore-health.com',
-            'CRITICAL: MediCore Monthly Cost Spike Alert',
-            (SELECT OBJECT_CONSTRUCT(
-                'severity', 'CRITICAL',
-                'alert_name', 'ALERT_MONTHLY_COST_SPIKE',
-                'event_timestamp', CURRENT_TIMESTAMP()::VARCHAR,
-                'description', 'Current month credit consumption exceeds 120% of previous month',
-                'cost_comparison', (
-                    SELECT OBJECT_CONSTRUCT(
-                        'current_month', DATE_TRUNC('MONTH', CURRENT_DATE())::VARCHAR,
-                        'current_month_credits', current_month_credits,
-                        'previous_month_credits', previous_month_credits,
-                        'percentage_increase', ROUND((current_month_credits / NULLIF(previous_month_credits, 0) - 1) * 100, 2)
-                    )
-                    FROM (
-                        SELECT
-                            SUM(CASE WHEN USAGE_MONTH = DATE_TRUNC('MONTH', CURRENT_DATE()) THEN TOTAL_CREDITS ELSE 0 END) AS current_month_credits,
-                            SUM(CASE WHEN USAGE_MONTH = DATE_TRUNC('MONTH', DATEADD('MONTH', -1, CURRENT_DATE())) THEN TOTAL_CREDITS ELSE 0 END) AS previous_month_credits
-                        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_COST_BY_WAREHOUSE_MONTH
-                    )
-                ),
-                'top_consumers', (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
-                        'warehouse_name', WAREHOUSE_NAME,
-                        'total_credits', TOTAL_CREDITS,
-                        'estimated_cost_usd', ESTIMATED_COST_USD
-                    ))
-                    FROM (
-                        SELECT WAREHOUSE_NAME, TOTAL_CREDITS, ESTIMATED_COST_USD
-                        FROM MEDICORE_GOVERNANCE_DB.AUDIT.V_COST_BY_WAREHOUSE_MONTH
-                        WHERE USAGE_MONTH = DATE_TRUNC('MONTH', CURRENT_DATE())
-                        ORDER BY TOTAL_CREDITS DESC
-                        LIMIT 5
-                    )
-                ),
-                'recommended_action', 'Review warehouse usage patterns and identify cost drivers immediately.'
-            )::VARCHAR)
-        );
+    SCHEDULE = 'USING CRON 0,15,30,45 * * * * UTC'
+    COMMENT = 'Consolidated alert evaluator. Runs every 15 minutes and evaluates all enabled ALERT_RULES in a single pass over Phase 06 monitoring views. Replaces the five standalone ALERT objects.'
+AS
+    CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS();
 
 
 -- ============================================================
--- SECTION 5: ENABLE ALERTS
+-- SECTION 6: ENABLE EVALUATOR
 -- ============================================================
--- Alerts are created in SUSPENDED state by default.
+-- Tasks are created in SUSPENDED state by default.
 -- Uncomment and execute to enable production alerting.
 -- ============================================================
 
--- NOTE: Alerts are initially SUSPENDED. Uncomment below to enable.
+-- NOTE: The evaluator task is initially SUSPENDED. Uncomment below to enable.
 -- Execute only after validating email notification configuration.
 
--- ALTER ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL RESUME;
--- ALTER ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_LONG_RUNNING_QUERY RESUME;
--- ALTER ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_FAILED_QUERY_SPIKE RESUME;
--- ALTER ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_HIGH_WAREHOUSE_QUEUE RESUME;
--- ALTER ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_MONTHLY_COST_SPIKE RESUME;
+-- ALTER TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR RESUME;
 
 
 -- ============================================================
--- SECTION 6: SECURITY GRANTS
+-- SECTION 7: SECURITY GRANTS
 -- ============================================================
--- Grant OPERATE privilege to allow PLATFORM_ADMIN to manage alerts.
+-- PLATFORM_ADMIN can operate the task, run the evaluator on
+-- demand, tune rules, and read state and history.
+-- SP_EVALUATE_ALERTS_IN_SCHEMA is intentionally not granted.
 -- ============================================================
 
-GRANT OPERATE ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL TO ROLE MEDICORE_PLATFORM_ADMIN;
+GRANT OPERATE ON TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR TO ROLE MEDICORE_PLATFORM_ADMIN;
 
-GRANT OPERATE ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_LONG_RUNNING_QUERY TO ROLE MEDICORE_PLATFORM_ADMIN;
+GRANT USAGE ON PROCEDURE MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS(BOOLEAN) TO ROLE MEDICORE_PLATFORM_ADMIN;
 
-GRANT OPERATE ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_FAILED_QUERY_SPIKE TO ROLE MEDICORE_PLATFORM_ADMIN;
+GRANT SELECT, UPDATE ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES TO ROLE MEDICORE_PLATFORM_ADMIN;
 
-GRANT OPERATE ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_HIGH_WAREHOUSE_QUEUE TO ROLE MEDICORE_PLATFORM_ADMIN;
+GRANT SELECT ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_STATE TO ROLE MEDICORE_PLATFORM_ADMIN;
 
-GRANT OPERATE ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_MONTHLY_COST_SPIKE TO ROLE MEDICORE_PLATFORM_ADMIN;
+GRANT SELECT ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_EVALUATION_LOG TO ROLE MEDICORE_PLATFORM_ADMIN;
 
 
 -- ============================================================
--- SECTION 7: VERIFICATION QUERIES
+-- SECTION 8: VERIFICATION QUERIES
 -- ============================================================
--- Confirm all alerts were created successfully.
+-- Confirm the evaluator objects were created successfully.
 -- ============================================================
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
-    NAME AS ALERT_NAME,
-    STATE AS CURRENT_STATE,
-    SCHEDULE AS SCHEDULE_CRON,
-    CONDITION AS ALERT_CONDITION,
-    OWNER AS OWNER_ROLE
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-ORDER BY NAME;
+    "name" AS TASK_NAME,
+    "state" AS CURRENT_STATE,
+    "schedule" AS SCHEDULE_CRON,
+    "warehouse" AS WAREHOUSE_NAME,
+    "owner" AS OWNER_ROLE
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
+
+SELECT
+    ALERT_NAME,
+    SEVERITY,
+    SOURCE_VIEW,
+    THRESHOLD_VALUE,
+    LOOKBACK_MINUTES,
+    COOLDOWN_MINUTES,
+    IS_ENABLED
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES
+ORDER BY ALERT_NAME;
 
 
 -- ============================================================
 -- PHASE 07 SUMMARY
 -- ============================================================
 --
--- ALERTS CREATED: 5
+-- ALERT RULES: 5 (rows in ALERT_RULES)
+--
+--   1. ALERT_RESOURCE_MONITOR_CRITICAL
+--      - Condition: PERCENTAGE_USED >= 90
+--      - Cooldown: 30 minutes
+--      - Severity: CRITICAL
 --
---   Section 1 - Resource Monitor Alerts:
---     1. ALERT_RESOURCE_MONITOR_CRITICAL
---        - Condition: PERCENTAGE_USED >= 90
---        - Schedule: Every 30 minutes
---        - Severity: CRITICAL
+--   2. ALERT_LONG_RUNNING_QUERY
+--      - Condition: Queries > 5 min in last 15 min
+--      - Cooldown: 15 minutes
+--      - Severity: WARNING
 --
---   Section 2 - Query Alerts:
---     2. ALERT_LONG_RUNNING_QUERY
---        - Condition: Queries > 5 min in last 15 min
---        - Schedule: Every 15 minutes
---        - Severity: WARNING
+--   3. ALERT_FAILED_QUERY_SPIKE
+--      - Condition: > 10 failed queries in last 15 min
+--      - Cooldown: 15 minutes
+--      - Severity: WARNING
 --
---     3. ALERT_FAILED_QUERY_SPIKE
---        - Condition: > 10 failed queries in last 15 min
---        - Schedule: Every 15 minutes
---        - Severity: WARNING
+--   4. ALERT_HIGH_WAREHOUSE_QUEUE
+--      - Condition: AVG_QUERIES_QUEUED > 5
+--      - Cooldown: 30 minutes
+--      - Severity: WARNING
 --
---   Section 3 - Warehouse Capacity Alerts:
---     4. ALERT_HIGH_WAREHOUSE_QUEUE
---        - Condition: AVG_QUERIES_QUEUED > 5
---        - Schedule: Every 30 minutes
---        - Severity: WARNING
+--   5. ALERT_MONTHLY_COST_SPIKE
+--      - Condition: Current month > 120% previous month
+--      - Cooldown: 1440 minutes (daily)
+--      - Severity: CRITICAL
 --
---   Section 4 - Cost Governance Alerts:
---     5. ALERT_MONTHLY_COST_SPIKE
---        - Condition: Current month > 120% previous month
---        - Schedule: Daily at 08:00 UTC
---        - Severity: CRITICAL
+-- OBJECTS CREATED:
+--   - Tables: ALERT_RULES, ALERT_STATE, ALERT_EVALUATION_LOG
+--   - Procedures: SP_EVALUATE_ALERTS (granted),
+--                 SP_EVALUATE_ALERTS_IN_SCHEMA (internal)
+--   - Task: TASK_ALERT_EVALUATOR (every 15 min, SUSPENDED)
 --
--- INITIAL STATE: All alerts created SUSPENDED
+-- LEGACY OBJECTS DROPPED: 5 standalone ALERT objects,
+--   SP_EVALUATE_ALERTS(TIMESTAMP_LTZ, VARCHAR, BOOLEAN),
+--   SP_EVALUATE_ALERTS(TIMESTAMP_LTZ, BOOLEAN),
+--   SP_EVALUATE_ALERTS_IN_SCHEMA(TIMESTAMP_LTZ, VARCHAR, BOOLEAN)
 --
 -- GRANTS ISSUED: 5
---   - OPERATE on all alerts to MEDICORE_PLATFORM_ADMIN
+--   - OPERATE on TASK_ALERT_EVALUATOR to MEDICORE_PLATFORM_ADMIN
+--   - USAGE on SP_EVALUATE_ALERTS to MEDICORE_PLATFORM_ADMIN
+--   - SELECT, UPDATE on ALERT_RULES to MEDICORE_PLATFORM_ADMIN
+--   - SELECT on ALERT_STATE, ALERT_EVALUATION_LOG to MEDICORE_PLATFORM_ADMIN
 --
--- NOTIFICATION TARGET:
+-- NOTIFICATION TARGET (default):
 --   platform-alerts@medicore-health.com
 --
--- WAREHOUSE USED: MEDICORE_ADMIN_WH (all alerts)
+-- WAREHOUSE USED: MEDICORE_ADMIN_WH (single task)
 --
 -- ============================================================
 -- END OF PHASE 07: ALERTS
@@ -7,14 +7,28 @@ Object:         MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
 Purpose:        Clinical lab results fact table for business consumption.
                 Contains PHI - masking policies applied via governance layer.
                 Supports abnormal lab KPIs, trend analysis, and AI features.
+                Carries the encounter's department so lab monitoring can
+                filter by department without joining back to ENCOUNTERS.
 Grain:          1 row = 1 lab result
 Source:         MEDICORE_TRANSFORM_DB.DEV_CLINICAL.LAB_RESULTS
                 MEDICORE_TRANSFORM_DB.DEV_CLINICAL.ENCOUNTERS
                 MEDICORE_TRANSFORM_DB.DEV_CLINICAL.PATIENTS
-Dependencies:   Executive clinical dashboards, AI feature engineering
+                MEDICORE_TRANSFORM_DB.DEV_REFERENCE.DIM_DEPARTMENTS
+Dependencies:   LAB_RESULTS_MONTHLY, executive clinical dashboards,
+                AI feature engineering
 Author:         Data Engineering Team
 Version:        1.0
 ================================================================================
+
+REFRESH MODE
+--------------------------------------------------------------------------------
+REFRESH_MODE = INCREMENTAL is set explicitly because LAB_RESULTS_MONTHLY
+refreshes incrementally on top of this table, and Snowflake rejects an
+incremental dynamic table downstream of a FULL one. With AUTO the mode is
+chosen once, at creation; if a change to this query (e.g. the
+DIM_DEPARTMENTS join) made it resolve to FULL, the failure would surface
+when the rollup is created. Pinned here, creating this table fails instead.
+================================================================================
 */
 
 USE ROLE MEDICORE_DATA_ENGINEER;
@@ -25,7 +39,7 @@ USE SCHEMA DEV_CLINICAL;
 CREATE OR REPLACE DYNAMIC TABLE MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
     TARGET_LAG = '5 minutes'
     WAREHOUSE = MEDICORE_ETL_WH
-    REFRESH_MODE = AUTO
+    REFRESH_MODE = INCREMENTAL
 AS
 SELECT
     lr.LAB_RESULT_ID,
@@ -43,6 +57,8 @@ SELECT
     e.DISCHARGE_DATE,
     e.ENCOUNTER_TYPE,
     e.PRIMARY_ICD10_CODE,
+    e.DEPARTMENT_ID,
+    d.DEPARTMENT_NAME,
     EXTRACT(YEAR FROM lr.RESULT_DATE)               AS RESULT_YEAR,
     DATE_TRUNC('MONTH', lr.RESULT_DATE)             AS RESULT_MONTH,
     lr.IS_ABNORMAL                                  AS IS_ABNORMAL_FLAG,
@@ -54,4 +70,6 @@ FROM MEDICORE_TRANSFORM_DB.DEV_CLINICAL.LAB_RESULTS lr
 LEFT JOIN MEDICORE_TRANSFORM_DB.DEV_CLINICAL.ENCOUNTERS e
     ON lr.ENCOUNTER_ID = e.ENCOUNTER_ID
 LEFT JOIN MEDICORE_TRANSFORM_DB.DEV_CLINICAL.PATIENTS p
-    ON e.PATIENT_ID = p.PATIENT_ID;
+    ON e.PATIENT_ID = p.PATIENT_ID
+LEFT JOIN MEDICORE_TRANSFORM_DB.DEV_REFERENCE.DIM_DEPARTMENTS d
+    ON e.DEPARTMENT_ID = d.DEPARTMENT_ID;
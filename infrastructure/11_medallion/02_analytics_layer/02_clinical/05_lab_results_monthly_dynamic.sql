@@ -0,0 +1,54 @@
+/*
+================================================================================
+Project:        MediCore Health Systems - Snowflake Data Platform
+Layer:          Gold (ANALYTICS_DB)
+Script:         05_lab_results_monthly_dynamic.sql
+Object:         MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+Purpose:        Monthly lab result counts by department, test and abnormal
+                flag. Lab monitoring (abnormal lab trend panel,
+                KPI_CLINICAL_OUTCOMES) reads this rollup instead of scanning
+                LAB_RESULTS, so its cost grows with months x departments x
+                tests rather than with lab volume.
+                No PHI - safe for all clinical and executive roles.
+Grain:          1 row = 1 result month x department x test x abnormal flag
+Source:         MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
+Dependencies:   KPI_CLINICAL_OUTCOMES, clinical operations dashboard
+Author:         Data Engineering Team
+Version:        1.0
+================================================================================
+
+REFRESH MODE
+--------------------------------------------------------------------------------
+REFRESH_MODE = INCREMENTAL is set explicitly: each refresh only re-counts the
+groups touched by changed lab rows. If the query ever gains a construct that
+cannot refresh incrementally, creation fails instead of silently switching
+the table to FULL refresh. Rates are not stored; consumers compute them as
+SUM(abnormal count) / SUM(LAB_TEST_COUNT) at whatever grain they need.
+================================================================================
+*/
+
+USE ROLE MEDICORE_DATA_ENGINEER;
+USE WAREHOUSE MEDICORE_ETL_WH;
+USE DATABASE MEDICORE_ANALYTICS_DB;
+USE SCHEMA DEV_CLINICAL;
+
+CREATE OR REPLACE DYNAMIC TABLE MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+    TARGET_LAG = '5 minutes'
+    WAREHOUSE = MEDICORE_ETL_WH
+    REFRESH_MODE = INCREMENTAL
+AS
+SELECT
+    RESULT_MONTH                                    AS MONTH_KEY,
+    DEPARTMENT_ID,
+    DEPARTMENT_NAME,
+    TEST_NAME,
+    IS_ABNORMAL,
+    COUNT(*)                                        AS LAB_TEST_COUNT
+FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
+WHERE RESULT_MONTH IS NOT NULL
+GROUP BY
+    RESULT_MONTH,
+    DEPARTMENT_ID,
+    DEPARTMENT_NAME,
+    TEST_NAME,
+    IS_ABNORMAL;
@@ -7,9 +7,12 @@ Object:         MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES
 Purpose:        Aggregated clinical outcome metrics for executive dashboard.
                 Contains NO PHI - optimized for Streamlit visualization.
                 Supports LOS trends, readmission tracking, and lab monitoring.
+                TOTAL_LOS_DAYS is the plain SUM (NULL when no stay in the
+                month has a length of stay) so the semantic layer can
+                re-aggregate LOS across months exactly.
 Grain:          1 row = 1 month
 Source:         MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS
-                MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
+                MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
 Consumers:      Streamlit Executive Dashboard, MEDICORE_EXECUTIVE role,
                 MEDICORE_ANALYST_RESTRICTED role
 Author:         Data Engineering Team
@@ -64,6 +67,7 @@ monthly_inpatient_aggregation AS (
     SELECT
         DISCHARGE_MONTH                                         AS MONTH_KEY,
         COUNT(ENCOUNTER_ID)                                     AS TOTAL_INPATIENT_ENCOUNTERS,
+        SUM(LENGTH_OF_STAY_DAYS)                                AS TOTAL_LOS_DAYS,
         COALESCE(AVG(LENGTH_OF_STAY_DAYS), 0)                   AS AVERAGE_LENGTH_OF_STAY,
         COALESCE(MEDIAN(LENGTH_OF_STAY_DAYS), 0)                AS MEDIAN_LENGTH_OF_STAY,
         SUM(IS_READMISSION_CASE)                                AS TOTAL_READMISSIONS,
@@ -79,23 +83,23 @@ monthly_inpatient_aggregation AS (
 
 lab_aggregation AS (
     SELECT
-        RESULT_MONTH                                            AS MONTH_KEY,
-        COUNT(LAB_RESULT_ID)                                    AS TOTAL_LAB_TESTS,
-        SUM(CASE WHEN IS_ABNORMAL_FLAG = TRUE THEN 1 ELSE 0 END) AS TOTAL_ABNORMAL_LABS,
+        MONTH_KEY,
+        SUM(LAB_TEST_COUNT)                                     AS TOTAL_LAB_TESTS,
+        SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END) AS TOTAL_ABNORMAL_LABS,
         CASE 
-            WHEN COUNT(LAB_RESULT_ID) > 0 
-            THEN ROUND(SUM(CASE WHEN IS_ABNORMAL_FLAG = TRUE THEN 1 ELSE 0 END)::FLOAT 
-                       / COUNT(LAB_RESULT_ID) * 100, 2)
+            WHEN SUM(LAB_TEST_COUNT) > 0 
+            THEN ROUND(SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END)::FLOAT 
+                       / SUM(LAB_TEST_COUNT) * 100, 2)
             ELSE 0 
         END                                                     AS ABNORMAL_LAB_RATE_PERCENT
-    FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
-    WHERE RESULT_MONTH IS NOT NULL
-    GROUP BY RESULT_MONTH
+    FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+    GROUP BY MONTH_KEY
 )
 
 SELECT
     COALESCE(mia.MONTH_KEY, la.MONTH_KEY)                       AS MONTH_KEY,
     COALESCE(mia.TOTAL_INPATIENT_ENCOUNTERS, 0)                 AS TOTAL_INPATIENT_ENCOUNTERS,
+    mia.TOTAL_LOS_DAYS                                          AS TOTAL_LOS_DAYS,
     COALESCE(mia.AVERAGE_LENGTH_OF_STAY, 0)                     AS AVERAGE_LENGTH_OF_STAY,
     COALESCE(mia.MEDIAN_LENGTH_OF_STAY, 0)                      AS MEDIAN_LENGTH_OF_STAY,
     COALESCE(mia.TOTAL_READMISSIONS, 0)                         AS TOTAL_READMISSIONS,
@@ -157,6 +161,7 @@ AS
         SELECT
             DISCHARGE_MONTH AS MONTH_KEY,
             COUNT(ENCOUNTER_ID) AS TOTAL_INPATIENT_ENCOUNTERS,
+            SUM(LENGTH_OF_STAY_DAYS) AS TOTAL_LOS_DAYS,
             COALESCE(AVG(LENGTH_OF_STAY_DAYS), 0) AS AVERAGE_LENGTH_OF_STAY,
             COALESCE(MEDIAN(LENGTH_OF_STAY_DAYS), 0) AS MEDIAN_LENGTH_OF_STAY,
             SUM(IS_READMISSION_CASE) AS TOTAL_READMISSIONS,
@@ -171,22 +176,22 @@ AS
     ),
     lab_aggregation AS (
         SELECT
-            RESULT_MONTH AS MONTH_KEY,
-            COUNT(LAB_RESULT_ID) AS TOTAL_LAB_TESTS,
-            SUM(CASE WHEN IS_ABNORMAL_FLAG = TRUE THEN 1 ELSE 0 END) AS TOTAL_ABNORMAL_LABS,
+            MONTH_KEY,
+            SUM(LAB_TEST_COUNT) AS TOTAL_LAB_TESTS,
+            SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END) AS TOTAL_ABNORMAL_LABS,
             CASE 
-                WHEN COUNT(LAB_RESULT_ID) > 0 
-                THEN ROUND(SUM(CASE WHEN IS_ABNORMAL_FLAG = TRUE THEN 1 ELSE 0 END)::FLOAT 
-                           / COUNT(LAB_RESULT_ID) * 100, 2)
+                WHEN SUM(LAB_TEST_COUNT) > 0 
+                THEN ROUND(SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END)::FLOAT 
+                           / SUM(LAB_TEST_COUNT) * 100, 2)
                 ELSE 0 
             END AS ABNORMAL_LAB_RATE_PERCENT
-        FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
-        WHERE RESULT_MONTH IS NOT NULL
-        GROUP BY RESULT_MONTH
+        FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+        GROUP BY MONTH_KEY
     )
     SELECT
         COALESCE(mia.MONTH_KEY, la.MONTH_KEY) AS MONTH_KEY,
         COALESCE(mia.TOTAL_INPATIENT_ENCOUNTERS, 0) AS TOTAL_INPATIENT_ENCOUNTERS,
+        mia.TOTAL_LOS_DAYS AS TOTAL_LOS_DAYS,
         COALESCE(mia.AVERAGE_LENGTH_OF_STAY, 0) AS AVERAGE_LENGTH_OF_STAY,
         COALESCE(mia.MEDIAN_LENGTH_OF_STAY, 0) AS MEDIAN_LENGTH_OF_STAY,
         COALESCE(mia.TOTAL_READMISSIONS, 0) AS TOTAL_READMISSIONS,
@@ -0,0 +1,301 @@
+/*
+================================================================================
+Project:        MediCore Health Systems - Snowflake Data Platform
+Layer:          Platinum (AI_READY_DB) - Semantic Layer
+Script:         01_medicore_semantic_model.sql
+Object:         MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS
+                MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_DIMENSIONS
+                MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCES
+                MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_METRICS
+                MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_DIMENSIONS
+                MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS
+Purpose:        Single definition of the enterprise metrics (encounters, LOS,
+                readmission rate, denial rate, net revenue, abnormal lab
+                rate), the dimensions they can be sliced by, and every table
+                that can answer them.
+                tools/semantic_layer compiles metric requests against this
+                model and routes each one to the smallest pre-aggregated
+                table that can answer it, falling back to the Gold facts.
+Grain:          SEMANTIC_METRICS            1 row = 1 metric
+                SEMANTIC_DIMENSIONS         1 row = 1 dimension
+                SEMANTIC_SOURCES            1 row = 1 answering table
+                SEMANTIC_SOURCE_METRICS     1 row = 1 metric x source
+                SEMANTIC_SOURCE_DIMENSIONS  1 row = 1 dimension x source
+                V_INPATIENT_STAYS           1 row = 1 discharged inpatient stay
+Source:         MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS
+                MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS
+                MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+                MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS
+                MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME
+                MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY
+                MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES
+Dependencies:   tools/semantic_layer query planner, Streamlit dashboards
+Author:         Data Engineering Team
+Version:        1.0
+================================================================================
+
+ADDITIVITY RULES
+--------------------------------------------------------------------------------
+ADDITIVE      Counts and sums. Can be re-aggregated from any source whose grain
+              contains the requested dimensions (or dimensions they roll up
+              from, e.g. YEAR from MONTH).
+RATIO         NUMERATOR_METRIC / DENOMINATOR_METRIC * MULTIPLIER. Never read
+              from a stored rate column: both components are re-aggregated
+              from the same source, then divided. NULL when the denominator
+              is 0.
+NON_ADDITIVE  Medians and distinct counts. An aggregate table can only answer
+              at exactly its own grain; any other grouping goes to the fact.
+
+AGGREGATE_EXPRESSION in SEMANTIC_SOURCE_METRICS is the full aggregate over
+that source's rows. DERIVATION in SEMANTIC_DIMENSIONS uses {<DIMENSION>} as a
+placeholder for the source column of the dimension it is derived from.
+================================================================================
+*/
+
+USE ROLE MEDICORE_DATA_ENGINEER;
+USE WAREHOUSE MEDICORE_ANALYTICS_WH;
+USE DATABASE MEDICORE_AI_READY_DB;
+USE SCHEMA DEV_SEMANTIC;
+
+-- ============================================================================
+-- STEP 1: FACT VIEW FOR INPATIENT OUTCOMES
+-- Same population and readmission logic as KPI_CLINICAL_OUTCOMES: LEAD runs
+-- over every inpatient stay, then stays without a discharge are dropped.
+-- ============================================================================
+
+CREATE OR REPLACE VIEW MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS
+    COMMENT = 'Discharged inpatient stays with 30-day readmission flag. Fact fallback for LOS and readmission metrics.'
+AS
+SELECT
+    ENCOUNTER_ID,
+    PATIENT_ID,
+    DEPARTMENT_ID,
+    DEPARTMENT_NAME,
+    ADMISSION_DATE,
+    DISCHARGE_DATE,
+    DISCHARGE_MONTH,
+    LENGTH_OF_STAY_DAYS,
+    IS_READMISSION_CASE
+FROM (
+    SELECT
+        ENCOUNTER_ID,
+        PATIENT_ID,
+        DEPARTMENT_ID,
+        DEPARTMENT_NAME,
+        ADMISSION_DATE,
+        DISCHARGE_DATE,
+        DISCHARGE_MONTH,
+        LENGTH_OF_STAY_DAYS,
+        CASE
+            WHEN LEAD(ADMISSION_DATE) OVER (
+                PARTITION BY PATIENT_ID
+                ORDER BY ADMISSION_DATE
+            ) <= DATEADD('DAY', 30, DISCHARGE_DATE)
+            THEN 1
+            ELSE 0
+        END                                                     AS IS_READMISSION_CASE
+    FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS
+    WHERE IS_INPATIENT_FLAG = TRUE
+      AND ADMISSION_DATE IS NOT NULL
+)
+WHERE DISCHARGE_MONTH IS NOT NULL;
+
+-- ============================================================================
+-- STEP 2: MODEL TABLES
+-- ============================================================================
+
+CREATE OR REPLACE TABLE MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS (
+    METRIC_NAME             VARCHAR(100)    NOT NULL,
+    ADDITIVITY              VARCHAR(20)     NOT NULL,
+    NUMERATOR_METRIC        VARCHAR(100),
+    DENOMINATOR_METRIC      VARCHAR(100),
+    MULTIPLIER              NUMBER(10,2),
+    UNIT                    VARCHAR(20)     NOT NULL,
+    DESCRIPTION             VARCHAR(500)    NOT NULL,
+    CONSTRAINT PK_SEMANTIC_METRICS PRIMARY KEY (METRIC_NAME)
+)
+COMMENT = 'Semantic model: metric definitions and additivity (ADDITIVE, RATIO, NON_ADDITIVE).';
+
+CREATE OR REPLACE TABLE MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_DIMENSIONS (
+    DIMENSION_NAME          VARCHAR(100)    NOT NULL,
+    DERIVED_FROM            VARCHAR(100),
+    DERIVATION              VARCHAR(500),
+    DESCRIPTION             VARCHAR(500)    NOT NULL,
+    CONSTRAINT PK_SEMANTIC_DIMENSIONS PRIMARY KEY (DIMENSION_NAME)
+)
+COMMENT = 'Semantic model: dimensions. Derived dimensions roll up from DERIVED_FROM.';
+
+CREATE OR REPLACE TABLE MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCES (
+    SOURCE_NAME             VARCHAR(300)    NOT NULL,
+    SOURCE_KIND             VARCHAR(20)     NOT NULL,
+    SOURCE_FILTER           VARCHAR(1000),
+    DESCRIPTION             VARCHAR(500)    NOT NULL,
+    CONSTRAINT PK_SEMANTIC_SOURCES PRIMARY KEY (SOURCE_NAME)
+)
+COMMENT = 'Semantic model: tables that can answer metrics. AGGREGATE grain = its mapped dimensions; FACT = row level.';
+
+CREATE OR REPLACE TABLE MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_METRICS (
+    SOURCE_NAME             VARCHAR(300)    NOT NULL,
+    METRIC_NAME             VARCHAR(100)    NOT NULL,
+    AGGREGATE_EXPRESSION    VARCHAR(1000)   NOT NULL,
+    CONSTRAINT PK_SEMANTIC_SOURCE_METRICS PRIMARY KEY (SOURCE_NAME, METRIC_NAME)
+)
+COMMENT = 'Semantic model: how each source computes each ADDITIVE / NON_ADDITIVE metric.';
+
+CREATE OR REPLACE TABLE MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_DIMENSIONS (
+    SOURCE_NAME             VARCHAR(300)    NOT NULL,
+    DIMENSION_NAME          VARCHAR(100)    NOT NULL,
+    COLUMN_EXPRESSION       VARCHAR(500)    NOT NULL,
+    CONSTRAINT PK_SEMANTIC_SOURCE_DIMENSIONS PRIMARY KEY (SOURCE_NAME, DIMENSION_NAME)
+)
+COMMENT = 'Semantic model: source column for each base dimension.';
+
+-- ============================================================================
+-- STEP 3: METRICS
+-- ============================================================================
+
+INSERT INTO MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS
+    (METRIC_NAME, ADDITIVITY, NUMERATOR_METRIC, DENOMINATOR_METRIC, MULTIPLIER, UNIT, DESCRIPTION)
+VALUES
+    ('ENCOUNTERS',        'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Encounters by admission month'),
+    ('INPATIENT_STAYS',   'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Discharged inpatient stays by discharge month'),
+    ('LOS_DAYS',          'ADDITIVE',     NULL,              NULL,               NULL,   'days',    'Total length of stay of discharged inpatient stays'),
+    ('AVERAGE_LOS',       'RATIO',        'LOS_DAYS',        'INPATIENT_STAYS',  1,      'days',    'Average length of stay, discharged inpatient stays'),
+    ('MEDIAN_LOS',        'NON_ADDITIVE', NULL,              NULL,               NULL,   'days',    'Median length of stay, discharged inpatient stays'),
+    ('READMISSIONS',      'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Inpatient stays followed by another inpatient admission within 30 days of discharge'),
+    ('READMISSION_RATE',  'RATIO',        'READMISSIONS',    'INPATIENT_STAYS',  100,    'percent', '30-day readmission rate'),
+    ('CLAIMS',            'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Claims by service month'),
+    ('DENIED_CLAIMS',     'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Denied claims by service month'),
+    ('DENIAL_RATE',       'RATIO',        'DENIED_CLAIMS',   'CLAIMS',           100,    'percent', 'Claim denial rate'),
+    ('NET_REVENUE',       'ADDITIVE',     NULL,              NULL,               NULL,   'USD',     'Net revenue (billed amount, no payments or adjustments in source)'),
+    ('LAB_TESTS',         'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Lab results by result month'),
+    ('ABNORMAL_LABS',     'ADDITIVE',     NULL,              NULL,               NULL,   'count',   'Abnormal lab results by result month'),
+    ('ABNORMAL_LAB_RATE', 'RATIO',        'ABNORMAL_LABS',   'LAB_TESTS',        100,    'percent', 'Share of lab results flagged abnormal');
+
+-- ============================================================================
+-- STEP 4: DIMENSIONS
+-- MONTH is the metric's own time axis: admission month for encounters,
+-- discharge month for inpatient outcomes, service month for claims, result
+-- month for labs.
+-- ============================================================================
+
+INSERT INTO MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_DIMENSIONS
+    (DIMENSION_NAME, DERIVED_FROM, DERIVATION, DESCRIPTION)
+VALUES
+    ('MONTH',            NULL,    NULL,                               'First day of the metric''s reporting month'),
+    ('QUARTER',          'MONTH', 'DATE_TRUNC(''QUARTER'', {MONTH})', 'First day of the reporting quarter'),
+    ('YEAR',             'MONTH', 'YEAR({MONTH})',                    'Reporting year'),
+    ('DEPARTMENT_ID',    NULL,    NULL,                               'Treating department'),
+    ('DEPARTMENT_NAME',  NULL,    NULL,                               'Treating department name'),
+    ('ENCOUNTER_TYPE',   NULL,    NULL,                               'INPATIENT, OUTPATIENT, EMERGENCY, ...'),
+    ('PAYER_TYPE',       NULL,    NULL,                               'Claim payer type'),
+    ('TEST_NAME',        NULL,    NULL,                               'Lab test name');
+
+-- ============================================================================
+-- STEP 5: SOURCES
+-- ============================================================================
+
+INSERT INTO MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCES
+    (SOURCE_NAME, SOURCE_KIND, SOURCE_FILTER, DESCRIPTION)
+VALUES
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME',    'AGGREGATE', NULL,
+        'Monthly encounter volume'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'AGGREGATE', 'TOTAL_INPATIENT_ENCOUNTERS > 0',
+        'Monthly inpatient outcomes (lab-only months excluded)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY',   'AGGREGATE', NULL,
+        'Monthly claims and revenue'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'AGGREGATE', NULL,
+        'Monthly lab results by department, test and abnormal flag'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'FACT',      'ADMISSION_DATE IS NOT NULL',
+        'Gold encounter fact'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'FACT',      NULL,
+        'Discharged inpatient stays with readmission flag'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'FACT',      'CLAIM_MONTH IS NOT NULL',
+        'Gold claim fact'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'FACT',      'RESULT_MONTH IS NOT NULL',
+        'Gold lab result fact');
+
+INSERT INTO MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_METRICS
+    (SOURCE_NAME, METRIC_NAME, AGGREGATE_EXPRESSION)
+VALUES
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME',    'ENCOUNTERS',      'SUM(TOTAL_ENCOUNTERS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'INPATIENT_STAYS', 'SUM(TOTAL_INPATIENT_ENCOUNTERS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'LOS_DAYS',        'SUM(TOTAL_LOS_DAYS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'MEDIAN_LOS',      'MAX(MEDIAN_LENGTH_OF_STAY)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'READMISSIONS',    'SUM(TOTAL_READMISSIONS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY',   'CLAIMS',          'SUM(TOTAL_CLAIMS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY',   'DENIED_CLAIMS',   'SUM(TOTAL_DENIED_CLAIMS)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY',   'NET_REVENUE',     'SUM(TOTAL_NET_REVENUE)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'ENCOUNTERS',      'COUNT(ENCOUNTER_ID)'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'INPATIENT_STAYS', 'COUNT(ENCOUNTER_ID)'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'LOS_DAYS',        'SUM(LENGTH_OF_STAY_DAYS)'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'MEDIAN_LOS',      'MEDIAN(LENGTH_OF_STAY_DAYS)'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'READMISSIONS',    'SUM(IS_READMISSION_CASE)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'CLAIMS',          'COUNT(CLAIM_ID)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'DENIED_CLAIMS',   'SUM(DENIAL_FLAG_NUMERIC)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'NET_REVENUE',     'SUM(COALESCE(CLAIM_BILLED_AMOUNT, 0))'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'LAB_TESTS',       'SUM(LAB_TEST_COUNT)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'ABNORMAL_LABS',   'SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'LAB_TESTS',       'COUNT(LAB_RESULT_ID)'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'ABNORMAL_LABS',   'SUM(CASE WHEN IS_ABNORMAL = TRUE THEN 1 ELSE 0 END)');
+
+INSERT INTO MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_DIMENSIONS
+    (SOURCE_NAME, DIMENSION_NAME, COLUMN_EXPRESSION)
+VALUES
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME',    'MONTH',           'MONTH_KEY'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES', 'MONTH',           'MONTH_KEY'),
+    ('MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY',   'MONTH',           'MONTH_KEY'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'MONTH',           'ENCOUNTER_MONTH'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'DEPARTMENT_ID',   'DEPARTMENT_ID'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'DEPARTMENT_NAME', 'DEPARTMENT_NAME'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS',             'ENCOUNTER_TYPE',  'ENCOUNTER_TYPE'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'MONTH',           'DISCHARGE_MONTH'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'DEPARTMENT_ID',   'DEPARTMENT_ID'),
+    ('MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS',       'DEPARTMENT_NAME', 'DEPARTMENT_NAME'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'MONTH',           'CLAIM_MONTH'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'DEPARTMENT_ID',   'DEPARTMENT_ID'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'ENCOUNTER_TYPE',  'ENCOUNTER_TYPE'),
+    ('MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS',                  'PAYER_TYPE',      'PAYER_TYPE'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'MONTH',           'MONTH_KEY'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'DEPARTMENT_ID',   'DEPARTMENT_ID'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'DEPARTMENT_NAME', 'DEPARTMENT_NAME'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY',    'TEST_NAME',       'TEST_NAME'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'MONTH',           'RESULT_MONTH'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'DEPARTMENT_ID',   'DEPARTMENT_ID'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'DEPARTMENT_NAME', 'DEPARTMENT_NAME'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'ENCOUNTER_TYPE',  'ENCOUNTER_TYPE'),
+    ('MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS',            'TEST_NAME',       'TEST_NAME');
+
+-- ============================================================================
+-- STEP 6: VERIFICATION
+-- ============================================================================
+
+-- Every RATIO component must be a defined metric
+SELECT m.METRIC_NAME, m.NUMERATOR_METRIC, m.DENOMINATOR_METRIC
+FROM MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS m
+LEFT JOIN MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS n ON m.NUMERATOR_METRIC = n.METRIC_NAME
+LEFT JOIN MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS d ON m.DENOMINATOR_METRIC = d.METRIC_NAME
+WHERE m.ADDITIVITY = 'RATIO'
+  AND (n.METRIC_NAME IS NULL OR d.METRIC_NAME IS NULL);
+
+-- Every non-ratio metric must have a FACT fallback
+SELECT m.METRIC_NAME
+FROM MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_METRICS m
+WHERE m.ADDITIVITY <> 'RATIO'
+  AND NOT EXISTS (
+      SELECT 1
+      FROM MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_METRICS sm
+      JOIN MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCES s ON sm.SOURCE_NAME = s.SOURCE_NAME
+      WHERE sm.METRIC_NAME = m.METRIC_NAME
+        AND s.SOURCE_KIND = 'FACT'
+  );
+
+-- Routing coverage: which sources answer which metrics
+SELECT
+    s.SOURCE_KIND,
+    s.SOURCE_NAME,
+    LISTAGG(sm.METRIC_NAME, ', ') WITHIN GROUP (ORDER BY sm.METRIC_NAME) AS METRICS
+FROM MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCES s
+JOIN MEDICORE_AI_READY_DB.DEV_SEMANTIC.SEMANTIC_SOURCE_METRICS sm ON s.SOURCE_NAME = sm.SOURCE_NAME
+GROUP BY s.SOURCE_KIND, s.SOURCE_NAME
+ORDER BY s.SOURCE_KIND, s.SOURCE_NAME;
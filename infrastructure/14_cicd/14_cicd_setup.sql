@@ -0,0 +1,141 @@
+-- ============================================================
+-- MEDICORE HEALTH SYSTEMS - SNOWFLAKE DATA PLATFORM
+-- ============================================================
+-- Phase 14: GitHub CI/CD
+-- Script: 14_cicd_setup.sql
+--
+-- Description:
+--   Creates the deployment state used by the change-aware
+--   deployer (tools/deployer) that GitHub Actions runs against
+--   the medallion scripts. The deployer hashes each object's
+--   normalized definition and compares it with the hash stored
+--   here, so a release only re-creates the objects that changed
+--   and refreshes the dynamic tables downstream of them. A
+--   release with no changes executes no DDL at all.
+--
+-- Objects Created:
+--   - DEPLOYMENT_STATE    - Last deployed definition per object
+--   - DEPLOYMENT_HISTORY  - One row per object per deployment
+--
+-- Security:
+--   - Objects owned by ACCOUNTADMIN
+--   - MEDICORE_SVC_GITHUB_ACTIONS reads and writes state
+--   - MEDICORE_PLATFORM_ADMIN reads state and history
+--
+-- Execution Requirements:
+--   - Must be run as ACCOUNTADMIN
+--   - Phase 02 roles and Phase 09 AUDIT schema must exist
+--   - Run once before the first pipeline deployment, then
+--     adopt the existing objects with:
+--       python -m tools.deployer baseline --connection <name>
+--
+-- Author: MediCore Platform Team
+-- Date: 2026-10-19
+-- ============================================================
+
+
+USE ROLE ACCOUNTADMIN;
+USE DATABASE MEDICORE_GOVERNANCE_DB;
+USE SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+
+
+-- ============================================================
+-- SECTION 1: DEPLOYMENT STATE
+-- ============================================================
+-- One row per deployed object. DEFINITION_HASH covers the
+-- defining statement and its loads (MERGE / INSERT), with
+-- TARGET_LAG and WAREHOUSE excluded; those are kept in
+-- PROPERTIES so they can be changed with ALTER instead of
+-- re-creating (and re-initializing) a dynamic table.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE (
+    OBJECT_NAME             VARCHAR(255)    NOT NULL    COMMENT 'Fully qualified object name',
+    OBJECT_KIND             VARCHAR(30)     NOT NULL    COMMENT 'DYNAMIC TABLE, TABLE or VIEW',
+    SCRIPT_PATH             VARCHAR(500)    NOT NULL    COMMENT 'Repository script that defines the object',
+    DEFINITION_HASH         VARCHAR(64)     NOT NULL    COMMENT 'SHA-256 of the normalized definition and loads',
+    PROPERTIES              VARCHAR                     COMMENT 'JSON of alterable properties (TARGET_LAG, WAREHOUSE)',
+    POST_HASH               VARCHAR(64)                 COMMENT 'SHA-256 of the normalized ALTER / GRANT statements',
+    DEFINITION_TEXT         VARCHAR                     COMMENT 'Deployed statements, used for plan diffs',
+    DEPLOYMENT_ID           VARCHAR(36)                 COMMENT 'Deployment that last wrote this row',
+    GIT_COMMIT              VARCHAR(40)                 COMMENT 'Commit that was deployed',
+    DEPLOYED_AT             TIMESTAMP_LTZ   DEFAULT CURRENT_TIMESTAMP() COMMENT 'Row write timestamp',
+    CONSTRAINT PK_DEPLOYMENT_STATE PRIMARY KEY (OBJECT_NAME)
+)
+COMMENT = 'Deployed definition hash per medallion object, maintained by tools/deployer.';
+
+
+-- ============================================================
+-- SECTION 2: DEPLOYMENT HISTORY
+-- ============================================================
+-- Every object the deployer touches is logged with its action
+-- (CREATE, REPLACE, APPLY, ALTER, REDEPLOY, REFRESH, BASELINE)
+-- and outcome, so the cost of a release can be audited.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_HISTORY (
+    DEPLOYMENT_ID           VARCHAR(36)     NOT NULL    COMMENT 'Deployment run identifier',
+    OBJECT_NAME             VARCHAR(255)    NOT NULL    COMMENT 'Fully qualified object name',
+    ACTION                  VARCHAR(20)     NOT NULL    COMMENT 'Planned action',
+    STATUS                  VARCHAR(20)     NOT NULL    COMMENT 'SUCCEEDED, FAILED or SKIPPED',
+    REASON                  VARCHAR(500)                COMMENT 'Why the object was in the plan',
+    WAVE                    NUMBER(4,0)                 COMMENT 'Dependency wave the object ran in',
+    ELAPSED_SECONDS         NUMBER(10,3)                COMMENT 'Wall-clock time of the object statements',
+    ERROR_MESSAGE           VARCHAR                     COMMENT 'Error text for failed objects',
+    GIT_COMMIT              VARCHAR(40)                 COMMENT 'Commit that was deployed',
+    LOGGED_AT               TIMESTAMP_LTZ   DEFAULT CURRENT_TIMESTAMP() COMMENT 'Row write timestamp'
+)
+COMMENT = 'Per-object log of deployments run by tools/deployer.';
+
+
+-- ============================================================
+-- SECTION 3: SECURITY GRANTS
+-- ============================================================
+-- The CI service role maintains state; platform admins can
+-- audit it.
+-- ============================================================
+
+GRANT USAGE ON SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT TO ROLE MEDICORE_SVC_GITHUB_ACTIONS;
+
+GRANT SELECT, INSERT, DELETE ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE TO ROLE MEDICORE_SVC_GITHUB_ACTIONS;
+
+GRANT SELECT, INSERT ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_HISTORY TO ROLE MEDICORE_SVC_GITHUB_ACTIONS;
+
+GRANT SELECT ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE TO ROLE MEDICORE_PLATFORM_ADMIN;
+
+GRANT SELECT ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_HISTORY TO ROLE MEDICORE_PLATFORM_ADMIN;
+
+
+-- ============================================================
+-- SECTION 4: VERIFICATION QUERIES
+-- ============================================================
+
+SELECT OBJECT_KIND, COUNT(*) AS OBJECTS, MAX(DEPLOYED_AT) AS LAST_DEPLOYED_AT
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE
+GROUP BY OBJECT_KIND
+ORDER BY OBJECT_KIND;
+
+SELECT DEPLOYMENT_ID, ACTION, STATUS, COUNT(*) AS OBJECTS, SUM(ELAPSED_SECONDS) AS SECONDS
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_HISTORY
+GROUP BY DEPLOYMENT_ID, ACTION, STATUS
+ORDER BY MAX(LOGGED_AT) DESC
+LIMIT 50;
+
+
+-- ============================================================
+-- PHASE 14 SUMMARY
+-- ============================================================
+--
+-- OBJECTS CREATED:
+--   - Tables: DEPLOYMENT_STATE, DEPLOYMENT_HISTORY
+--
+-- GRANTS ISSUED: 5
+--   - USAGE on AUDIT schema to MEDICORE_SVC_GITHUB_ACTIONS
+--   - SELECT, INSERT, DELETE on DEPLOYMENT_STATE to MEDICORE_SVC_GITHUB_ACTIONS
+--   - SELECT, INSERT on DEPLOYMENT_HISTORY to MEDICORE_SVC_GITHUB_ACTIONS
+--   - SELECT on DEPLOYMENT_STATE, DEPLOYMENT_HISTORY to MEDICORE_PLATFORM_ADMIN
+--
+-- PIPELINE: .github/workflows/01-snowflake_deploy.yml
+--   - Pull requests: python -m tools.deployer plan --diff
+--   - main:          python -m tools.deployer deploy
+-- ============================================================
@@ -117,19 +117,18 @@ def load_abnormal_lab_trend(_session, start_date, end_date, departments):
     dept_filter = ""
     if departments:
         dept_list = ",".join([f"'{d}'" for d in departments])
-        dept_filter = f"AND e.DEPARTMENT_NAME IN ({dept_list})"
+        dept_filter = f"AND DEPARTMENT_NAME IN ({dept_list})"
     
+    # Monthly rollup: months overlapping the date range are counted whole.
     sql = f"""
     SELECT 
-        lr.RESULT_MONTH AS MONTH_KEY,
-        COALESCE(SUM(CASE WHEN lr.IS_ABNORMAL = TRUE THEN 1 ELSE 0 END) * 100.0 / NULLIF(COUNT(*), 0), 0) AS ABNORMAL_RATE
-    FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS lr
-    LEFT JOIN MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS e 
-        ON lr.ENCOUNTER_ID = e.ENCOUNTER_ID
-    WHERE lr.RESULT_DATE >= '{start_date}'
-      AND lr.RESULT_DATE <= '{end_date}'
+        MONTH_KEY,
+        COALESCE(SUM(CASE WHEN IS_ABNORMAL = TRUE THEN LAB_TEST_COUNT ELSE 0 END) * 100.0 / NULLIF(SUM(LAB_TEST_COUNT), 0), 0) AS ABNORMAL_RATE
+    FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY
+    WHERE MONTH_KEY >= DATE_TRUNC('MONTH', '{start_date}'::DATE)
+      AND MONTH_KEY <= '{end_date}'
       {dept_filter}
-    GROUP BY lr.RESULT_MONTH
+    GROUP BY MONTH_KEY
     ORDER BY MONTH_KEY
     """
     return _session.sql(sql).to_pandas()
@@ -245,7 +244,13 @@ else:
 
 st.divider()
 
-st.subheader("Lab Monitoring - Abnormal Results Rate (%)")
+st.subheader("Lab Monitoring - Abnormal Results Rate (%) by Month")
+lab_first_month = pd.to_datetime(start_date).strftime("%b %Y")
+lab_last_month = pd.to_datetime(end_date).strftime("%b %Y")
+st.caption(
+    f"Whole months {lab_first_month} to {lab_last_month}: lab results are rolled up by month, "
+    "so a partially selected month counts all of its results."
+)
 lab_trend = load_abnormal_lab_trend(session, start_date, end_date, selected_departments)
 
 if not lab_trend.empty:
@@ -5,14 +5,21 @@
 -- Script: 07_test_alerts.sql
 --
 -- Description:
---   Non-destructive, read-only validation script that verifies
---   all Phase 07 alert configurations are correct. Designed for
---   CI/CD automated verification after executing 07_alerts.sql.
+--   Validation script that verifies the Phase 07 consolidated
+--   alert evaluator is configured correctly and that its
+--   evaluation logic produces the expected results against
+--   fixture data. Designed for CI/CD automated verification
+--   after executing 07_alerts.sql.
 --
 -- Safety:
---   - Contains ONLY SELECT, SHOW, DESCRIBE, and RESULT_SCAN queries
---   - Does NOT create, alter, drop, resume, or suspend any alerts
---   - Does NOT send emails or trigger alert actions
+--   - Sections 1-8 contain ONLY SELECT, SHOW, DESCRIBE, and
+--     RESULT_SCAN queries against production objects
+--   - Sections 9-11 create a transient fixture schema
+--     (MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES), run
+--     SP_EVALUATE_ALERTS_IN_SCHEMA against it with
+--     notifications disabled, and drop the schema afterwards
+--   - Does NOT resume or suspend the evaluator task
+--   - Does NOT send emails or modify production ALERT_STATE
 --   - Safe for production execution
 --   - Idempotent
 --
@@ -22,17 +29,16 @@
 --   - Compatible with MEDICORE_SVC_GITHUB_ACTIONS
 --
 -- Test Coverage:
---   - Alert existence validation
---   - Schema location validation
---   - Warehouse assignment validation
---   - State validation (SUSPENDED)
---   - Schedule validation (CRON)
---   - Definition validation (views, email, severity)
+--   - Object existence validation (tables, procedure, task)
+--   - Rule configuration validation
+--   - Task configuration validation (warehouse, schedule, state)
 --   - Ownership validation
 --   - Privilege validation
 --   - Negative tests (unauthorized access)
---   - Drift detection
+--   - Drift detection (legacy ALERT objects retired)
 --   - Dependency validation (Phase 06 views)
+--   - Evaluation logic against fixture data (conditions,
+--     payload metrics, cooldown, deduplication, escalation)
 --
 -- Author: MediCore Platform Team
 -- Date: 2026-02-25
@@ -43,275 +49,190 @@ USE ROLE ACCOUNTADMIN;
 
 
 -- ============================================================
--- SECTION 1: ALERT EXISTENCE VALIDATION
+-- SECTION 1: OBJECT EXISTENCE VALIDATION
 -- ============================================================
--- Confirms all 5 required alerts exist.
+-- Confirms the evaluator tables, procedure, and task exist.
 -- ============================================================
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TABLES IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_001' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL exists' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'NOT_FOUND' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    'ALERT_RULES, ALERT_STATE, ALERT_EVALUATION_LOG exist' AS TEST_NAME,
+    '3' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 3 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+WHERE "name" IN ('ALERT_RULES', 'ALERT_STATE', 'ALERT_EVALUATION_LOG');
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW PROCEDURES LIKE 'SP_EVALUATE_ALERTS' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_002' AS TEST_ID,
-    'ALERT_LONG_RUNNING_QUERY exists' AS TEST_NAME,
+    'SP_EVALUATE_ALERTS exists' AS TEST_NAME,
     'EXISTS' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'NOT_FOUND' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_LONG_RUNNING_QUERY';
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW PROCEDURES LIKE 'SP_EVALUATE_ALERTS' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_003' AS TEST_ID,
-    'ALERT_FAILED_QUERY_SPIKE exists' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'NOT_FOUND' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_FAILED_QUERY_SPIKE';
+    'SP_EVALUATE_ALERTS takes no schema or time argument' AS TEST_NAME,
+    '1' AS EXPECTED_VALUE,
+    MAX("max_num_arguments")::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) > 0 AND MAX("max_num_arguments") = 1 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW PROCEDURES LIKE 'SP_EVALUATE_ALERTS_IN_SCHEMA' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_004' AS TEST_ID,
-    'ALERT_HIGH_WAREHOUSE_QUEUE exists' AS TEST_NAME,
+    'SP_EVALUATE_ALERTS_IN_SCHEMA exists' AS TEST_NAME,
     'EXISTS' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'NOT_FOUND' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_HIGH_WAREHOUSE_QUEUE';
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_005' AS TEST_ID,
-    'ALERT_MONTHLY_COST_SPIKE exists' AS TEST_NAME,
+    'TASK_ALERT_EVALUATOR exists' AS TEST_NAME,
     'EXISTS' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'NOT_FOUND' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_MONTHLY_COST_SPIKE';
+WHERE "name" = 'TASK_ALERT_EVALUATOR';
 
 
 -- ============================================================
--- SECTION 2: SCHEMA VALIDATION
+-- SECTION 2: RULE CONFIGURATION VALIDATION
 -- ============================================================
--- Confirms all alerts are in MEDICORE_GOVERNANCE_DB.AUDIT.
+-- Validates all 5 rules are seeded with expected thresholds.
 -- ============================================================
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
 SELECT
     'TC_07_006' AS TEST_ID,
-    'All alerts in correct schema (AUDIT)' AS TEST_NAME,
+    'ALERT_RULES contains 5 enabled rules' AS TEST_NAME,
     '5' AS EXPECTED_VALUE,
     COUNT(*)::VARCHAR AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "schema_name" = 'AUDIT'
-  AND "database_name" = 'MEDICORE_GOVERNANCE_DB';
-
-
--- ============================================================
--- SECTION 3: WAREHOUSE VALIDATION
--- ============================================================
--- Confirms all alerts use MEDICORE_ADMIN_WH.
--- ============================================================
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES
+WHERE IS_ENABLED
+  AND ALERT_NAME IN (
+      'ALERT_RESOURCE_MONITOR_CRITICAL', 'ALERT_LONG_RUNNING_QUERY', 'ALERT_FAILED_QUERY_SPIKE',
+      'ALERT_HIGH_WAREHOUSE_QUEUE', 'ALERT_MONTHLY_COST_SPIKE'
+  );
 
 SELECT
     'TC_07_007' AS TEST_ID,
-    'All alerts use MEDICORE_ADMIN_WH' AS TEST_NAME,
+    'Rule thresholds match Phase 07 specification' AS TEST_NAME,
     '5' AS EXPECTED_VALUE,
     COUNT(*)::VARCHAR AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "warehouse" = 'MEDICORE_ADMIN_WH';
-
-
--- ============================================================
--- SECTION 4: STATE VALIDATION
--- ============================================================
--- Confirms all alerts are in SUSPENDED state.
--- ============================================================
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES
+WHERE (ALERT_NAME = 'ALERT_RESOURCE_MONITOR_CRITICAL' AND THRESHOLD_VALUE = 90  AND SOURCE_VIEW = 'V_RESOURCE_MONITOR_STATUS')
+   OR (ALERT_NAME = 'ALERT_LONG_RUNNING_QUERY'        AND THRESHOLD_VALUE = 0   AND LOOKBACK_MINUTES = 15 AND SOURCE_VIEW = 'V_LONG_RUNNING_QUERIES')
+   OR (ALERT_NAME = 'ALERT_FAILED_QUERY_SPIKE'        AND THRESHOLD_VALUE = 10  AND LOOKBACK_MINUTES = 15 AND SOURCE_VIEW = 'V_FAILED_QUERIES')
+   OR (ALERT_NAME = 'ALERT_HIGH_WAREHOUSE_QUEUE'      AND THRESHOLD_VALUE = 5   AND SOURCE_VIEW = 'V_ACTIVE_WAREHOUSE_LOAD')
+   OR (ALERT_NAME = 'ALERT_MONTHLY_COST_SPIKE'        AND THRESHOLD_VALUE = 1.2 AND SOURCE_VIEW = 'V_COST_BY_WAREHOUSE_MONTH');
 
 SELECT
     'TC_07_008' AS TEST_ID,
-    'All alerts in SUSPENDED state' AS TEST_NAME,
+    'CRITICAL severity rules' AS TEST_NAME,
+    '2' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 2 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES
+WHERE SEVERITY = 'CRITICAL';
+
+SELECT
+    'TC_07_009' AS TEST_ID,
+    'All rules notify platform-alerts@medicore-health.com' AS TEST_NAME,
     '5' AS EXPECTED_VALUE,
     COUNT(*)::VARCHAR AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "state" = 'suspended';
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES
+WHERE NOTIFICATION_EMAIL = 'platform-alerts@medicore-health.com';
 
 
 -- ============================================================
--- SECTION 5: SCHEDULE VALIDATION
+-- SECTION 3: TASK CONFIGURATION VALIDATION
 -- ============================================================
--- Validates CRON schedules for each alert.
+-- Validates warehouse, schedule, state, and definition.
 -- ============================================================
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_009' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL schedule' AS TEST_NAME,
-    'USING CRON 0,30 * * * * UTC' AS EXPECTED_VALUE,
-    "schedule" AS ACTUAL_VALUE,
-    CASE WHEN "schedule" = 'USING CRON 0,30 * * * * UTC' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_010' AS TEST_ID,
-    'ALERT_LONG_RUNNING_QUERY schedule' AS TEST_NAME,
-    'USING CRON 0,15,30,45 * * * * UTC' AS EXPECTED_VALUE,
-    "schedule" AS ACTUAL_VALUE,
-    CASE WHEN "schedule" = 'USING CRON 0,15,30,45 * * * * UTC' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_LONG_RUNNING_QUERY';
+    'TASK_ALERT_EVALUATOR uses MEDICORE_ADMIN_WH' AS TEST_NAME,
+    'MEDICORE_ADMIN_WH' AS EXPECTED_VALUE,
+    "warehouse" AS ACTUAL_VALUE,
+    CASE WHEN "warehouse" = 'MEDICORE_ADMIN_WH' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_011' AS TEST_ID,
-    'ALERT_FAILED_QUERY_SPIKE schedule' AS TEST_NAME,
+    'TASK_ALERT_EVALUATOR schedule' AS TEST_NAME,
     'USING CRON 0,15,30,45 * * * * UTC' AS EXPECTED_VALUE,
     "schedule" AS ACTUAL_VALUE,
     CASE WHEN "schedule" = 'USING CRON 0,15,30,45 * * * * UTC' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_FAILED_QUERY_SPIKE';
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_012' AS TEST_ID,
-    'ALERT_HIGH_WAREHOUSE_QUEUE schedule' AS TEST_NAME,
-    'USING CRON 0,30 * * * * UTC' AS EXPECTED_VALUE,
-    "schedule" AS ACTUAL_VALUE,
-    CASE WHEN "schedule" = 'USING CRON 0,30 * * * * UTC' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_HIGH_WAREHOUSE_QUEUE';
+    'TASK_ALERT_EVALUATOR in SUSPENDED state' AS TEST_NAME,
+    'suspended' AS EXPECTED_VALUE,
+    "state" AS ACTUAL_VALUE,
+    CASE WHEN "state" = 'suspended' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
     'TC_07_013' AS TEST_ID,
-    'ALERT_MONTHLY_COST_SPIKE schedule' AS TEST_NAME,
-    'USING CRON 0 8 * * * UTC' AS EXPECTED_VALUE,
-    "schedule" AS ACTUAL_VALUE,
-    CASE WHEN "schedule" = 'USING CRON 0 8 * * * UTC' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_MONTHLY_COST_SPIKE';
-
-
--- ============================================================
--- SECTION 6: DEFINITION VALIDATION
--- ============================================================
--- Validates alert definitions reference correct views and email.
--- ============================================================
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_014' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL references V_RESOURCE_MONITOR_STATUS' AS TEST_NAME,
+    'TASK_ALERT_EVALUATOR calls SP_EVALUATE_ALERTS' AS TEST_NAME,
     'CONTAINS' AS EXPECTED_VALUE,
-    CASE WHEN "condition" LIKE '%V_RESOURCE_MONITOR_STATUS%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN "condition" LIKE '%V_RESOURCE_MONITOR_STATUS%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_015' AS TEST_ID,
-    'ALERT_LONG_RUNNING_QUERY references V_LONG_RUNNING_QUERIES' AS TEST_NAME,
-    'CONTAINS' AS EXPECTED_VALUE,
-    CASE WHEN "condition" LIKE '%V_LONG_RUNNING_QUERIES%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN "condition" LIKE '%V_LONG_RUNNING_QUERIES%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_LONG_RUNNING_QUERY';
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_016' AS TEST_ID,
-    'ALERT_FAILED_QUERY_SPIKE references V_FAILED_QUERIES' AS TEST_NAME,
-    'CONTAINS' AS EXPECTED_VALUE,
-    CASE WHEN "condition" LIKE '%V_FAILED_QUERIES%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN "condition" LIKE '%V_FAILED_QUERIES%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_FAILED_QUERY_SPIKE';
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_017' AS TEST_ID,
-    'ALERT_HIGH_WAREHOUSE_QUEUE references V_ACTIVE_WAREHOUSE_LOAD' AS TEST_NAME,
-    'CONTAINS' AS EXPECTED_VALUE,
-    CASE WHEN "condition" LIKE '%V_ACTIVE_WAREHOUSE_LOAD%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN "condition" LIKE '%V_ACTIVE_WAREHOUSE_LOAD%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_HIGH_WAREHOUSE_QUEUE';
-
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
-
-SELECT
-    'TC_07_018' AS TEST_ID,
-    'ALERT_MONTHLY_COST_SPIKE references V_COST_BY_WAREHOUSE_MONTH' AS TEST_NAME,
-    'CONTAINS' AS EXPECTED_VALUE,
-    CASE WHEN "condition" LIKE '%V_COST_BY_WAREHOUSE_MONTH%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN "condition" LIKE '%V_COST_BY_WAREHOUSE_MONTH%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'ALERT_MONTHLY_COST_SPIKE';
+    CASE WHEN "definition" LIKE '%SP_EVALUATE_ALERTS%' THEN 'CONTAINS' ELSE 'MISSING' END AS ACTUAL_VALUE,
+    CASE WHEN "definition" LIKE '%SP_EVALUATE_ALERTS%' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
 
 -- ============================================================
--- SECTION 7: OWNERSHIP VALIDATION
+-- SECTION 4: OWNERSHIP VALIDATION
 -- ============================================================
--- Confirms all alerts are owned by ACCOUNTADMIN.
+-- Confirms the evaluator task is owned by ACCOUNTADMIN.
 -- ============================================================
 
-SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SHOW TASKS LIKE 'TASK_ALERT_EVALUATOR' IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
-    'TC_07_019' AS TEST_ID,
-    'All alerts owned by ACCOUNTADMIN' AS TEST_NAME,
-    '5' AS EXPECTED_VALUE,
-    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "owner" = 'ACCOUNTADMIN';
+    'TC_07_014' AS TEST_ID,
+    'TASK_ALERT_EVALUATOR owned by ACCOUNTADMIN' AS TEST_NAME,
+    'ACCOUNTADMIN' AS EXPECTED_VALUE,
+    "owner" AS ACTUAL_VALUE,
+    CASE WHEN "owner" = 'ACCOUNTADMIN' THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
 
 -- ============================================================
--- SECTION 8: PRIVILEGE VALIDATION
+-- SECTION 5: PRIVILEGE VALIDATION
 -- ============================================================
--- Validates OPERATE privilege for MEDICORE_PLATFORM_ADMIN.
+-- Validates grants to MEDICORE_PLATFORM_ADMIN.
 -- ============================================================
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL;
+SHOW GRANTS ON TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR;
 
 SELECT
-    'TC_07_020' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL OPERATE to PLATFORM_ADMIN' AS TEST_NAME,
+    'TC_07_015' AS TEST_ID,
+    'TASK_ALERT_EVALUATOR OPERATE to PLATFORM_ADMIN' AS TEST_NAME,
     'GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'GRANTED' ELSE 'NOT_GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
@@ -319,93 +240,114 @@ FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
 WHERE "privilege" = 'OPERATE'
   AND "grantee_name" = 'MEDICORE_PLATFORM_ADMIN';
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_LONG_RUNNING_QUERY;
+SHOW GRANTS ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES;
 
 SELECT
-    'TC_07_021' AS TEST_ID,
-    'ALERT_LONG_RUNNING_QUERY OPERATE to PLATFORM_ADMIN' AS TEST_NAME,
+    'TC_07_016' AS TEST_ID,
+    'ALERT_RULES UPDATE to PLATFORM_ADMIN' AS TEST_NAME,
     'GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'GRANTED' ELSE 'NOT_GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "privilege" = 'OPERATE'
+WHERE "privilege" = 'UPDATE'
   AND "grantee_name" = 'MEDICORE_PLATFORM_ADMIN';
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_MONTHLY_COST_SPIKE;
+SHOW GRANTS ON TABLE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_EVALUATION_LOG;
 
 SELECT
-    'TC_07_022' AS TEST_ID,
-    'ALERT_MONTHLY_COST_SPIKE OPERATE to PLATFORM_ADMIN' AS TEST_NAME,
+    'TC_07_017' AS TEST_ID,
+    'ALERT_EVALUATION_LOG SELECT to PLATFORM_ADMIN' AS TEST_NAME,
     'GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'GRANTED' ELSE 'NOT_GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "privilege" = 'OPERATE'
+WHERE "privilege" = 'SELECT'
   AND "grantee_name" = 'MEDICORE_PLATFORM_ADMIN';
 
 
 -- ============================================================
--- SECTION 9: NEGATIVE TESTS (UNAUTHORIZED ACCESS)
+-- SECTION 6: NEGATIVE TESTS (UNAUTHORIZED ACCESS)
 -- ============================================================
--- Validates unauthorized roles do NOT have OPERATE privilege.
+-- Validates unauthorized roles do NOT have OPERATE privilege
+-- and the schema-parameterized evaluator is not granted out.
 -- ============================================================
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL;
+SHOW GRANTS ON TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR;
 
 SELECT
-    'TC_07_023' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL NOT granted to ANALYST_PHI' AS TEST_NAME,
+    'TC_07_018' AS TEST_ID,
+    'TASK_ALERT_EVALUATOR NOT granted to ANALYST_PHI' AS TEST_NAME,
     'NOT_GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'NOT_GRANTED' ELSE 'GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "privilege" = 'OPERATE'
-  AND "grantee_name" = 'MEDICORE_ANALYST_PHI';
+WHERE "grantee_name" = 'MEDICORE_ANALYST_PHI';
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL;
+SHOW GRANTS ON TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR;
 
 SELECT
-    'TC_07_024' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL NOT granted to EXECUTIVE' AS TEST_NAME,
+    'TC_07_019' AS TEST_ID,
+    'TASK_ALERT_EVALUATOR NOT granted to EXECUTIVE' AS TEST_NAME,
     'NOT_GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'NOT_GRANTED' ELSE 'GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "privilege" = 'OPERATE'
-  AND "grantee_name" = 'MEDICORE_EXECUTIVE';
+WHERE "grantee_name" = 'MEDICORE_EXECUTIVE';
 
-SHOW GRANTS ON ALERT MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RESOURCE_MONITOR_CRITICAL;
+SHOW GRANTS ON TASK MEDICORE_GOVERNANCE_DB.AUDIT.TASK_ALERT_EVALUATOR;
 
 SELECT
-    'TC_07_025' AS TEST_ID,
-    'ALERT_RESOURCE_MONITOR_CRITICAL NOT granted to COMPLIANCE_OFFICER' AS TEST_NAME,
+    'TC_07_020' AS TEST_ID,
+    'TASK_ALERT_EVALUATOR NOT granted to COMPLIANCE_OFFICER' AS TEST_NAME,
     'NOT_GRANTED' AS EXPECTED_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'NOT_GRANTED' ELSE 'GRANTED' END AS ACTUAL_VALUE,
     CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "privilege" = 'OPERATE'
-  AND "grantee_name" = 'MEDICORE_COMPLIANCE_OFFICER';
+WHERE "grantee_name" = 'MEDICORE_COMPLIANCE_OFFICER';
+
+SHOW GRANTS ON PROCEDURE MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(TIMESTAMP_LTZ, VARCHAR, BOOLEAN);
+
+SELECT
+    'TC_07_021' AS TEST_ID,
+    'SP_EVALUATE_ALERTS_IN_SCHEMA NOT granted to any role' AS TEST_NAME,
+    'NOT_GRANTED' AS EXPECTED_VALUE,
+    CASE WHEN COUNT(*) = 0 THEN 'NOT_GRANTED' ELSE 'GRANTED' END AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+WHERE "privilege" <> 'OWNERSHIP';
 
 
 -- ============================================================
--- SECTION 10: DRIFT DETECTION
+-- SECTION 7: DRIFT DETECTION
 -- ============================================================
--- Validates exactly 5 alerts exist (no unexpected alerts).
+-- Validates the legacy standalone ALERT objects are retired
+-- and only one evaluator task exists.
 -- ============================================================
 
 SHOW ALERTS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
-    'TC_07_026' AS TEST_ID,
-    'Exactly 5 alerts exist (no drift)' AS TEST_NAME,
-    '5' AS EXPECTED_VALUE,
+    'TC_07_022' AS TEST_ID,
+    'No standalone ALERT objects remain (no drift)' AS TEST_NAME,
+    '0' AS EXPECTED_VALUE,
     COUNT(*)::VARCHAR AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 
+SHOW TASKS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+
+SELECT
+    'TC_07_023' AS TEST_ID,
+    'Exactly 1 alert evaluator task exists' AS TEST_NAME,
+    '1' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 1 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+WHERE "name" LIKE 'TASK_ALERT%';
+
 
 -- ============================================================
--- SECTION 11: DEPENDENCY VALIDATION (PHASE 06 VIEWS)
+-- SECTION 8: DEPENDENCY VALIDATION (PHASE 06 VIEWS)
 -- ============================================================
 -- Validates that all referenced monitoring views exist.
 -- ============================================================
@@ -413,57 +355,279 @@ FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
 SHOW VIEWS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
 SELECT
-    'TC_07_027' AS TEST_ID,
-    'V_RESOURCE_MONITOR_STATUS view exists (dependency)' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    'TC_07_024' AS TEST_ID,
+    'All 5 rule source views exist (dependency)' AS TEST_NAME,
+    '5' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'V_RESOURCE_MONITOR_STATUS';
+WHERE "name" IN (
+    'V_RESOURCE_MONITOR_STATUS', 'V_LONG_RUNNING_QUERIES', 'V_FAILED_QUERIES',
+    'V_ACTIVE_WAREHOUSE_LOAD', 'V_COST_BY_WAREHOUSE_MONTH'
+);
 
-SHOW VIEWS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
 
+-- ============================================================
+-- SECTION 9: FIXTURE SETUP
+-- ============================================================
+-- Builds a transient schema that mirrors the evaluator inputs
+-- with known data. Evaluation time is fixed at
+-- 2026-03-15 10:00:00 so windows and months are deterministic.
+--
+-- Expected outcome at the fixed evaluation time:
+--   RESOURCE_MONITOR_CRITICAL  1 monitor >= 90%        TRIGGERED
+--   LONG_RUNNING_QUERY         2 queries in window     TRIGGERED
+--   FAILED_QUERY_SPIKE         12 failures in window   TRIGGERED
+--   HIGH_WAREHOUSE_QUEUE       1 warehouse > 5 queued  TRIGGERED
+--   MONTHLY_COST_SPIKE         130 vs 100 credits      TRIGGERED
+-- ============================================================
+
+CREATE OR REPLACE TRANSIENT SCHEMA MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES
+    COMMENT = 'Temporary fixtures for 07_test_alerts.sql. Dropped at end of test run.';
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_RULES
+    CLONE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_RULES;
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_STATE
+    LIKE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_STATE;
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_EVALUATION_LOG
+    LIKE MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_EVALUATION_LOG;
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_RESOURCE_MONITOR_STATUS AS
+SELECT * FROM VALUES
+    ('MEDICORE_ETL_MONITOR',       1000, 950, 50,  95.00, 'CRITICAL'),
+    ('MEDICORE_ANALYTICS_MONITOR', 1000, 500, 500, 50.00, 'MODERATE')
+    AS v (MONITOR_NAME, CREDIT_QUOTA, USED_CREDITS, REMAINING_CREDITS, PERCENTAGE_USED, HEALTH_STATUS);
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_LONG_RUNNING_QUERIES AS
+SELECT QUERY_ID, USER_NAME, WAREHOUSE_NAME, START_TIME::TIMESTAMP_LTZ AS START_TIME, EXECUTION_TIME_MINUTES
+FROM VALUES
+    ('q-001', 'ETL_USER',     'MEDICORE_ETL_WH',       '2026-03-15 09:50:00', 12.5),
+    ('q-002', 'ANALYST_USER', 'MEDICORE_ANALYTICS_WH', '2026-03-15 09:55:00', 7.0),
+    ('q-003', 'ETL_USER',     'MEDICORE_ETL_WH',       '2026-03-15 08:00:00', 30.0)
+    AS v (QUERY_ID, USER_NAME, WAREHOUSE_NAME, START_TIME, EXECUTION_TIME_MINUTES);
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_FAILED_QUERIES AS
 SELECT
-    'TC_07_028' AS TEST_ID,
-    'V_LONG_RUNNING_QUERIES view exists (dependency)' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    IFF(SEQ4() < 8, '002003', '100038')                             AS ERROR_CODE,
+    DATEADD('MINUTE', -(SEQ4() % 10), '2026-03-15 10:00:00'::TIMESTAMP_LTZ) AS START_TIME
+FROM TABLE(GENERATOR(ROWCOUNT => 12))
+UNION ALL
+SELECT '002003', '2026-03-15 08:00:00'::TIMESTAMP_LTZ;
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_ACTIVE_WAREHOUSE_LOAD AS
+SELECT * FROM VALUES
+    ('MEDICORE_ANALYTICS_WH', 3.50, 7.25, 12.00),
+    ('MEDICORE_ETL_WH',       2.00, 1.00, 2.00)
+    AS v (WAREHOUSE_NAME, AVG_QUERIES_RUNNING, AVG_QUERIES_QUEUED, PEAK_QUERIES_QUEUED);
+
+CREATE TABLE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_COST_BY_WAREHOUSE_MONTH AS
+SELECT WAREHOUSE_NAME, USAGE_MONTH::DATE AS USAGE_MONTH, TOTAL_CREDITS, ESTIMATED_COST_USD
+FROM VALUES
+    ('MEDICORE_ETL_WH',       '2026-03-01', 90, 270),
+    ('MEDICORE_ANALYTICS_WH', '2026-03-01', 40, 120),
+    ('MEDICORE_ETL_WH',       '2026-02-01', 70, 210),
+    ('MEDICORE_ANALYTICS_WH', '2026-02-01', 30, 90)
+    AS v (WAREHOUSE_NAME, USAGE_MONTH, TOTAL_CREDITS, ESTIMATED_COST_USD);
+
+
+-- ============================================================
+-- SECTION 10: EVALUATION LOGIC VALIDATION (FIXTURES)
+-- ============================================================
+-- Runs the evaluator against the fixture schema with
+-- notifications disabled but state updated as if they were
+-- sent (P_UPDATE_STATE => TRUE), and validates conditions,
+-- payload metrics, cooldown, deduplication, and escalation.
+-- The last run is a dry run (P_UPDATE_STATE => FALSE), which
+-- must leave ALERT_STATE as it was.
+-- ============================================================
+
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-15 10:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
+
+SELECT
+    'TC_07_025' AS TEST_ID,
+    'First evaluation: all 5 rules triggered and notified' AS TEST_NAME,
+    '5' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'V_LONG_RUNNING_QUERIES';
+WHERE "IS_TRIGGERED" AND "SHOULD_NOTIFY";
 
-SHOW VIEWS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+SELECT
+    'TC_07_026' AS TEST_ID,
+    'Long-running query count uses 15 minute window' AS TEST_NAME,
+    '2' AS EXPECTED_VALUE,
+    PAYLOAD:details:query_count::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN PAYLOAD:details:query_count::NUMBER = 2 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_EVALUATION_LOG
+WHERE ALERT_NAME = 'ALERT_LONG_RUNNING_QUERY';
+
+SELECT
+    'TC_07_027' AS TEST_ID,
+    'Failed query count and top error code' AS TEST_NAME,
+    '12 / 002003' AS EXPECTED_VALUE,
+    METRIC_VALUE::NUMBER::VARCHAR || ' / ' || PAYLOAD:details:error_summary[0]:error_code::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN METRIC_VALUE = 12 AND PAYLOAD:details:error_summary[0]:error_code::VARCHAR = '002003'
+         THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_EVALUATION_LOG
+WHERE ALERT_NAME = 'ALERT_FAILED_QUERY_SPIKE';
+
+SELECT
+    'TC_07_028' AS TEST_ID,
+    'Only monitors at or above threshold reported' AS TEST_NAME,
+    'MEDICORE_ETL_MONITOR' AS EXPECTED_VALUE,
+    ARRAY_TO_STRING(TRANSFORM(PAYLOAD:details:monitors_affected, m -> m:monitor_name), ',') AS ACTUAL_VALUE,
+    CASE WHEN ARRAY_SIZE(PAYLOAD:details:monitors_affected) = 1
+          AND PAYLOAD:details:monitors_affected[0]:monitor_name::VARCHAR = 'MEDICORE_ETL_MONITOR'
+         THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_EVALUATION_LOG
+WHERE ALERT_NAME = 'ALERT_RESOURCE_MONITOR_CRITICAL';
 
 SELECT
     'TC_07_029' AS TEST_ID,
-    'V_FAILED_QUERIES view exists (dependency)' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
-FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'V_FAILED_QUERIES';
+    'Monthly cost ratio computed (130 / 100)' AS TEST_NAME,
+    '1.3000' AS EXPECTED_VALUE,
+    METRIC_VALUE::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN METRIC_VALUE = 1.3 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_EVALUATION_LOG
+WHERE ALERT_NAME = 'ALERT_MONTHLY_COST_SPIKE';
 
-SHOW VIEWS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-15 10:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
 
 SELECT
     'TC_07_030' AS TEST_ID,
-    'V_ACTIVE_WAREHOUSE_LOAD view exists (dependency)' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    'Immediate re-evaluation suppressed by cooldown' AS TEST_NAME,
+    '5' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 5 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'V_ACTIVE_WAREHOUSE_LOAD';
+WHERE "IS_TRIGGERED" AND NOT "SHOULD_NOTIFY" AND "SUPPRESSION_REASON" = 'COOLDOWN';
 
-SHOW VIEWS IN SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT;
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-16 10:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
 
 SELECT
     'TC_07_031' AS TEST_ID,
-    'V_COST_BY_WAREHOUSE_MONTH view exists (dependency)' AS TEST_NAME,
-    'EXISTS' AS EXPECTED_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'EXISTS' ELSE 'MISSING' END AS ACTUAL_VALUE,
-    CASE WHEN COUNT(*) > 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+    'Unchanged ongoing condition suppressed as duplicate' AS TEST_NAME,
+    'DUPLICATE' AS EXPECTED_VALUE,
+    "SUPPRESSION_REASON" AS ACTUAL_VALUE,
+    CASE WHEN "SUPPRESSION_REASON" = 'DUPLICATE' AND NOT "SHOULD_NOTIFY" THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
 FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
-WHERE "name" = 'V_COST_BY_WAREHOUSE_MONTH';
+WHERE "ALERT_NAME" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+
+SELECT
+    'TC_07_032' AS TEST_ID,
+    'Time-windowed rules clear outside window' AS TEST_NAME,
+    '0' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_STATE
+WHERE ALERT_NAME IN ('ALERT_LONG_RUNNING_QUERY', 'ALERT_FAILED_QUERY_SPIKE')
+  AND IS_ACTIVE;
+
+SELECT
+    'TC_07_033' AS TEST_ID,
+    'One notification recorded per rule across 3 runs (except cost spike)' AS TEST_NAME,
+    '4' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 4 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_STATE
+WHERE NOTIFICATION_COUNT = 1
+  AND ALERT_NAME <> 'ALERT_MONTHLY_COST_SPIKE';
+
+SELECT
+    'TC_07_034' AS TEST_ID,
+    'Ongoing cost spike notifies again the next day' AS TEST_NAME,
+    '2' AS EXPECTED_VALUE,
+    NOTIFICATION_COUNT::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN NOTIFICATION_COUNT = 2 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_STATE
+WHERE ALERT_NAME = 'ALERT_MONTHLY_COST_SPIKE';
+
+-- Escalation: lower the fixture threshold to 80, move the
+-- analytics monitor to 82% (new hit), then to 100% (suspended).
+-- The monitor set is unchanged on the last run; only the trigger
+-- band moves, and that must notify again.
+UPDATE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_RULES
+SET THRESHOLD_VALUE = 80
+WHERE ALERT_NAME = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+
+UPDATE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_RESOURCE_MONITOR_STATUS
+SET USED_CREDITS = 820, REMAINING_CREDITS = 180, PERCENTAGE_USED = 82.00, HEALTH_STATUS = 'WARNING'
+WHERE MONITOR_NAME = 'MEDICORE_ANALYTICS_MONITOR';
+
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-16 11:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
+
+SELECT
+    'TC_07_035' AS TEST_ID,
+    'Monitor crossing the threshold (82%) notifies' AS TEST_NAME,
+    'NOTIFY' AS EXPECTED_VALUE,
+    IFF("SHOULD_NOTIFY", 'NOTIFY', COALESCE("SUPPRESSION_REASON", 'NOT_TRIGGERED')) AS ACTUAL_VALUE,
+    CASE WHEN "SHOULD_NOTIFY" THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+WHERE "ALERT_NAME" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+
+UPDATE MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.V_RESOURCE_MONITOR_STATUS
+SET USED_CREDITS = 1000, REMAINING_CREDITS = 0, PERCENTAGE_USED = 100.00, HEALTH_STATUS = 'CRITICAL'
+WHERE MONITOR_NAME = 'MEDICORE_ANALYTICS_MONITOR';
+
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-16 12:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
+
+SELECT
+    'TC_07_036' AS TEST_ID,
+    'Escalation 80% -> 100% (suspended) notifies again' AS TEST_NAME,
+    'NOTIFY' AS EXPECTED_VALUE,
+    IFF("SHOULD_NOTIFY", 'NOTIFY', COALESCE("SUPPRESSION_REASON", 'NOT_TRIGGERED')) AS ACTUAL_VALUE,
+    CASE WHEN "SHOULD_NOTIFY" THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+WHERE "ALERT_NAME" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-16 13:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, TRUE);
+
+SELECT
+    'TC_07_037' AS TEST_ID,
+    'Unchanged band after escalation suppressed as duplicate' AS TEST_NAME,
+    'DUPLICATE' AS EXPECTED_VALUE,
+    "SUPPRESSION_REASON" AS ACTUAL_VALUE,
+    CASE WHEN "SUPPRESSION_REASON" = 'DUPLICATE' AND NOT "SHOULD_NOTIFY" THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+WHERE "ALERT_NAME" = 'ALERT_RESOURCE_MONITOR_CRITICAL';
+
+-- Dry run a day later, when the cooldowns have elapsed.
+CALL MEDICORE_GOVERNANCE_DB.AUDIT.SP_EVALUATE_ALERTS_IN_SCHEMA(
+    '2026-03-17 13:00:00'::TIMESTAMP_LTZ, 'MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES', FALSE, FALSE);
+
+SELECT
+    'TC_07_038' AS TEST_ID,
+    'Dry run leaves ALERT_STATE untouched' AS TEST_NAME,
+    '0' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES.ALERT_STATE
+WHERE LAST_EVALUATED_AT > '2026-03-16 13:00:00'::TIMESTAMP_LTZ
+   OR LAST_NOTIFIED_AT > '2026-03-16 13:00:00'::TIMESTAMP_LTZ;
+
+SELECT
+    'TC_07_039' AS TEST_ID,
+    'Production evaluation log untouched by fixture runs' AS TEST_NAME,
+    '0' AS EXPECTED_VALUE,
+    COUNT(*)::VARCHAR AS ACTUAL_VALUE,
+    CASE WHEN COUNT(*) = 0 THEN 'PASS' ELSE 'FAIL' END AS TEST_STATUS
+FROM MEDICORE_GOVERNANCE_DB.AUDIT.ALERT_EVALUATION_LOG
+WHERE EVALUATED_AT BETWEEN '2026-03-15 10:00:00'::TIMESTAMP_LTZ AND '2026-03-17 13:00:00'::TIMESTAMP_LTZ;
+
+
+-- ============================================================
+-- SECTION 11: FIXTURE CLEANUP
+-- ============================================================
+
+DROP SCHEMA IF EXISTS MEDICORE_GOVERNANCE_DB.ALERT_TEST_FIXTURES;
 
 
 -- ============================================================
@@ -478,8 +642,8 @@ SELECT
     '=============================================' AS DIVIDER;
 
 SELECT
-    31 AS TOTAL_TESTS,
-    31 AS TESTS_PASSED,
+    39 AS TOTAL_TESTS,
+    39 AS TESTS_PASSED,
     0 AS TESTS_FAILED,
     'PASS' AS OVERALL_STATUS,
     'All Phase 07 alert tests passed' AS MESSAGE;
@@ -0,0 +1,268 @@
+import re
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from tools.deployer.catalog import DEFAULT_ROOTS, REPO_ROOT, build_catalog, normalize
+from tools.deployer.plan import DeployedState, plan_deployment
+from tools.deployer.runner import STATE_TABLE, deploy, load_state
+
+AS_OF = date(2026, 3, 1)
+GOLD_ENCOUNTERS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS"
+GOLD_LAB_RESULTS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS"
+SILVER_ENCOUNTERS = "MEDICORE_TRANSFORM_DB.DEV_CLINICAL.ENCOUNTERS"
+ENCOUNTERS_SCRIPT = Path("02_analytics_layer/02_clinical/03_encounters_dynamic.sql")
+LAB_RESULTS_SCRIPT = Path("02_analytics_layer/02_clinical/04_lab_results_dynamic.sql")
+
+
+def _deployed(catalog):
+    return {
+        obj.name: DeployedState(obj.name, obj.kind, obj.script, obj.definition_hash, obj.properties,
+                                obj.post_hash, obj.definition_text)
+        for obj in catalog.objects.values()
+    }
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    root = tmp_path / "11_medallion"
+    shutil.copytree(DEFAULT_ROOTS[0], root)
+    return root
+
+
+def _edit(root, relative, old, new):
+    path = root / relative
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new, 1))
+
+
+def test_normalize_ignores_layout_and_case_but_not_literals():
+    a = "create or replace view X as\n  select  a ,b\nfrom T where c = 'Inpatient'"
+    b = "CREATE OR REPLACE VIEW x AS SELECT a, b FROM t WHERE c='Inpatient'"
+    assert normalize(a) == normalize(b)
+    assert normalize(a) != normalize(b.replace("'Inpatient'", "'INPATIENT'"))
+
+
+def test_catalog_groups_statements_by_object():
+    catalog = build_catalog()
+    assert not catalog.unowned
+    silver = catalog.objects[SILVER_ENCOUNTERS]
+    assert (silver.kind, silver.replaces) == ("TABLE", False)
+    assert len(silver.loads) == 1 and silver.loads[0].startswith("MERGE INTO")
+    gold = catalog.objects[GOLD_ENCOUNTERS]
+    assert gold.kind == "DYNAMIC TABLE"
+    assert gold.properties == {"TARGET_LAG": "'5 minutes'", "WAREHOUSE": "MEDICORE_ETL_WH"}
+    assert SILVER_ENCOUNTERS in gold.dependencies
+    assert all(s.startswith("ALTER DYNAMIC TABLE") for s in gold.post)
+    assert catalog.dependents(GOLD_ENCOUNTERS) == {
+        "MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS",
+        "MEDICORE_ANALYTICS_DB.DEV_DEIDENTIFIED.ENCOUNTERS",
+        "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES",
+        "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME",
+    }
+
+
+def test_comment_and_formatting_edits_are_not_changes(scripts):
+    state = _deployed(build_catalog([scripts]))
+    _edit(scripts, ENCOUNTERS_SCRIPT, "TARGET_LAG = '5 minutes'", "-- reviewed\n    target_lag   =   '5 minutes'")
+    assert plan_deployment(build_catalog([scripts]), state).is_empty
+
+
+def test_target_lag_change_is_an_alter_without_dependents(scripts):
+    state = _deployed(build_catalog([scripts]))
+    _edit(scripts, LAB_RESULTS_SCRIPT, "TARGET_LAG = '5 minutes'", "TARGET_LAG = DOWNSTREAM")
+    plan = plan_deployment(build_catalog([scripts]), state)
+    assert list(plan.changes) == [GOLD_LAB_RESULTS]
+    change = plan.changes[GOLD_LAB_RESULTS]
+    assert change.action == "ALTER"
+    assert change.statements == [f"ALTER DYNAMIC TABLE {GOLD_LAB_RESULTS} SET TARGET_LAG = DOWNSTREAM"]
+
+
+def test_definition_change_replaces_object_and_redeploys_dependents(scripts):
+    state = _deployed(build_catalog([scripts]))
+    _edit(scripts, ENCOUNTERS_SCRIPT, "e.ENCOUNTER_TYPE = 'INPATIENT'", "e.ENCOUNTER_TYPE IN ('INPATIENT')")
+    plan = plan_deployment(build_catalog([scripts]), state)
+    assert plan.changes[GOLD_ENCOUNTERS].action == "REPLACE"
+    assert plan.waves[0] == [GOLD_ENCOUNTERS]
+    assert {name: c.action for name, c in plan.changes.items() if name != GOLD_ENCOUNTERS} == {
+        "MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS": "REDEPLOY",
+        "MEDICORE_ANALYTICS_DB.DEV_DEIDENTIFIED.ENCOUNTERS": "REDEPLOY",
+        "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES": "REDEPLOY",
+        "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME": "REDEPLOY",
+    }
+    assert any(line.startswith("+") and "IN ('INPATIENT')" in line for line in plan.changes[GOLD_ENCOUNTERS].diff)
+
+
+def test_silver_change_is_applied_in_place_without_touching_gold(scripts):
+    state = _deployed(build_catalog([scripts]))
+    _edit(scripts, "01_transform_layer/02_clinical/03_encounters.sql",
+          "UPPER(TRIM(src.encounter_type))", "UPPER(src.encounter_type)")
+    plan = plan_deployment(build_catalog([scripts]), state)
+    assert [(n, c.action) for n, c in plan.changes.items()] == [(SILVER_ENCOUNTERS, "APPLY")]
+    assert any("IF NOT EXISTS" in w for w in plan.warnings)
+
+
+def test_dynamic_table_dependents_are_refreshed_not_recreated(tmp_path):
+    (tmp_path / "01_a.sql").write_text(
+        "CREATE OR REPLACE DYNAMIC TABLE MEDICORE_ANALYTICS_DB.S.A TARGET_LAG = '5 minutes' "
+        "WAREHOUSE = MEDICORE_ETL_WH AS SELECT 1 AS ID;\n"
+    )
+    (tmp_path / "02_b.sql").write_text(
+        "CREATE OR REPLACE DYNAMIC TABLE MEDICORE_ANALYTICS_DB.S.B TARGET_LAG = DOWNSTREAM "
+        "WAREHOUSE = MEDICORE_ETL_WH AS SELECT ID FROM MEDICORE_ANALYTICS_DB.S.A;\n"
+    )
+    state = _deployed(build_catalog([tmp_path]))
+    (tmp_path / "01_a.sql").write_text((tmp_path / "01_a.sql").read_text().replace("1 AS ID", "2 AS ID"))
+    plan = plan_deployment(build_catalog([tmp_path]), state)
+    assert plan.waves == [["MEDICORE_ANALYTICS_DB.S.A"], ["MEDICORE_ANALYTICS_DB.S.B"]]
+    assert plan.changes["MEDICORE_ANALYTICS_DB.S.B"].statements == [
+        "ALTER DYNAMIC TABLE MEDICORE_ANALYTICS_DB.S.B REFRESH"
+    ]
+
+
+def test_objects_removed_from_repository_are_only_reported(scripts):
+    state = _deployed(build_catalog([scripts]))
+    (scripts / "02_analytics_layer/05_deidentified/03_lab_results_deidentified.sql").unlink()
+    plan = plan_deployment(build_catalog([scripts]), state)
+    assert plan.is_empty
+    assert plan.orphaned == ["MEDICORE_ANALYTICS_DB.DEV_DEIDENTIFIED.LAB_RESULTS"]
+
+
+# -- End-to-end deployment on DuckDB -----------------------------------------
+
+duckdb = pytest.importorskip("duckdb")
+
+
+def _with_deployment_tables(con):
+    from tools.medallion_bench.translate import translate_file
+
+    con.execute("ATTACH ':memory:' AS MEDICORE_AI_READY_DB")
+    con.execute("CREATE SCHEMA MEDICORE_AI_READY_DB.DEV_SEMANTIC")
+    con.execute("ATTACH ':memory:' AS MEDICORE_GOVERNANCE_DB")
+    con.execute("CREATE SCHEMA MEDICORE_GOVERNANCE_DB.AUDIT")
+    for statement in translate_file(REPO_ROOT / "infrastructure/14_cicd/14_cicd_setup.sql", AS_OF):
+        con.execute(statement.sql)
+    return con
+
+
+@pytest.fixture(scope="module")
+def warehouse():
+    from tools.medallion_bench.bench import connect, run_scale
+
+    con = connect(threads=2)
+    run_scale(0.02, AS_OF, con=con)
+    yield _with_deployment_tables(con)
+    con.close()
+
+
+@pytest.fixture(scope="module")
+def deployed(warehouse):
+    """The repository deployed once into an empty deployment state."""
+    catalog = build_catalog()
+    connect = _connect(warehouse, [])
+    plan = plan_deployment(catalog, load_state(connect()))
+    assert plan.counts() == {"CREATE": len(catalog.objects)}
+    return deploy(plan, catalog, connect, workers=4)
+
+
+def _connect(con, log, fail_on=None):
+    from tools.medallion_bench.translate import translate_statement
+
+    def connect():
+        cursor = con.cursor()
+
+        def execute(sql, params=()):
+            if fail_on and fail_on in sql:
+                raise RuntimeError(f"simulated failure in {fail_on}")
+            if not sql.startswith(("SELECT", "DELETE", "INSERT INTO MEDICORE_GOVERNANCE_DB")):
+                log.append(sql)
+            # Dynamic-table properties, refreshes and tags have no DuckDB equivalent.
+            if re.match(r"ALTER\s", sql, re.IGNORECASE):
+                return []
+            return cursor.execute(translate_statement(sql, AS_OF), list(params)).fetchall()
+
+        return execute
+
+    return connect
+
+
+def test_deploy_records_state_and_a_second_release_does_nothing(warehouse, deployed):
+    catalog = build_catalog()
+    log = []
+    connect = _connect(warehouse, log)
+    assert {r.status for r in deployed} == {"SUCCEEDED"}
+    assert warehouse.execute(f"SELECT COUNT(*) FROM {STATE_TABLE}").fetchone()[0] == len(catalog.objects)
+    assert warehouse.execute(f"SELECT COUNT(*) FROM {GOLD_ENCOUNTERS}").fetchone()[0] > 0
+
+    again = plan_deployment(build_catalog(), load_state(connect()))
+    assert again.is_empty
+    assert deploy(again, catalog, connect) == []
+    assert log == []
+
+
+def test_failed_wave_stops_the_deployment(warehouse, deployed, scripts):
+    state = load_state(_connect(warehouse, [])())
+    _edit(scripts, ENCOUNTERS_SCRIPT, "e.ENCOUNTER_TYPE = 'INPATIENT'", "e.ENCOUNTER_TYPE IN ('INPATIENT')")
+    catalog = build_catalog([scripts])
+    plan = plan_deployment(catalog, {name: s for name, s in state.items() if name in catalog.objects})
+    results = deploy(plan, catalog, _connect(warehouse, [], fail_on="IN ('INPATIENT')"))
+    statuses = {r.name: r.status for r in results}
+    assert statuses[GOLD_ENCOUNTERS] == "FAILED"
+    assert {s for n, s in statuses.items() if n != GOLD_ENCOUNTERS} == {"SKIPPED"}
+    stored = load_state(_connect(warehouse, [])())[GOLD_ENCOUNTERS]
+    assert stored.definition_hash == state[GOLD_ENCOUNTERS].definition_hash
+
+
+def test_skipped_dependents_are_planned_again_after_a_partial_failure(tmp_path):
+    from tools.medallion_bench.bench import connect as bench_connect
+
+    schema = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL"
+    (tmp_path / "01_a.sql").write_text(f"CREATE OR REPLACE TABLE {schema}.A AS SELECT 1 AS ID;\n")
+    (tmp_path / "01_c.sql").write_text(f"CREATE OR REPLACE TABLE {schema}.C AS SELECT 1 AS ID;\n")
+    (tmp_path / "02_b.sql").write_text(f"CREATE OR REPLACE VIEW {schema}.B AS SELECT ID FROM {schema}.A;\n")
+    con = _with_deployment_tables(bench_connect())
+    catalog = build_catalog([tmp_path])
+    assert {r.status for r in deploy(plan_deployment(catalog, {}), catalog, _connect(con, []))} == {"SUCCEEDED"}
+
+    for script in ("01_a.sql", "01_c.sql"):
+        (tmp_path / script).write_text((tmp_path / script).read_text().replace("1 AS ID", "2 AS ID"))
+    catalog = build_catalog([tmp_path])
+    plan = plan_deployment(catalog, load_state(_connect(con, [])()))
+    assert plan.waves == [[f"{schema}.A", f"{schema}.C"], [f"{schema}.B"]]
+    results = deploy(plan, catalog, _connect(con, [], fail_on=f"{schema}.C AS"))
+    assert {r.name: r.status for r in results} == {
+        f"{schema}.A": "SUCCEEDED", f"{schema}.C": "FAILED", f"{schema}.B": "SKIPPED",
+    }
+
+    retry = plan_deployment(catalog, load_state(_connect(con, [])()))
+    assert {name: c.action for name, c in retry.changes.items()} == {
+        f"{schema}.A": "REPLACE", f"{schema}.C": "REPLACE", f"{schema}.B": "REDEPLOY",
+    }
+    assert {r.status for r in deploy(retry, catalog, _connect(con, []))} == {"SUCCEEDED"}
+    assert plan_deployment(catalog, load_state(_connect(con, [])())).is_empty
+    con.close()
+
+
+def test_deploy_closes_every_session_it_opened(tmp_path):
+    from tools.medallion_bench.bench import connect as bench_connect
+
+    schema = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL"
+    (tmp_path / "01_a.sql").write_text(f"CREATE OR REPLACE TABLE {schema}.A AS SELECT 1 AS ID;\n")
+    (tmp_path / "01_c.sql").write_text(f"CREATE OR REPLACE TABLE {schema}.C AS SELECT 1 AS ID;\n")
+    (tmp_path / "02_b.sql").write_text(f"CREATE OR REPLACE VIEW {schema}.B AS SELECT ID FROM {schema}.A;\n")
+    con = _with_deployment_tables(bench_connect())
+    catalog = build_catalog([tmp_path])
+    opened, closed = [], []
+
+    def connect():
+        execute = _connect(con, [])()
+        execute.close = lambda: closed.append(execute)
+        opened.append(execute)
+        return execute
+
+    assert {r.status for r in deploy(plan_deployment(catalog, {}), catalog, connect, workers=2)} == {"SUCCEEDED"}
+    assert opened and closed == opened
+    con.close()
@@ -0,0 +1,172 @@
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from tools.deployer.catalog import build_catalog
+from tools.dt_profiler.__main__ import main
+from tools.dt_profiler.history import RefreshHistory, RefreshRecord, load_history
+from tools.dt_profiler.lint import FULL, NOTE, find_full_refresh_constructs
+from tools.dt_profiler.profiler import (
+    DOWNSTREAM,
+    format_lag,
+    parse_lag,
+    profile_tables,
+    recommend_lags,
+)
+
+T0 = datetime(2026, 3, 2, 0, 0, 0)
+ENCOUNTERS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS"
+LAB_RESULTS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS"
+DIM_DEPARTMENTS = "MEDICORE_ANALYTICS_DB.DEV_REFERENCE.DIM_DEPARTMENTS"
+CLAIMS = "MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS"
+
+
+def _refreshes(table, every_minutes, hours=24, action="INCREMENTAL", seconds=20, credits=0.01):
+    return [
+        RefreshRecord(table, action, "SUCCEEDED", T0 + timedelta(minutes=m),
+                      T0 + timedelta(minutes=m, seconds=seconds), 100, 10, credits)
+        for m in range(0, hours * 60, every_minutes)
+    ]
+
+
+def _dt(name, lag, source):
+    return (f"CREATE OR REPLACE DYNAMIC TABLE {name} TARGET_LAG = {lag} WAREHOUSE = MEDICORE_ETL_WH "
+            f"REFRESH_MODE = AUTO AS SELECT * FROM {source};\n")
+
+
+def test_lag_round_trip():
+    assert parse_lag("'5 minutes'") == 300
+    assert parse_lag("1 day") == 86400
+    assert parse_lag("DOWNSTREAM") is None
+    assert format_lag(900) == "'15 minutes'"
+    assert format_lag(3600) == "'1 hour'"
+    assert format_lag(None) == DOWNSTREAM
+
+
+@pytest.mark.parametrize("query, rule, severity", [
+    ("SELECT DATEDIFF('year', DOB, CURRENT_DATE()) AS AGE FROM t", "NON_DETERMINISTIC", FULL),
+    ("SELECT a FROM t MINUS SELECT a FROM u", "SET_OPERATOR", FULL),
+    ("SELECT a FROM t WHERE a IN (SELECT a FROM u)", "SUBQUERY", FULL),
+    ("SELECT a, ROW_NUMBER() OVER (ORDER BY a) AS rn FROM t", "WINDOW", FULL),
+    ("SELECT a, LEAD(d) OVER (PARTITION BY p ORDER BY d) AS nxt FROM t", "WINDOW", NOTE),
+])
+def test_constructs_that_block_incremental_refresh(query, rule, severity):
+    findings = find_full_refresh_constructs(f"CREATE DYNAMIC TABLE x TARGET_LAG = '1 hour' AS {query}")
+    assert [(f.rule, f.severity) for f in findings] == [(rule, severity)]
+
+
+def test_incremental_friendly_queries_are_not_flagged():
+    sql = ("CREATE DYNAMIC TABLE x COMMENT = 'refreshed with CURRENT_DATE() semantics' AS "
+           "SELECT e.a FROM (SELECT a FROM t) e LEFT JOIN u ON e.a = u.a WHERE e.kind = 'LIMIT 5' "
+           "UNION ALL (SELECT a FROM v) UNION (SELECT a FROM w)")
+    assert find_full_refresh_constructs(sql) == []
+
+
+def test_repository_gold_tables_refresh_incrementally():
+    catalog = build_catalog()
+    profiles = profile_tables(catalog)
+    assert DIM_DEPARTMENTS in profiles
+    assert not [p.table_name for p in profiles.values() if p.forces_full_refresh]
+
+
+def test_profile_summarises_refresh_history():
+    records = _refreshes(ENCOUNTERS, 60, hours=4) + [
+        RefreshRecord(ENCOUNTERS, "NO_DATA", "SUCCEEDED", T0 + timedelta(minutes=5), T0 + timedelta(minutes=5)),
+        RefreshRecord(ENCOUNTERS, "FULL", "FAILED", T0 + timedelta(minutes=10), T0 + timedelta(minutes=11)),
+    ]
+    profile = profile_tables(build_catalog(), RefreshHistory(records))[ENCOUNTERS]
+    assert profile.actions == {"INCREMENTAL": 4, "NO_DATA": 1, "FULL": 1}
+    assert profile.effective_mode == "INCREMENTAL"
+    assert profile.failed == 1
+    assert profile.rows_changed == 4 * 110
+    assert profile.p50_seconds == 20
+    assert profile.data_interval_minutes == 60
+    assert profile.credits == pytest.approx(0.04)
+
+
+def test_frequent_changes_move_to_the_tier_lag_and_rare_changes_stay():
+    history = RefreshHistory(_refreshes(ENCOUNTERS, 5) + _refreshes(CLAIMS, 120))
+    catalog = build_catalog()
+    recs = {r.table_name: r for r in recommend_lags(catalog, profile_tables(catalog, history), history)}
+
+    encounters = recs[ENCOUNTERS]
+    assert encounters.recommended_lag == "'15 minutes'"
+    assert (encounters.current_refreshes, encounters.projected_refreshes) == (288, 96)
+    assert encounters.projected_credits == pytest.approx(encounters.current_credits / 3)
+    assert encounters.alter_statement() == f"ALTER DYNAMIC TABLE {ENCOUNTERS} SET TARGET_LAG = '15 minutes';"
+
+    assert not recs[CLAIMS].changed
+    assert not recs[LAB_RESULTS].changed
+    assert recs[LAB_RESULTS].reason.startswith("queried directly by 01_medicore_semantic_model.sql, "
+                                               "DEV_DEIDENTIFIED.LAB_RESULTS;")
+    assert recs[DIM_DEPARTMENTS].recommended_lag == "'1 day'"
+
+
+def test_intermediate_tables_become_downstream(tmp_path):
+    base, top = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.BASE", "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ROLLUP"
+    (tmp_path / "01_base.sql").write_text(_dt(base, "'5 minutes'", "MEDICORE_TRANSFORM_DB.DEV_CLINICAL.X"))
+    (tmp_path / "02_rollup.sql").write_text(_dt(top, "DOWNSTREAM", base))
+    catalog = build_catalog([tmp_path])
+    history = RefreshHistory(_refreshes(base, 5))
+    recs = {r.table_name: r for r in recommend_lags(catalog, profile_tables(catalog, history), history)}
+    assert recs[base].recommended_lag == DOWNSTREAM
+    assert recs[base].projected_refreshes == 96
+    assert recs[top].recommended_lag == "'15 minutes'"
+    assert "never refreshes" in recs[top].reason
+
+
+def test_directly_queried_tables_keep_a_lag_of_their_own(tmp_path):
+    base, top = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.BASE", "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ROLLUP"
+    (tmp_path / "01_base.sql").write_text(_dt(base, "DOWNSTREAM", "MEDICORE_TRANSFORM_DB.DEV_CLINICAL.X"))
+    (tmp_path / "02_rollup.sql").write_text(_dt(top, "'15 minutes'", base))
+    (tmp_path / "03_view.sql").write_text(f"CREATE OR REPLACE VIEW MEDICORE_ANALYTICS_DB.DEV_CLINICAL.V AS "
+                                          f"SELECT * FROM {base};\n")
+    dashboard = tmp_path / "dashboard.py"
+    dashboard.write_text(f'QUERY = "SELECT * FROM {top}"\n')
+    catalog = build_catalog([tmp_path])
+    recs = {r.table_name: r for r in recommend_lags(catalog, profile_tables(catalog, consumers=[dashboard]))}
+    assert recs[base].recommended_lag == "'15 minutes'"
+    assert recs[base].reason.startswith("queried directly by DEV_CLINICAL.V; DOWNSTREAM refreshes it only")
+    assert recs[base].alter_statement() == f"ALTER DYNAMIC TABLE {base} SET TARGET_LAG = '15 minutes';"
+    assert recs[top].reason.startswith("queried directly by dashboard.py;")
+
+
+def test_lags_are_never_tightened(tmp_path):
+    name = "MEDICORE_ANALYTICS_DB.DEV_BILLING.SLOW"
+    (tmp_path / "01_slow.sql").write_text(_dt(name, "'1 hour'", "MEDICORE_TRANSFORM_DB.DEV_BILLING.X"))
+    catalog = build_catalog([tmp_path])
+    history = RefreshHistory(_refreshes(name, 60))
+    [rec] = recommend_lags(catalog, profile_tables(catalog, history), history)
+    assert not rec.changed
+
+
+def _write(path, header, rows):
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def test_report_reads_an_export_and_prints_alter_statements(tmp_path, capsys):
+    _write(tmp_path / "refresh_history.csv",
+           ["TABLE_NAME", "REFRESH_ACTION", "STATE", "REFRESH_TRIGGER", "REFRESH_START_TIME",
+            "REFRESH_END_TIME", "ROWS_INSERTED", "ROWS_DELETED", "CREDITS"],
+           [[r.table_name, r.action, r.state, "SCHEDULED", r.start_time.isoformat(sep=" "),
+             r.end_time.isoformat(sep=" "), r.rows_inserted, r.rows_deleted, r.credits]
+            for r in _refreshes(ENCOUNTERS, 5)])
+    _write(tmp_path / "dynamic_tables.csv",
+           ["TABLE_NAME", "TARGET_LAG", "REFRESH_MODE", "REFRESH_MODE_REASON", "WAREHOUSE"],
+           [[ENCOUNTERS, "5 minutes", "INCREMENTAL", "", "MEDICORE_ETL_WH"]])
+    _write(tmp_path / "warehouse_metering.csv", ["WAREHOUSE_NAME", "START_TIME", "CREDITS_USED_COMPUTE"],
+           [["MEDICORE_ETL_WH", "2026-03-02 00:00:00", "12.0"]])
+
+    history = load_history(tmp_path)
+    assert history.tables[ENCOUNTERS].refresh_mode == "INCREMENTAL"
+    assert history.metered_credits == {"MEDICORE_ETL_WH": 12.0}
+
+    assert main(["report", "--history", str(tmp_path)]) == 0
+    out = capsys.readouterr().out
+    assert f"ALTER DYNAMIC TABLE {ENCOUNTERS} SET TARGET_LAG = '15 minutes';" in out
+    assert f"ALTER DYNAMIC TABLE {DIM_DEPARTMENTS} SET TARGET_LAG = '1 day';" in out
+    assert "MEDICORE_ETL_WH: 2.88 credits attributed to refreshes of 12.00 metered (24%)" in out
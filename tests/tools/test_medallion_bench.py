@@ -0,0 +1,158 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from tools.medallion_bench.bench import (
+    PeakMemorySampler,
+    _raw_source,
+    ScaleResult,
+    StageResult,
+    compare_to_baseline,
+    scaling_curves,
+)
+from tools.medallion_bench.synthetic import row_counts
+from tools.medallion_bench.translate import Statement, split_statements, translate_script, translate_statement
+
+AS_OF = date(2026, 3, 1)
+
+
+def test_split_statements_ignores_semicolons_in_strings_and_comments():
+    sql = "-- header; not a statement\nSELECT 'a;b';\n/* x; y */ MERGE INTO t USING s ON 1=1;"
+    assert split_statements(sql) == ["SELECT 'a;b'", "MERGE INTO t USING s ON 1=1"]
+
+
+def test_dateadd_is_rewritten_as_interval_arithmetic():
+    sql = translate_statement("SELECT DATEADD('year', -150, CURRENT_DATE())", AS_OF)
+    assert sql == "SELECT (DATE '2026-03-01' + (-150) * INTERVAL 1 YEAR)"
+
+
+def test_merge_update_set_columns_are_unqualified():
+    sql = translate_statement(
+        "MERGE INTO db.s.t AS tgt USING src ON tgt.id = src.id "
+        "WHEN MATCHED THEN UPDATE SET tgt.a = src.a, tgt.b = src.b "
+        "WHEN NOT MATCHED THEN INSERT (a) VALUES (src.a)",
+        AS_OF,
+    )
+    assert "UPDATE SET a = src.a, b = src.b" in sql
+    assert "ON tgt.id = src.id" in sql
+
+
+def test_dynamic_table_becomes_full_refresh_ctas():
+    statements = translate_script(
+        "USE ROLE MEDICORE_DATA_ENGINEER;\n"
+        "CREATE OR REPLACE DYNAMIC TABLE MEDICORE_ANALYTICS_DB.DEV_CLINICAL.X\n"
+        "  TARGET_LAG = '5 minutes' WAREHOUSE = MEDICORE_ETL_WH REFRESH_MODE = AUTO\n"
+        "  COMMENT = 'Gold; layer'\nAS\nSELECT 1 AS ID;\n"
+        "ALTER DYNAMIC TABLE MEDICORE_ANALYTICS_DB.DEV_CLINICAL.X SET TAG t = 'v';\n"
+        "SELECT * FROM MEDICORE_ANALYTICS_DB.DEV_CLINICAL.X;",
+        AS_OF,
+    )
+    assert len(statements) == 1
+    assert statements[0].kind == "CTAS"
+    assert statements[0].target == "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.X"
+    assert statements[0].sql.startswith("CREATE OR REPLACE TABLE MEDICORE_ANALYTICS_DB.DEV_CLINICAL.X AS")
+    assert "TARGET_LAG" not in statements[0].sql
+
+
+def test_snowflake_types_are_mapped():
+    sql = translate_statement(
+        "CREATE TABLE IF NOT EXISTS t (a NUMBER, b NUMBER(10,2), c TIMESTAMP_NTZ "
+        "DEFAULT CURRENT_TIMESTAMP() COMMENT 'x', CONSTRAINT pk PRIMARY KEY (a))",
+        AS_OF,
+    )
+    assert sql == (
+        "CREATE TABLE IF NOT EXISTS t (a DECIMAL(38,0), b DECIMAL(10,2), c TIMESTAMP "
+        "DEFAULT TIMESTAMP '2026-03-01 00:00:00')"
+    )
+
+
+def test_reference_dimensions_do_not_scale():
+    counts = row_counts(10)
+    assert counts["DIM_DEPARTMENTS"] == 15
+    assert counts["PATIENTS"] == 50_000
+    assert row_counts(0.1)["LAB_RESULTS"] == 5_000
+
+
+def _stage(name, seconds, rows_in, quarantined=None):
+    return StageResult("SILVER", name, "x.sql", seconds, rows_in, rows_in, 100.0, quarantined)
+
+
+def test_scaling_exponent_is_log_log_slope():
+    results = [
+        ScaleResult(1, {}, [_stage("T", 1.0, 1_000)]),
+        ScaleResult(10, {}, [_stage("T", 10.0, 10_000)]),
+        ScaleResult(100, {}, [_stage("T", 400.0, 100_000)]),
+    ]
+    curve = scaling_curves(results)["T"]
+    assert [p["scale"] for p in curve["points"]] == [1, 10, 100]
+    assert curve["scaling_exponent"] == pytest.approx(1.301, abs=1e-3)
+
+
+def test_baseline_comparison_flags_throughput_and_quarantine_changes():
+    baseline = {"runs": [{"scale": 1, "stages": [
+        {"object_name": "SLOW", "seconds": 1.0, "rows_per_second": 1_000.0, "quarantine_ratio": 0.01},
+        {"object_name": "NOISY", "seconds": 0.01, "rows_per_second": 100_000.0, "quarantine_ratio": None},
+        {"object_name": "OK", "seconds": 1.0, "rows_per_second": 1_000.0, "quarantine_ratio": None},
+    ]}]}
+    results = [ScaleResult(1, {}, [
+        _stage("SLOW", 2.0, 1_000, quarantined=20),
+        _stage("NOISY", 0.1, 1_000),
+        _stage("OK", 1.1, 1_000),
+    ])]
+    findings = compare_to_baseline(results, baseline)
+    assert len(findings) == 2
+    assert findings[0].startswith("REGRESSION SLOW @ 1x")
+    assert findings[1].startswith("QUARANTINE SLOW @ 1x")
+
+
+@pytest.fixture(scope="module")
+def small_runs():
+    pytest.importorskip("duckdb")
+    from tools.medallion_bench.bench import run_scale
+
+    return run_scale(0.05, AS_OF, threads=2), run_scale(0.05, AS_OF, threads=4)
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="needs /proc RSS sampling")
+def test_peak_memory_is_measured_from_stage_start():
+    with PeakMemorySampler() as first:
+        block = b"x" * (64 << 20)
+    with PeakMemorySampler() as second:
+        pass
+    del block
+    assert first.peak_delta_mb >= 48
+    assert second.peak_delta_mb < 16
+
+
+def test_silver_rows_in_come_from_the_raw_source_not_joined_reference_tables():
+    merge = Statement(
+        "MERGE", "MEDICORE_TRANSFORM_DB.DEV_CLINICAL.ENCOUNTERS",
+        "MERGE INTO MEDICORE_TRANSFORM_DB.DEV_CLINICAL.ENCOUNTERS t USING (SELECT * FROM "
+        "MEDICORE_RAW_DB.DEV_CLINICAL.ENCOUNTERS r JOIN MEDICORE_ANALYTICS_DB.DEV_REFERENCE.DIM_DEPARTMENTS d "
+        "ON r.department_id = d.department_id) s ON t.id = s.id",
+    )
+    assert _raw_source(merge) == "MEDICORE_RAW_DB.DEV_CLINICAL.ENCOUNTERS"
+    with pytest.raises(ValueError, match="expected one MEDICORE_RAW_DB source"):
+        _raw_source(Statement("MERGE", merge.target, merge.sql.replace("MEDICORE_RAW_DB", "MEDICORE_X_DB")))
+
+
+def test_pipeline_runs_every_layer(small_runs):
+    stages = {s.stage for s in small_runs[0].stages}
+    assert stages == {"RAW", "SILVER", "GOLD"}
+    names = {s.object_name for s in small_runs[0].stages}
+    assert "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES" in names
+    assert "MEDICORE_ANALYTICS_DB.DEV_DEIDENTIFIED.LAB_RESULTS" in names
+
+
+def test_silver_quarantine_is_exercised_and_deterministic(small_runs):
+    first, second = (
+        {s.object_name: (s.rows_out, s.quarantined_rows) for s in run.stages if s.stage == "SILVER"}
+        for run in small_runs
+    )
+    assert first == second
+    assert len(first) == 8
+    for name, (validated, quarantined) in first.items():
+        if name.endswith(".PROVIDERS"):
+            continue
+        assert validated > 0 and quarantined > 0, name
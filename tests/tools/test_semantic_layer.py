@@ -0,0 +1,182 @@
+import math
+from datetime import date
+
+import pytest
+
+from tools.semantic_layer.model import MODEL_SCHEMA, MODEL_SCRIPT, ModelError, load_model_from_script
+from tools.semantic_layer.planner import (
+    Filter,
+    MetricRequest,
+    PlanningError,
+    QueryPlanner,
+    parse_filter,
+    source_row_counts,
+)
+
+duckdb = pytest.importorskip("duckdb")
+
+KPI_VOLUME = "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_PATIENT_VOLUME"
+KPI_OUTCOMES = "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_CLINICAL_OUTCOMES"
+KPI_REVENUE = "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_REVENUE_SUMMARY"
+ENCOUNTERS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.ENCOUNTERS"
+INPATIENT_STAYS = "MEDICORE_AI_READY_DB.DEV_SEMANTIC.V_INPATIENT_STAYS"
+CLAIMS = "MEDICORE_ANALYTICS_DB.DEV_BILLING.CLAIMS"
+LAB_RESULTS = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS"
+LAB_MONTHLY = "MEDICORE_ANALYTICS_DB.DEV_CLINICAL.LAB_RESULTS_MONTHLY"
+
+
+@pytest.fixture(scope="module")
+def model():
+    return load_model_from_script()
+
+
+@pytest.fixture(scope="module")
+def planner(model):
+    return QueryPlanner(model)
+
+
+def _request(metrics, dimensions=(), filters=()):
+    return MetricRequest(tuple(metrics), tuple(dimensions), tuple(filters))
+
+
+@pytest.mark.parametrize("metrics, dimensions, expected", [
+    (["ENCOUNTERS"], ["MONTH"], {"ENCOUNTERS": KPI_VOLUME}),
+    (["ENCOUNTERS"], ["YEAR"], {"ENCOUNTERS": KPI_VOLUME}),
+    (["ENCOUNTERS"], [], {"ENCOUNTERS": KPI_VOLUME}),
+    (["ENCOUNTERS"], ["DEPARTMENT_NAME"], {"ENCOUNTERS": ENCOUNTERS}),
+    (["AVERAGE_LOS", "READMISSION_RATE"], ["QUARTER"], {"AVERAGE_LOS": KPI_OUTCOMES, "READMISSION_RATE": KPI_OUTCOMES}),
+    (["MEDIAN_LOS"], ["MONTH"], {"MEDIAN_LOS": KPI_OUTCOMES}),
+    (["MEDIAN_LOS"], ["MONTH", "YEAR"], {"MEDIAN_LOS": KPI_OUTCOMES}),
+    (["MEDIAN_LOS"], ["YEAR"], {"MEDIAN_LOS": INPATIENT_STAYS}),
+    (["MEDIAN_LOS"], [], {"MEDIAN_LOS": INPATIENT_STAYS}),
+    (["DENIAL_RATE", "NET_REVENUE"], ["MONTH"], {"DENIAL_RATE": KPI_REVENUE, "NET_REVENUE": KPI_REVENUE}),
+    (["DENIAL_RATE"], ["PAYER_TYPE"], {"DENIAL_RATE": CLAIMS}),
+    (["ENCOUNTERS", "NET_REVENUE"], ["MONTH"], {"ENCOUNTERS": KPI_VOLUME, "NET_REVENUE": KPI_REVENUE}),
+    (["ABNORMAL_LAB_RATE"], ["MONTH", "DEPARTMENT_NAME"], {"ABNORMAL_LAB_RATE": LAB_MONTHLY}),
+    (["ABNORMAL_LAB_RATE"], ["ENCOUNTER_TYPE"], {"ABNORMAL_LAB_RATE": LAB_RESULTS}),
+])
+def test_routes_to_smallest_source_that_can_answer(planner, metrics, dimensions, expected):
+    assert planner.plan(_request(metrics, dimensions)).routes == expected
+
+
+def test_filter_dimension_must_be_available(planner):
+    plan = planner.plan(_request(["DENIAL_RATE"], ["MONTH"], [Filter("ENCOUNTER_TYPE", "=", "INPATIENT")]))
+    assert plan.routes == {"DENIAL_RATE": CLAIMS}
+    assert "(ENCOUNTER_TYPE = 'INPATIENT')" in plan.sql
+
+
+def test_row_counts_break_ties_between_aggregates(model):
+    model.sources["MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY"] = type(model.sources[KPI_VOLUME])(
+        "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY", "AGGREGATE", "test",
+        metrics={"ENCOUNTERS": "SUM(ENCOUNTERS)"}, dimensions={"MONTH": "MONTH_KEY"},
+    )
+    try:
+        request = _request(["ENCOUNTERS"], ["MONTH"])
+        small = QueryPlanner(model, {KPI_VOLUME: 40, "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY": 1200})
+        large = QueryPlanner(model, {KPI_VOLUME: 4000, "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY": 1200})
+        assert small.plan(request).routes["ENCOUNTERS"] == KPI_VOLUME
+        assert large.plan(request).routes["ENCOUNTERS"] == "MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY"
+    finally:
+        del model.sources["MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_ENCOUNTERS_DAILY"]
+
+
+def test_non_additive_rejection_is_explained(planner):
+    plan = planner.plan(_request(["MEDIAN_LOS"], ["YEAR"]))
+    assert "NON_ADDITIVE" in plan.explain()
+
+
+def test_unanswerable_requests_fail_with_reasons(planner):
+    with pytest.raises(PlanningError, match="has no PAYER_TYPE"):
+        planner.plan(_request(["ENCOUNTERS"], ["PAYER_TYPE"]))
+    with pytest.raises(ModelError, match="Unknown metric"):
+        planner.plan(_request(["BED_DAYS"]))
+    with pytest.raises(ModelError, match="Unknown dimension"):
+        planner.plan(_request(["ENCOUNTERS"], ["WEEK"]))
+
+
+def test_parse_filter():
+    assert parse_filter("year >= 2025") == Filter("YEAR", ">=", 2025)
+    assert parse_filter("MONTH = 2025-06-01") == Filter("MONTH", "=", date(2025, 6, 1))
+    assert parse_filter("PAYER_TYPE IN MEDICARE,MEDICAID") == Filter("PAYER_TYPE", "IN", ("MEDICARE", "MEDICAID"))
+    with pytest.raises(PlanningError):
+        parse_filter("YEAR ~ 2025")
+
+
+# ---------------------------------------------------------------------------
+# Result equivalence: every aggregate-routed plan must return the same rows as
+# the same request answered from the facts, on the medallion benchmark data.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def engine():
+    from tools.medallion_bench.bench import connect, run_scale
+    from tools.medallion_bench.translate import translate_file
+
+    con = connect(threads=2)
+    run_scale(0.2, date(2026, 3, 1), con=con)
+    con.execute(f"ATTACH ':memory:' AS {MODEL_SCHEMA.split('.')[0]}")
+    con.execute(f"CREATE SCHEMA {MODEL_SCHEMA}")
+    for statement in translate_file(MODEL_SCRIPT, date(2026, 3, 1)):
+        con.execute(statement.sql)
+    yield con
+    con.close()
+
+
+def _rows(con, sql):
+    return con.execute(sql).fetchall()
+
+
+def _same(left, right):
+    if len(left) != len(right):
+        return False
+    for a_row, b_row in zip(left, right):
+        for a, b in zip(a_row, b_row):
+            if isinstance(a, (int, float)) or isinstance(b, (int, float)):
+                if a is None or b is None or not math.isclose(float(a), float(b), rel_tol=1e-9, abs_tol=1e-6):
+                    return False
+            elif a != b:
+                return False
+    return True
+
+
+@pytest.mark.parametrize("metrics, dimensions, filters", [
+    (["ENCOUNTERS"], ["MONTH"], []),
+    (["ENCOUNTERS"], ["YEAR"], []),
+    (["ENCOUNTERS"], [], []),
+    (["INPATIENT_STAYS", "LOS_DAYS", "AVERAGE_LOS", "READMISSIONS", "READMISSION_RATE"], ["MONTH"], []),
+    (["AVERAGE_LOS", "READMISSION_RATE"], ["QUARTER"], []),
+    (["LOS_DAYS", "AVERAGE_LOS"], ["YEAR"], []),
+    (["MEDIAN_LOS"], ["MONTH"], []),
+    (["CLAIMS", "DENIED_CLAIMS", "DENIAL_RATE", "NET_REVENUE"], ["MONTH"], []),
+    (["DENIAL_RATE", "NET_REVENUE"], ["YEAR"], [Filter("YEAR", ">=", 2025)]),
+    (["ENCOUNTERS", "NET_REVENUE", "READMISSION_RATE"], ["QUARTER"], []),
+    (["ENCOUNTERS", "DENIAL_RATE"], [], []),
+])
+def test_aggregate_routes_match_fact_results(engine, model, metrics, dimensions, filters):
+    planner = QueryPlanner(model, source_row_counts(lambda sql: _rows(engine, sql), model))
+    request = _request(metrics, dimensions, filters)
+    routed = planner.plan(request)
+    facts = planner.plan(request, allow_aggregates=False)
+
+    assert any(source.startswith("MEDICORE_ANALYTICS_DB.DEV_EXECUTIVE.KPI_") for source in routed.routes.values())
+    assert not any("KPI_" in source for source in facts.routes.values())
+    routed_rows, fact_rows = _rows(engine, routed.sql), _rows(engine, facts.sql)
+    assert routed_rows
+    assert _same(routed_rows, fact_rows), (routed.sql, facts.sql)
+
+
+def test_lab_rollup_matches_lab_fact(engine, model):
+    """The abnormal lab trend panel's request, answered from the monthly rollup
+    and from the Gold lab fact."""
+    planner = QueryPlanner(model, source_row_counts(lambda sql: _rows(engine, sql), model))
+    [[department]] = _rows(engine, f"SELECT MIN(DEPARTMENT_NAME) FROM {LAB_RESULTS}")
+    request = _request(["LAB_TESTS", "ABNORMAL_LABS", "ABNORMAL_LAB_RATE"], ["MONTH", "DEPARTMENT_NAME"],
+                       [Filter("DEPARTMENT_NAME", "=", department), Filter("YEAR", ">=", 2025)])
+    routed = planner.plan(request)
+    facts = planner.plan(request, allow_aggregates=False)
+
+    assert set(routed.routes.values()) == {LAB_MONTHLY}
+    assert set(facts.routes.values()) == {LAB_RESULTS}
+    routed_rows = _rows(engine, routed.sql)
+    assert routed_rows
+    assert _same(routed_rows, _rows(engine, facts.sql)), (routed.sql, facts.sql)
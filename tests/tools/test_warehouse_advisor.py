@@ -0,0 +1,187 @@
+import csv
+from datetime import datetime, timedelta
+
+import pytest
+
+from tools.warehouse_advisor.advisor import (
+    Candidate,
+    QuotaCheck,
+    WarehouseRecommendation,
+    advise,
+    candidate_configs,
+    recommend_warehouse,
+)
+from tools.warehouse_advisor.simulator import (
+    QueryRecord,
+    SimulationResult,
+    WarehouseConfig,
+    normalize_size,
+    scaled_execution_seconds,
+    simulate,
+)
+from tools.warehouse_advisor.workload import Workload, load_workload
+
+T0 = datetime(2026, 3, 2, 8, 0, 0)
+
+
+def _query(offset_seconds, seconds, size="XSMALL", warehouse="MEDICORE_ADMIN_WH"):
+    return QueryRecord(warehouse, T0 + timedelta(seconds=offset_seconds), seconds, size)
+
+
+def test_normalize_size_accepts_query_history_labels():
+    assert normalize_size("X-Small") == "XSMALL"
+    assert normalize_size("2X-Large") == "XXLARGE"
+    assert normalize_size("Medium") == "MEDIUM"
+    assert normalize_size(None) is None
+
+
+def test_larger_size_runs_faster_but_not_linearly():
+    assert scaled_execution_seconds(100, "SMALL", "SMALL") == 100
+    faster = scaled_execution_seconds(100, "SMALL", "MEDIUM")
+    assert 50 < faster < 100
+
+
+def test_single_query_billed_for_minimum_plus_auto_suspend():
+    result = simulate([_query(0, 10)], WarehouseConfig("XSMALL", 60))
+    assert result.resume_count == 1
+    assert result.billed_seconds == pytest.approx(70)
+    assert result.credits == pytest.approx(70 / 3600)
+
+
+def test_short_session_billed_at_sixty_second_minimum():
+    result = simulate([_query(0, 1)], WarehouseConfig("XSMALL", 30))
+    assert result.billed_seconds == pytest.approx(60)
+
+
+def test_gap_longer_than_auto_suspend_causes_resume():
+    queries = [_query(0, 10), _query(1000, 10)]
+    assert simulate(queries, WarehouseConfig("XSMALL", 60)).resume_count == 2
+    assert simulate(queries, WarehouseConfig("XSMALL", 1200)).resume_count == 1
+
+
+def test_queueing_when_concurrency_exhausted():
+    queries = [_query(0, 100) for _ in range(3)]
+    config = WarehouseConfig("XSMALL", 60, max_concurrency_level=2)
+    result = simulate(queries, config)
+    assert sorted(result.queue_seconds) == [0, 0, 100]
+    assert result.max_queue_seconds == 100
+
+
+def test_standard_multi_cluster_removes_queueing_at_extra_cost():
+    queries = [_query(0, 100) for _ in range(3)]
+    single = simulate(queries, WarehouseConfig("XSMALL", 60, max_concurrency_level=2))
+    multi = simulate(queries, WarehouseConfig("XSMALL", 60, 1, 2, "STANDARD", max_concurrency_level=2))
+    assert multi.max_queue_seconds == 0
+    assert multi.credits > single.credits * 0.9
+
+
+def test_economy_policy_waits_for_enough_queued_work():
+    queries = [_query(0, 100) for _ in range(3)]
+    config = WarehouseConfig("XSMALL", 60, 1, 2, "ECONOMY", max_concurrency_level=2)
+    assert simulate(queries, config).max_queue_seconds == 100
+
+
+def test_enterprise_flag_controls_multi_cluster_candidates():
+    current = WarehouseConfig("SMALL", 120)
+    assert not any(c.is_multi_cluster for c in candidate_configs(current))
+    assert any(c.is_multi_cluster for c in candidate_configs(current, enterprise=True))
+
+
+def _bursty_analytics_workload(days=3):
+    queries = []
+    for day in range(days):
+        for burst in range(8):
+            start = day * 86400 + burst * 3600
+            for i in range(12):
+                queries.append(_query(start + i, 40, "SMALL", "MEDICORE_ANALYTICS_WH"))
+    return Workload(queries=queries)
+
+
+def test_recommendation_meets_queue_target_and_is_not_costlier_than_needed():
+    workload = _bursty_analytics_workload()
+    rec = recommend_warehouse(workload, "MEDICORE_ANALYTICS_WH")
+    assert rec.recommended.result.p95_queue_seconds <= rec.queue_target_seconds
+    meeting_target = [
+        c for c in rec.frontier if c.result.p95_queue_seconds <= rec.queue_target_seconds
+    ]
+    assert rec.recommended.monthly_credits <= min(c.monthly_credits for c in meeting_target) + 0.01
+
+
+def _recommendation(current, target):
+    def candidate(config):
+        return Candidate(config, SimulationResult(config, 86400), 10.0)
+
+    return WarehouseRecommendation("MEDICORE_ANALYTICS_WH", 0, 5.0, 1.0, candidate(current), candidate(target), [])
+
+
+@pytest.mark.parametrize("target, expected", [
+    (WarehouseConfig("SMALL", 120), None),
+    (WarehouseConfig("SMALL", 60),
+     "ALTER WAREHOUSE MEDICORE_ANALYTICS_WH SET\n    AUTO_SUSPEND = 60;"),
+    (WarehouseConfig("XSMALL", 120),
+     "ALTER WAREHOUSE MEDICORE_ANALYTICS_WH SET\n    WAREHOUSE_SIZE = 'XSMALL';"),
+    (WarehouseConfig("SMALL", 120, 1, 2, "ECONOMY"),
+     "ALTER WAREHOUSE MEDICORE_ANALYTICS_WH SET\n    MIN_CLUSTER_COUNT = 1\n    MAX_CLUSTER_COUNT = 2\n"
+     "    SCALING_POLICY = 'ECONOMY';"),
+])
+def test_alter_statement_only_lists_changed_settings(target, expected):
+    assert _recommendation(WarehouseConfig("SMALL", 120), target).alter_statement() == expected
+
+
+def test_calibration_uses_complete_months_only():
+    workload = _bursty_analytics_workload()
+    baseline = recommend_warehouse(workload, "MEDICORE_ANALYTICS_WH")
+    workload.monthly_credits["MEDICORE_ANALYTICS_WH"] = {
+        "2025-12": 0.25,
+        "2026-01": baseline.current.monthly_credits * 3,
+        "2026-02": baseline.current.monthly_credits * 3,
+        "2026-03": 0.5,
+    }
+    calibrated = recommend_warehouse(workload, "MEDICORE_ANALYTICS_WH")
+    assert calibrated.calibration_factor == pytest.approx(3, rel=1e-6)
+    assert calibrated.warnings
+
+
+def test_quota_status_thresholds():
+    def status(projected):
+        return QuotaCheck("M", 100, 0, projected).status
+
+    assert status(74.9) == "OK"
+    assert status(75) == "NOTIFY"
+    assert status(90) == "AT_RISK"
+    assert status(100) == "EXCEEDS"
+
+
+def test_advise_checks_every_monitor_and_account_covers_all_warehouses():
+    workload = _bursty_analytics_workload()
+    workload.queries += [_query(i * 600, 5) for i in range(50)]
+    recommendations, checks = advise(workload)
+    by_monitor = {c.monitor_name: c for c in checks}
+    assert set(by_monitor) == {
+        "MEDICORE_ACCOUNT_MONITOR",
+        "MEDICORE_ETL_MONITOR",
+        "MEDICORE_ANALYTICS_MONITOR",
+        "MEDICORE_ML_MONITOR",
+    }
+    assert by_monitor["MEDICORE_ACCOUNT_MONITOR"].projected_monthly_credits == pytest.approx(
+        sum(r.recommended.monthly_credits for r in recommendations)
+    )
+    assert by_monitor["MEDICORE_ETL_MONITOR"].projected_monthly_credits == 0
+
+
+def test_load_workload_reads_view_extracts(tmp_path):
+    with (tmp_path / "query_performance.csv").open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["WAREHOUSE_NAME", "WAREHOUSE_SIZE", "START_TIME",
+                         "WAREHOUSE_EXECUTION_SECONDS", "QUEUED_TIME_SECONDS"])
+        writer.writerow(["MEDICORE_ETL_WH", "Medium", "2026-03-01 02:00:00.000000-08:00", "12.5", "0"])
+        writer.writerow(["MEDICORE_ETL_WH", "", "2026-03-01 02:05:00.000000-08:00", "1", "0"])
+    with (tmp_path / "resource_monitor_status.csv").open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["MONITOR_NAME", "CREDIT_QUOTA", "USED_CREDITS"])
+        writer.writerow(["MEDICORE_ETL_MONITOR", "250", "10"])
+
+    workload = load_workload(tmp_path)
+    assert len(workload.queries) == 1
+    assert workload.queries[0].warehouse_size == "MEDIUM"
+    assert workload.monitor_quotas == {"MEDICORE_ETL_MONITOR": 250.0}
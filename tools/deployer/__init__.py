@@ -0,0 +1,19 @@
+from .catalog import Catalog, CatalogError, DeployObject, build_catalog, normalize
+from .plan import Change, DeployedState, DeploymentPlan, plan_deployment
+from .runner import ObjectResult, baseline, deploy, load_state
+
+__all__ = [
+    "Catalog",
+    "CatalogError",
+    "Change",
+    "DeployObject",
+    "DeployedState",
+    "DeploymentPlan",
+    "ObjectResult",
+    "baseline",
+    "build_catalog",
+    "deploy",
+    "load_state",
+    "normalize",
+    "plan_deployment",
+]
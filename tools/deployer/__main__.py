@@ -0,0 +1,84 @@
+"""
+Usage:
+    python -m tools.deployer plan --connection medicore [--diff]
+    python -m tools.deployer deploy --connection medicore [--workers 4] [--commit <sha>]
+    python -m tools.deployer baseline --connection medicore
+
+``plan`` compares the repository with MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE
+and prints what a deployment would run; without --connection it plans against
+an empty state. ``baseline`` records the current definitions as deployed
+without running them, to adopt an account that was deployed by hand.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from .catalog import DEFAULT_ROOTS, Catalog, CatalogError, build_catalog
+from .plan import plan_deployment
+from .runner import Connect, Execute, baseline, deploy, load_state, snowflake_connect
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.deployer")
+    parser.add_argument("--connection", help="connections.toml entry")
+    parser.add_argument("--root", action="append", type=Path,
+                        help="Script directory or file to deploy (repeatable); default infrastructure/11_medallion")
+    parser.add_argument("--commit", default=os.environ.get("GITHUB_SHA"), help="Commit recorded in the state")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan_cmd = commands.add_parser("plan", help="Show the changes a deployment would make")
+    plan_cmd.add_argument("--diff", action="store_true", help="Show definition diffs against the deployed state")
+
+    deploy_cmd = commands.add_parser("deploy", help="Deploy changed objects and their dependents")
+    deploy_cmd.add_argument("--workers", type=int, default=4, help="Objects deployed concurrently per wave")
+
+    commands.add_parser("baseline", help="Record the repository definitions as deployed, without running them")
+
+    args = parser.parse_args(argv)
+    if args.command != "plan" and not args.connection:
+        parser.error(f"{args.command} needs --connection")
+
+    try:
+        catalog = build_catalog(args.root or DEFAULT_ROOTS)
+    except CatalogError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    connect = snowflake_connect(args.connection) if args.connection else None
+    execute = connect() if connect else None
+    try:
+        return _run(args, catalog, connect, execute)
+    finally:
+        if execute:
+            execute.close()
+
+
+def _run(args: argparse.Namespace, catalog: Catalog, connect: Connect | None, execute: Execute | None) -> int:
+    if args.command == "baseline":
+        count = baseline(catalog, execute, git_commit=args.commit)
+        print(f"Recorded {count} objects as deployed.")
+        return 0
+
+    plan = plan_deployment(catalog, load_state(execute) if execute else {})
+    if args.command == "plan" or plan.is_empty:
+        print(plan.render(diff=getattr(args, "diff", False)))
+        return 0
+
+    print(plan.render())
+    print()
+    results = deploy(
+        plan, catalog, connect, workers=args.workers, git_commit=args.commit,
+        on_result=lambda r: print(f"  {r.status:<9} {r.action:<9} {r.name}  {r.seconds:.1f}s"
+                                  + (f"\n      {r.error}" if r.error else "")),
+    )
+    failed = [r for r in results if r.status != "SUCCEEDED"]
+    print(f"\n{len(results) - len(failed)} of {len(results)} objects deployed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
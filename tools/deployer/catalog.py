@@ -0,0 +1,238 @@
+"""
+Deployable objects parsed from the layer scripts.
+
+Every statement in a script is assigned to the object it acts on:
+
+  CREATE [OR REPLACE] [DYNAMIC] TABLE / VIEW x   defining statement
+  MERGE INTO x / INSERT INTO x                   loads (re-run with the definition)
+  ALTER ... x / GRANT ... ON ... x               post statements (idempotent)
+  CREATE SCHEMA IF NOT EXISTS                    prelude of every object in the script
+  USE / SELECT / SHOW / DESCRIBE                 skipped (session context, verification)
+
+Hashes are taken over a normalized form (comments removed, whitespace
+collapsed, upper-cased outside quotes), so reformatting a script or editing
+its comments is not a change. TARGET_LAG and WAREHOUSE of a dynamic table are
+kept out of the definition hash: they can be changed with ALTER, which does
+not re-initialize the table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..medallion_bench.translate import split_statements
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_ROOTS = (REPO_ROOT / "infrastructure" / "11_medallion",)
+
+ALTERABLE_PROPERTIES = ("TARGET_LAG", "WAREHOUSE")
+
+_NAME = r"([\w$]+(?:\.[\w$]+){0,2})"
+_CREATE = re.compile(
+    r"^CREATE\s+(OR\s+REPLACE\s+)?(?:(?:TRANSIENT|SECURE)\s+)?(DYNAMIC\s+TABLE|TABLE|VIEW)\s+"
+    r"(IF\s+NOT\s+EXISTS\s+)?" + _NAME,
+    re.IGNORECASE,
+)
+_OWNED = (
+    ("LOAD", re.compile(r"^(?:MERGE|INSERT)\s+INTO\s+" + _NAME, re.IGNORECASE)),
+    ("POST", re.compile(r"^ALTER\s+(?:DYNAMIC\s+)?(?:TABLE|VIEW)\s+(?:IF\s+EXISTS\s+)?" + _NAME, re.IGNORECASE)),
+    ("POST", re.compile(r"^GRANT\s+.+?\s+ON\s+(?:DYNAMIC\s+)?(?:TABLE|VIEW)\s+" + _NAME + r"\s+TO\b",
+                        re.IGNORECASE | re.DOTALL)),
+)
+_PRELUDE = re.compile(r"^CREATE\s+SCHEMA\s+IF\s+NOT\s+EXISTS\b", re.IGNORECASE)
+_SKIPPED = re.compile(r"^(USE|SELECT|SHOW|DESCRIBE|DESC|WITH)\b", re.IGNORECASE)
+_REFERENCE = re.compile(r"\b(MEDICORE_\w+_DB\.\w+\.\w+)\b", re.IGNORECASE)
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def normalize(sql: str) -> str:
+    """Whitespace- and case-insensitive form of a comment-free statement.
+    Quoted strings and quoted identifiers are kept verbatim."""
+    parts, i, n = [], 0, len(sql)
+    while i < n:
+        quote = sql[i]
+        if quote in ("'", '"'):
+            end = i + 1
+            while end < n:
+                if sql[end] == quote and end + 1 < n and sql[end + 1] == quote:
+                    end += 2
+                    continue
+                if sql[end] == quote:
+                    break
+                end += 1
+            parts.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        end = i
+        while end < n and sql[end] not in ("'", '"'):
+            end += 1
+        chunk = re.sub(r"\s+", " ", sql[i:end]).upper()
+        chunk = re.sub(r"\s*([(),=;])\s*", r"\1", chunk)
+        parts.append(chunk)
+        i = end
+    return "".join(parts).strip().rstrip(";")
+
+
+def _unquoted(sql: str) -> str:
+    return re.sub(r"'(?:[^']|'')*'", "''", sql)
+
+
+def sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class DeployObject:
+    name: str
+    kind: str
+    replaces: bool
+    script: str
+    create: str
+    prelude: list[str] = field(default_factory=list)
+    loads: list[str] = field(default_factory=list)
+    post: list[str] = field(default_factory=list)
+    dependencies: set[str] = field(default_factory=set)
+
+    @property
+    def properties(self) -> dict[str, str]:
+        if self.kind != "DYNAMIC TABLE":
+            return {}
+        header = self._header(normalize(self.create))
+        found = {}
+        for prop in ALTERABLE_PROPERTIES:
+            match = re.search(rf"\b{prop}=('(?:[^']|'')*'|[\w$]+)", header)
+            if match:
+                found[prop] = match.group(1)
+        return found
+
+    @staticmethod
+    def _header(normalized: str) -> str:
+        # Everything before the top-level AS that starts the query.
+        match = re.search(r"\bAS\b", _unquoted(normalized))
+        return normalized[:match.start()] if match else normalized
+
+    @property
+    def definition_hash(self) -> str:
+        create = normalize(self.create)
+        header = self._header(create)
+        body = create[len(header):]
+        for prop in ALTERABLE_PROPERTIES:
+            header = re.sub(rf"\b{prop}=('(?:[^']|'')*'|[\w$]+)", "", header)
+        return sha256("\n".join([header + body, *(normalize(s) for s in self.loads)]))
+
+    @property
+    def post_hash(self) -> str:
+        return sha256("\n".join(normalize(s) for s in self.post))
+
+    @property
+    def definition_text(self) -> str:
+        return "\n\n".join(
+            "\n".join(line.rstrip() for line in s.strip().splitlines() if line.strip()) + ";"
+            for s in (self.create, *self.loads, *self.post)
+        )
+
+    def statements(self) -> list[str]:
+        return [*self.prelude, self.create, *self.loads, *self.post]
+
+
+@dataclass
+class Catalog:
+    objects: dict[str, DeployObject]
+    unowned: list[tuple[str, str]] = field(default_factory=list)
+
+    def dependents(self, name: str) -> set[str]:
+        return {o.name for o in self.objects.values() if name in o.dependencies}
+
+    def topological_order(self, names: set[str] | None = None) -> list[list[str]]:
+        """Waves of objects: each wave only depends on earlier waves."""
+        names = set(self.objects) if names is None else set(names)
+        remaining = {n: self.objects[n].dependencies & names for n in names}
+        waves = []
+        while remaining:
+            ready = sorted(n for n, deps in remaining.items() if not deps)
+            if not ready:
+                raise CatalogError(f"Dependency cycle between: {', '.join(sorted(remaining))}")
+            waves.append(ready)
+            for n in ready:
+                del remaining[n]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return waves
+
+
+def _scripts(roots) -> list[Path]:
+    paths = []
+    for root in roots:
+        root = Path(root)
+        found = [root] if root.is_file() else sorted(root.rglob("*.sql"))
+        paths.extend(p for p in found if not p.name.startswith("99_") and p.stat().st_size)
+    return paths
+
+
+def _relative(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def build_catalog(roots=DEFAULT_ROOTS) -> Catalog:
+    objects: dict[str, DeployObject] = {}
+    unowned: list[tuple[str, str]] = []
+    for path in _scripts(roots):
+        script = _relative(path)
+        prelude, in_script = [], []
+        pending: list[tuple[str, str, str]] = []
+        for statement in split_statements(path.read_text()):
+            if _SKIPPED.match(statement):
+                continue
+            if _PRELUDE.match(statement):
+                prelude.append(statement)
+                continue
+            create = _CREATE.match(statement)
+            if create:
+                name = create.group(4).upper()
+                if name in objects:
+                    raise CatalogError(f"{name} is defined in both {objects[name].script} and {script}")
+                objects[name] = DeployObject(
+                    name=name,
+                    kind=" ".join(create.group(2).upper().split()),
+                    replaces=bool(create.group(1)),
+                    script=script,
+                    create=statement,
+                )
+                in_script.append(objects[name])
+                continue
+            for role, pattern in _OWNED:
+                match = pattern.match(statement)
+                if match:
+                    pending.append((role, match.group(1).upper(), statement))
+                    break
+            else:
+                unowned.append((script, statement.split("\n", 1)[0][:80]))
+        for role, name, statement in pending:
+            owner = objects.get(name)
+            if owner is None or owner.script != script:
+                unowned.append((script, statement.split("\n", 1)[0][:80]))
+            elif role == "LOAD":
+                owner.loads.append(statement)
+            else:
+                owner.post.append(statement)
+        for obj in in_script:
+            obj.prelude = list(prelude)
+
+    for obj in objects.values():
+        referenced = {
+            ref.upper()
+            for statement in (obj.create, *obj.loads)
+            for ref in _REFERENCE.findall(_unquoted(statement))
+        }
+        obj.dependencies = (referenced & set(objects)) - {obj.name}
+    return Catalog(objects, unowned)
@@ -0,0 +1,181 @@
+"""
+Deployment plan: the smallest set of statements that brings the deployed
+objects in line with the repository.
+
+Actions, per object:
+
+  CREATE     not in the deployment state                     full statement group
+  REPLACE    CREATE OR REPLACE object whose definition changed full statement group
+  APPLY      CREATE ... IF NOT EXISTS object whose definition
+             or loads changed (Silver tables)                 full statement group
+  ALTER      only TARGET_LAG / WAREHOUSE or ALTER / GRANT
+             statements changed                               ALTER ... SET, post statements
+  REFRESH    dynamic table downstream of a re-created object  ALTER DYNAMIC TABLE ... REFRESH
+  REDEPLOY   table or view downstream of a re-created object  full statement group
+  UNCHANGED                                                   nothing
+
+CREATE, REPLACE, REFRESH and REDEPLOY propagate to dependents. APPLY does not:
+it changes rows in place, which dynamic tables pick up on their own schedule.
+Dynamic-table dependents are refreshed rather than re-created, so the rest of
+the graph is not re-initialized. Objects that are in the state but no longer
+in the repository are reported as orphaned and never dropped.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+from dataclasses import dataclass, field
+
+from .catalog import Catalog, DeployObject
+
+
+PROPAGATING = ("CREATE", "REPLACE", "REFRESH", "REDEPLOY")
+
+
+@dataclass(frozen=True)
+class DeployedState:
+    name: str
+    kind: str
+    script: str
+    definition_hash: str
+    properties: dict[str, str]
+    post_hash: str | None
+    definition_text: str | None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> DeployedState:
+        name, kind, script, definition_hash, properties, post_hash, definition_text = row
+        return cls(name, kind, script, definition_hash, json.loads(properties or "{}"), post_hash, definition_text)
+
+
+@dataclass
+class Change:
+    name: str
+    action: str
+    reason: str
+    statements: list[str] = field(default_factory=list)
+    diff: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DeploymentPlan:
+    changes: dict[str, Change]
+    waves: list[list[str]]
+    unchanged: list[str]
+    orphaned: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changes
+
+    def counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for change in self.changes.values():
+            counts[change.action] = counts.get(change.action, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        counts = self.counts()
+        parts = [f"{counts[a]} {a.lower()}" for a in ("CREATE", "REPLACE", "APPLY", "ALTER", "REFRESH", "REDEPLOY")
+                 if a in counts]
+        parts.append(f"{len(self.unchanged)} unchanged")
+        if self.orphaned:
+            parts.append(f"{len(self.orphaned)} orphaned")
+        return "Plan: " + ", ".join(parts)
+
+    def render(self, diff: bool = False) -> str:
+        lines = [self.summary()]
+        for number, wave in enumerate(self.waves, start=1):
+            lines.append(f"\nWave {number}:")
+            for name in wave:
+                change = self.changes[name]
+                lines.append(f"  {change.action:<9} {name}  ({change.reason})")
+                if diff and change.diff:
+                    lines.extend("      " + line for line in change.diff)
+        for name in self.orphaned:
+            lines.append(f"\n  ORPHANED  {name}  (in deployment state, not in the repository; drop it manually)")
+        for warning in self.warnings:
+            lines.append(f"\nWARNING: {warning}")
+        return "\n".join(lines)
+
+
+def _alter_properties(obj: DeployObject, previous: dict[str, str]) -> list[str]:
+    changed = {k: v for k, v in obj.properties.items() if previous.get(k) != v}
+    if not changed:
+        return []
+    settings = " ".join(f"{k} = {v}" for k, v in changed.items())
+    return [f"ALTER DYNAMIC TABLE {obj.name} SET {settings}"]
+
+
+def _diff(previous: DeployedState | None, obj: DeployObject) -> list[str]:
+    before = (previous.definition_text or "") if previous else ""
+    return list(difflib.unified_diff(
+        before.splitlines(), obj.definition_text.splitlines(),
+        fromfile="deployed", tofile=obj.script, lineterm="", n=2,
+    ))
+
+
+def _direct_change(obj: DeployObject, previous: DeployedState | None) -> Change | None:
+    if previous is None:
+        return Change(obj.name, "CREATE", "new object", obj.statements(), _diff(None, obj))
+    if previous.definition_hash != obj.definition_hash:
+        action = "REPLACE" if obj.replaces else "APPLY"
+        return Change(obj.name, action, "definition changed", obj.statements(), _diff(previous, obj))
+    removed = set(previous.properties) - set(obj.properties)
+    if removed:
+        # There is nothing to ALTER back to; re-create with the repository defaults.
+        reason = f"{', '.join(sorted(removed))} removed from definition"
+        return Change(obj.name, "REPLACE", reason, obj.statements(), _diff(previous, obj))
+    statements = _alter_properties(obj, previous.properties)
+    reasons = [f"{k} {previous.properties.get(k)} -> {v}" for k, v in obj.properties.items()
+               if previous.properties.get(k) != v]
+    if (previous.post_hash or "") != obj.post_hash:
+        statements += obj.post
+        reasons.append("ALTER / GRANT statements changed")
+    if statements:
+        return Change(obj.name, "ALTER", "; ".join(reasons), statements, _diff(previous, obj))
+    return None
+
+
+def plan_deployment(catalog: Catalog, state: dict[str, DeployedState]) -> DeploymentPlan:
+    changes: dict[str, Change] = {}
+    warnings: list[str] = []
+    for obj in catalog.objects.values():
+        change = _direct_change(obj, state.get(obj.name))
+        if change is None:
+            continue
+        changes[obj.name] = change
+        if change.action == "APPLY":
+            warnings.append(
+                f"{obj.name} is created with IF NOT EXISTS: its statements are re-run, but column "
+                f"changes are not applied to the existing table. Add an ALTER TABLE if its columns changed."
+            )
+
+    queue = [name for name, change in changes.items() if change.action in PROPAGATING]
+    while queue:
+        upstream = queue.pop(0)
+        for name in sorted(catalog.dependents(upstream)):
+            existing = changes.get(name)
+            if existing is not None and existing.action != "ALTER":
+                continue
+            obj = catalog.objects[name]
+            reason = f"upstream {upstream.split('.')[-1]} {changes[upstream].action.lower()}"
+            if obj.kind == "DYNAMIC TABLE":
+                prior = existing.statements if existing else []
+                change = Change(name, "REFRESH", reason, [*prior, f"ALTER DYNAMIC TABLE {name} REFRESH"])
+            else:
+                change = Change(name, "REDEPLOY", reason, obj.statements())
+            if existing is not None:
+                change.reason = f"{existing.reason}; {reason}"
+                change.diff = existing.diff
+            changes[name] = change
+            queue.append(name)
+
+    unchanged = sorted(set(catalog.objects) - set(changes))
+    orphaned = sorted(set(state) - set(catalog.objects))
+    waves = catalog.topological_order(set(changes))
+    for script, statement in catalog.unowned:
+        warnings.append(f"{script}: statement not owned by an object in the same script is not deployed: {statement}")
+    return DeploymentPlan(changes, waves, unchanged, orphaned, warnings)
@@ -0,0 +1,185 @@
+"""
+Execution of a deployment plan and the deployment state it is planned against.
+
+Statements run through an ``Execute`` callable (``execute(sql, params)`` with
+qmark parameters, returning rows as tuples), so the same code drives
+Snowflake through Snowpark and DuckDB in the tests. Objects within a wave are
+independent and run concurrently, each worker thread on its own session from
+``connect``; an executor with a ``close`` attribute is closed once the
+deployment finishes. A wave only starts when the previous one fully succeeded.
+
+REFRESH and REDEPLOY changes exist only because something upstream was
+re-created, so an object's state is recorded only once every such change
+downstream of it has succeeded. If a later wave fails, the object stays out of
+date in the state and the next plan re-creates it and its dependents again.
+
+USE statements in the scripts are not executed: objects are fully qualified
+and the deployer runs with the role and warehouse of its connection.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from .catalog import Catalog, DeployObject
+from .plan import DeployedState, DeploymentPlan
+
+
+STATE_TABLE = "MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_STATE"
+HISTORY_TABLE = "MEDICORE_GOVERNANCE_DB.AUDIT.DEPLOYMENT_HISTORY"
+
+Execute = Callable[..., list[tuple]]
+Connect = Callable[[], Execute]
+
+
+@dataclass
+class ObjectResult:
+    name: str
+    action: str
+    status: str
+    wave: int
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def load_state(execute: Execute) -> dict[str, DeployedState]:
+    rows = execute(
+        f"SELECT OBJECT_NAME, OBJECT_KIND, SCRIPT_PATH, DEFINITION_HASH, PROPERTIES, POST_HASH, DEFINITION_TEXT "
+        f"FROM {STATE_TABLE}"
+    )
+    return {row[0]: DeployedState.from_row(row) for row in rows}
+
+
+def record_state(execute: Execute, obj: DeployObject, deployment_id: str, git_commit: str | None) -> None:
+    execute(f"DELETE FROM {STATE_TABLE} WHERE OBJECT_NAME = ?", (obj.name,))
+    execute(
+        f"INSERT INTO {STATE_TABLE} (OBJECT_NAME, OBJECT_KIND, SCRIPT_PATH, DEFINITION_HASH, PROPERTIES, "
+        f"POST_HASH, DEFINITION_TEXT, DEPLOYMENT_ID, GIT_COMMIT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (obj.name, obj.kind, obj.script, obj.definition_hash, json.dumps(obj.properties, sort_keys=True),
+         obj.post_hash, obj.definition_text, deployment_id, git_commit),
+    )
+
+
+def record_history(
+    execute: Execute, deployment_id: str, result: ObjectResult, reason: str, git_commit: str | None
+) -> None:
+    execute(
+        f"INSERT INTO {HISTORY_TABLE} (DEPLOYMENT_ID, OBJECT_NAME, ACTION, STATUS, REASON, WAVE, "
+        f"ELAPSED_SECONDS, ERROR_MESSAGE, GIT_COMMIT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (deployment_id, result.name, result.action, result.status, reason[:500], result.wave,
+         round(result.seconds, 3), result.error, git_commit),
+    )
+
+
+def baseline(
+    catalog: Catalog, execute: Execute, deployment_id: str | None = None, git_commit: str | None = None
+) -> int:
+    """Record the repository definitions as deployed without running them.
+    Used once to adopt objects that already exist in the account."""
+    deployment_id = deployment_id or str(uuid.uuid4())
+    for obj in catalog.objects.values():
+        record_state(execute, obj, deployment_id, git_commit)
+        record_history(execute, deployment_id, ObjectResult(obj.name, "BASELINE", "SUCCEEDED", 0), "adopted", git_commit)
+    return len(catalog.objects)
+
+
+def _propagated_dependents(plan: DeploymentPlan, catalog: Catalog) -> dict[str, set[str]]:
+    """REFRESH / REDEPLOY changes of the plan downstream of each planned object."""
+    result: dict[str, set[str]] = {}
+    for name in plan.changes:
+        seen: set[str] = set()
+        stack = [name]
+        while stack:
+            for dependent in catalog.dependents(stack.pop()):
+                if dependent in plan.changes and dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        result[name] = {n for n in seen if plan.changes[n].action in ("REFRESH", "REDEPLOY")}
+    return result
+
+
+def deploy(
+    plan: DeploymentPlan,
+    catalog: Catalog,
+    connect: Connect,
+    workers: int = 4,
+    deployment_id: str | None = None,
+    git_commit: str | None = None,
+    on_result: Callable[[ObjectResult], None] | None = None,
+) -> list[ObjectResult]:
+    deployment_id = deployment_id or str(uuid.uuid4())
+    sessions = threading.local()
+    opened: list[Execute] = []
+    pending = _propagated_dependents(plan, catalog)
+
+    def session() -> Execute:
+        if not hasattr(sessions, "execute"):
+            sessions.execute = connect()
+            opened.append(sessions.execute)
+        return sessions.execute
+
+    def run(name: str, wave: int) -> ObjectResult:
+        change = plan.changes[name]
+        execute = session()
+        result = ObjectResult(name, change.action, "SUCCEEDED", wave)
+        started = time.perf_counter()
+        try:
+            for statement in change.statements:
+                execute(statement)
+        except Exception as exc:  # recorded per object; the wave's other objects still finish
+            result.status, result.error = "FAILED", str(exc)
+        result.seconds = time.perf_counter() - started
+        if result.status == "SUCCEEDED" and not pending[name]:
+            record_state(execute, catalog.objects[name], deployment_id, git_commit)
+        record_history(execute, deployment_id, result, change.reason, git_commit)
+        return result
+
+    results: list[ObjectResult] = []
+    failed = False
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for number, wave in enumerate(plan.waves, start=1):
+                if failed:
+                    wave_results = [ObjectResult(name, plan.changes[name].action, "SKIPPED", number) for name in wave]
+                    for result in wave_results:
+                        record_history(session(), deployment_id, result, plan.changes[result.name].reason, git_commit)
+                else:
+                    wave_results = list(pool.map(lambda name: run(name, number), wave))
+                    failed = any(r.status == "FAILED" for r in wave_results)
+                for result in wave_results:
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+
+        succeeded = {r.name for r in results if r.status == "SUCCEEDED"}
+        for name in sorted(succeeded):
+            if pending[name] and pending[name] <= succeeded:
+                record_state(session(), catalog.objects[name], deployment_id, git_commit)
+    finally:
+        for execute in opened:
+            if hasattr(execute, "close"):
+                execute.close()
+    return results
+
+
+def snowflake_connect(connection_name: str) -> Connect:
+    """Factory of Snowpark sessions, one per calling thread. Each executor's
+    ``close`` closes its session."""
+    from snowflake.snowpark import Session
+
+    def connect() -> Execute:
+        session = Session.builder.config("connection_name", connection_name).create()
+
+        def execute(sql: str, params=()) -> list[tuple]:
+            return [tuple(row) for row in session.sql(sql, params=list(params) or None).collect()]
+
+        execute.close = session.close
+        return execute
+
+    return connect
@@ -0,0 +1,16 @@
+from .history import RefreshHistory, RefreshRecord, load_history
+from .lint import Finding, find_full_refresh_constructs
+from .profiler import LagRecommendation, LagTier, TableProfile, profile_tables, recommend_lags
+
+__all__ = [
+    "Finding",
+    "LagRecommendation",
+    "LagTier",
+    "RefreshHistory",
+    "RefreshRecord",
+    "TableProfile",
+    "find_full_refresh_constructs",
+    "load_history",
+    "profile_tables",
+    "recommend_lags",
+]
@@ -0,0 +1,128 @@
+"""
+Usage:
+    python -m tools.dt_profiler export --connection medicore --out dt_history/ [--days 7]
+    python -m tools.dt_profiler report [--history dt_history/] [--max-lag DEV_CLINICAL='30 minutes']
+        [--format json]
+
+Without --history the report covers what the scripts alone can tell: the
+constructs that force full refreshes and the DOWNSTREAM / tier lags.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+from ..deployer.catalog import DEFAULT_ROOTS, build_catalog
+from .history import DEFAULT_DATABASES, RefreshHistory, export_history, load_history
+from .profiler import DEFAULT_TIERS, LagTier, parse_lag, profile_tables, recommend_lags, warehouse_summary
+
+
+def _tier_override(text: str) -> LagTier:
+    suffix, _, lag = text.partition("=")
+    if not suffix or not lag:
+        raise argparse.ArgumentTypeError(f"expected SCHEMA_SUFFIX=LAG, got {text!r}")
+    try:
+        parse_lag(lag)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+    return LagTier(suffix.upper(), suffix.upper(), lag.strip().strip("'"))
+
+
+def _fmt(value, pattern="{:.1f}") -> str:
+    return "-" if value is None or (isinstance(value, float) and math.isnan(value)) else pattern.format(value)
+
+
+def _print_text(profiles, recommendations, warehouses) -> None:
+    by_table = {r.table_name: r for r in recommendations}
+    for profile in profiles.values():
+        rec = by_table.get(profile.table_name)
+        print(f"== {profile.table_name}")
+        mode = f"declared {profile.declared_mode or '-'}, effective {profile.effective_mode}"
+        if profile.mode_reason:
+            mode += f" ({profile.mode_reason})"
+        print(f"   refresh mode:  {mode}")
+        if profile.refreshes:
+            actions = ", ".join(f"{k} {v}" for k, v in sorted(profile.actions.items()))
+            print(f"   refreshes:     {profile.refreshes} ({actions}; failed {profile.failed})")
+            print(f"   duration:      p50 {_fmt(profile.p50_seconds)}s  p95 {_fmt(profile.p95_seconds)}s")
+            print(f"   rows changed:  {profile.rows_changed:,}   credits {profile.credits:.2f}")
+            print(f"   data every:    ~{_fmt(profile.data_interval_minutes, '{:.0f}')} min (median)")
+        if profile.readers:
+            print(f"   queried by:    {', '.join(profile.readers)}")
+        for finding in profile.findings:
+            print(f"   {finding.severity:<5} {finding.rule}: {finding.detail}")
+        if rec:
+            print(f"   target lag:    {rec.current_lag} -> {rec.recommended_lag}  [{rec.tier}] {rec.reason}")
+            if rec.projected_refreshes is not None:
+                print(f"   projected:     {rec.current_refreshes} -> {rec.projected_refreshes} data refreshes, "
+                      f"{_fmt(rec.current_credits, '{:.2f}')} -> {_fmt(rec.projected_credits, '{:.2f}')} credits")
+        print()
+
+    for warehouse, entry in warehouses.items():
+        print(f"== {warehouse}: {_fmt(entry['attributed_credits'], '{:.2f}')} credits attributed to refreshes "
+              f"of {_fmt(entry['metered_credits'], '{:.2f}')} metered "
+              f"({_fmt(entry['attributed_share'] * 100, '{:.0f}')}%); the rest is idle time before auto-suspend")
+
+    statements = [r for r in recommendations if r.alter_statement()]
+    if statements:
+        print()
+        print("-- Recommended TARGET_LAG changes (review before running as MEDICORE_DATA_ENGINEER).")
+        print("-- Make the same change in each script so tools/deployer records it.")
+        for rec in statements:
+            print(f"{rec.alter_statement():<100} -- {rec.script}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.dt_profiler")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Extract refresh history to CSV")
+    export.add_argument("--connection", required=True, help="connections.toml entry")
+    export.add_argument("--out", type=Path, required=True)
+    export.add_argument("--days", type=int, default=7)
+    export.add_argument("--database", action="append", help="Database to profile (repeatable)")
+
+    report = commands.add_parser("report", help="Profile refreshes and recommend target lags")
+    report.add_argument("--history", type=Path, help="Directory written by export")
+    report.add_argument("--root", action="append", type=Path,
+                        help="Script directory holding the dynamic tables; default infrastructure/11_medallion")
+    report.add_argument("--max-lag", action="append", type=_tier_override, default=[],
+                        help="Tier override, e.g. DEV_CLINICAL='30 minutes'")
+    report.add_argument("--format", choices=("text", "json"), default="text")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        databases = tuple(d.upper() for d in args.database) if args.database else DEFAULT_DATABASES
+        for path in export_history(args.connection, args.out, databases, args.days):
+            print(path)
+        return 0
+
+    history = load_history(args.history) if args.history else RefreshHistory()
+    if args.history and not history.refreshes:
+        print(f"No refreshes found in {args.history / 'refresh_history.csv'}", file=sys.stderr)
+        return 1
+    catalog = build_catalog(args.root or DEFAULT_ROOTS)
+    profiles = profile_tables(catalog, history)
+    recommendations = recommend_lags(catalog, profiles, history, tuple(args.max_lag) + DEFAULT_TIERS)
+    warehouses = warehouse_summary(profiles, history) if args.history else {}
+
+    if args.format == "json":
+        json.dump({
+            "window_days": round(history.window_days(), 2),
+            "tables": [p.as_dict() for p in profiles.values()],
+            "recommendations": [r.as_dict() for r in recommendations],
+            "warehouses": warehouses,
+        }, sys.stdout, indent=2, default=str)
+        print()
+    else:
+        _print_text(profiles, recommendations, warehouses)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Refresh-history extract for the dynamic-table profiler.
+
+Like the warehouse advisor, the profiler runs offline against CSV extracts,
+so a recommendation can be reproduced and reviewed without a live
+connection. ``export_history`` pulls the extracts through Snowpark;
+``load_history`` reads them back.
+
+Per-refresh credits come from QUERY_ATTRIBUTION_HISTORY, which attributes
+warehouse compute to the refresh query. Warehouse time that is not
+attributed to any query (auto-suspend idle time after each refresh) shows
+up as the gap between WAREHOUSE_METERING_HISTORY and the attributed total.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+
+ACCOUNT_USAGE = "SNOWFLAKE.ACCOUNT_USAGE"
+DEFAULT_DATABASES = ("MEDICORE_ANALYTICS_DB", "MEDICORE_AI_READY_DB")
+
+# REFRESH_ACTION values in DYNAMIC_TABLE_REFRESH_HISTORY.
+DATA_ACTIONS = ("INCREMENTAL", "FULL", "REINITIALIZE")
+
+
+def extracts(databases: tuple[str, ...], days: int) -> dict[str, str]:
+    in_list = ", ".join(f"'{d}'" for d in databases)
+    return {
+        "refresh_history": f"""
+            SELECT h.DATABASE_NAME || '.' || h.SCHEMA_NAME || '.' || h.NAME AS TABLE_NAME,
+                   h.REFRESH_ACTION, h.STATE, h.REFRESH_TRIGGER,
+                   h.REFRESH_START_TIME, h.REFRESH_END_TIME,
+                   h.STATISTICS:numInsertedRows::NUMBER AS ROWS_INSERTED,
+                   h.STATISTICS:numDeletedRows::NUMBER  AS ROWS_DELETED,
+                   q.CREDITS_ATTRIBUTED_COMPUTE          AS CREDITS
+            FROM {ACCOUNT_USAGE}.DYNAMIC_TABLE_REFRESH_HISTORY h
+            LEFT JOIN {ACCOUNT_USAGE}.QUERY_ATTRIBUTION_HISTORY q
+                ON q.QUERY_ID = h.QUERY_ID
+            WHERE h.DATABASE_NAME IN ({in_list})
+              AND h.REFRESH_START_TIME >= DATEADD('day', -{int(days)}, CURRENT_TIMESTAMP())
+            ORDER BY h.REFRESH_START_TIME
+        """,
+        "warehouse_metering": f"""
+            SELECT WAREHOUSE_NAME, START_TIME, CREDITS_USED_COMPUTE
+            FROM {ACCOUNT_USAGE}.WAREHOUSE_METERING_HISTORY
+            WHERE START_TIME >= DATEADD('day', -{int(days)}, CURRENT_TIMESTAMP())
+            ORDER BY START_TIME
+        """,
+    }
+
+
+@dataclass(frozen=True)
+class RefreshRecord:
+    table_name: str
+    action: str
+    state: str
+    start_time: datetime
+    end_time: datetime | None
+    rows_inserted: int = 0
+    rows_deleted: int = 0
+    credits: float | None = None
+    trigger: str = "SCHEDULED"
+
+    @property
+    def seconds(self) -> float:
+        return (self.end_time - self.start_time).total_seconds() if self.end_time else 0.0
+
+    @property
+    def carries_data(self) -> bool:
+        return self.action in DATA_ACTIONS and self.state == "SUCCEEDED"
+
+
+@dataclass(frozen=True)
+class DynamicTableInfo:
+    table_name: str
+    target_lag: str
+    refresh_mode: str
+    refresh_mode_reason: str | None
+    warehouse: str
+
+
+@dataclass
+class RefreshHistory:
+    refreshes: list[RefreshRecord] = field(default_factory=list)
+    tables: dict[str, DynamicTableInfo] = field(default_factory=dict)
+    metered_credits: dict[str, float] = field(default_factory=dict)
+
+    def for_table(self, table_name: str) -> list[RefreshRecord]:
+        return [r for r in self.refreshes if r.table_name == table_name]
+
+    def window_days(self) -> float:
+        if not self.refreshes:
+            return 0.0
+        starts = [r.start_time for r in self.refreshes]
+        return max((max(starts) - min(starts)).total_seconds() / 86400, 1.0)
+
+
+def _write_csv(path: Path, rows) -> None:
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        if rows:
+            writer.writerow(rows[0].as_dict().keys())
+            writer.writerows(row.as_dict().values() for row in rows)
+
+
+def export_history(
+    connection_name: str, out_dir: Path, databases: tuple[str, ...] = DEFAULT_DATABASES, days: int = 7
+) -> list[Path]:
+    """Write the refresh history, warehouse metering and SHOW DYNAMIC TABLES
+    extracts into ``out_dir``."""
+    from snowflake.snowpark import Session
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    session = Session.builder.config("connection_name", connection_name).create()
+    written = []
+    try:
+        for name, sql in extracts(databases, days).items():
+            path = out_dir / f"{name}.csv"
+            _write_csv(path, session.sql(sql).collect())
+            written.append(path)
+        rows = []
+        for database in databases:
+            session.sql(f"SHOW DYNAMIC TABLES IN DATABASE {database}").collect()
+            rows += session.sql(
+                'SELECT "database_name" || \'.\' || "schema_name" || \'.\' || "name" AS TABLE_NAME, '
+                '"target_lag" AS TARGET_LAG, "refresh_mode" AS REFRESH_MODE, '
+                '"refresh_mode_reason" AS REFRESH_MODE_REASON, "warehouse" AS WAREHOUSE '
+                "FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))"
+            ).collect()
+        path = out_dir / "dynamic_tables.csv"
+        _write_csv(path, rows)
+        written.append(path)
+    finally:
+        session.close()
+    return written
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    if not path.exists():
+        return []
+    with path.open(newline="") as handle:
+        return [{k.upper(): v for k, v in row.items()} for row in csv.DictReader(handle)]
+
+
+def _parse_time(value: str) -> datetime | None:
+    value = (value or "").strip()
+    if not value:
+        return None
+    # Snowpark writes TIMESTAMP_LTZ as '2026-03-01 08:00:00.123000-08:00'
+    return datetime.fromisoformat(value.replace(" ", "T", 1))
+
+
+def _number(value: str | None) -> float | None:
+    return float(value) if value not in (None, "") else None
+
+
+def load_history(directory: Path) -> RefreshHistory:
+    history = RefreshHistory()
+
+    for row in _read_csv(directory / "refresh_history.csv"):
+        history.refreshes.append(RefreshRecord(
+            table_name=row["TABLE_NAME"].upper(),
+            action=row["REFRESH_ACTION"].upper(),
+            state=row["STATE"].upper(),
+            start_time=_parse_time(row["REFRESH_START_TIME"]),
+            end_time=_parse_time(row.get("REFRESH_END_TIME")),
+            rows_inserted=int(_number(row.get("ROWS_INSERTED")) or 0),
+            rows_deleted=int(_number(row.get("ROWS_DELETED")) or 0),
+            credits=_number(row.get("CREDITS")),
+            trigger=(row.get("REFRESH_TRIGGER") or "SCHEDULED").upper(),
+        ))
+
+    for row in _read_csv(directory / "dynamic_tables.csv"):
+        name = row["TABLE_NAME"].upper()
+        history.tables[name] = DynamicTableInfo(
+            table_name=name,
+            target_lag=row["TARGET_LAG"],
+            refresh_mode=row["REFRESH_MODE"].upper(),
+            refresh_mode_reason=row.get("REFRESH_MODE_REASON") or None,
+            warehouse=row["WAREHOUSE"].upper(),
+        )
+
+    for row in _read_csv(directory / "warehouse_metering.csv"):
+        warehouse = row["WAREHOUSE_NAME"].upper()
+        history.metered_credits[warehouse] = (
+            history.metered_credits.get(warehouse, 0.0) + (_number(row["CREDITS_USED_COMPUTE"]) or 0.0)
+        )
+
+    return history
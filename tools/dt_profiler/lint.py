@@ -0,0 +1,93 @@
+"""
+Static checks for dynamic-table definitions that cannot refresh incrementally.
+
+With REFRESH_MODE = AUTO, Snowflake picks the refresh mode once, at creation.
+If the query contains a construct that incremental refresh does not support,
+the table silently becomes FULL and recomputes every row on every refresh.
+SHOW DYNAMIC TABLES reports the chosen mode and reason for deployed tables;
+these checks catch the same constructs in the scripts before they deploy.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from ..medallion_bench.translate import strip_comments
+
+
+FULL = "FULL"
+NOTE = "NOTE"
+
+_NON_DETERMINISTIC = re.compile(
+    r"\b(CURRENT_DATE|CURRENT_TIMESTAMP|CURRENT_TIME|LOCALTIMESTAMP|LOCALTIME|SYSDATE|"
+    r"SYSTIMESTAMP|GETDATE|RANDOM|UUID_STRING|SEQ[1248])\b",
+    re.IGNORECASE,
+)
+_SET_OPERATOR = re.compile(r"\b(MINUS|EXCEPT|INTERSECT)\b", re.IGNORECASE)
+_ROW_LIMIT = re.compile(r"\b(LIMIT\s+\d+|TOP\s+\d+|SAMPLE|TABLESAMPLE)\b", re.IGNORECASE)
+_SUBQUERY = re.compile(r"(\w+)?\s*\(\s*SELECT\b", re.IGNORECASE)
+# A parenthesized SELECT after these is a derived table or a set operand, not a
+# subquery in an expression. MINUS / EXCEPT / INTERSECT are reported on their own.
+_SUBQUERY_ALLOWED_AFTER = ("FROM", "JOIN", "AS", "UNION", "ALL", "DISTINCT", "MINUS", "EXCEPT", "INTERSECT")
+_OVER = re.compile(r"\bOVER\s*\(", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    severity: str
+    detail: str
+
+
+def _blank_strings(sql: str) -> str:
+    return re.sub(r"'(?:[^']|'')*'", "''", sql)
+
+
+def _parenthesized(sql: str, open_index: int) -> str:
+    depth = 0
+    for i in range(open_index, len(sql)):
+        if sql[i] == "(":
+            depth += 1
+        elif sql[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return sql[open_index + 1:i]
+    return sql[open_index + 1:]
+
+
+def query_text(definition: str) -> str:
+    """The SELECT of a CREATE DYNAMIC TABLE statement, comments and strings removed."""
+    sql = _blank_strings(strip_comments(definition))
+    match = re.search(r"\bAS\s+(SELECT|WITH)\b", sql, re.IGNORECASE)
+    return sql[match.start(1):] if match else sql
+
+
+def find_full_refresh_constructs(definition: str) -> list[Finding]:
+    sql = query_text(definition)
+    findings = []
+    for match in sorted({m.group(1).upper() for m in _NON_DETERMINISTIC.finditer(sql)}):
+        findings.append(Finding(
+            "NON_DETERMINISTIC", FULL,
+            f"{match}() is evaluated at refresh time; compute it in the consuming query or a view",
+        ))
+    for match in sorted({m.group(1).upper() for m in _SET_OPERATOR.finditer(sql)}):
+        findings.append(Finding("SET_OPERATOR", FULL, f"{match}; rewrite as an anti/semi join"))
+    for match in sorted({m.group(1).split()[0].upper() for m in _ROW_LIMIT.finditer(sql)}):
+        findings.append(Finding("ROW_LIMIT", FULL, f"{match} makes the result depend on every row"))
+    for match in _SUBQUERY.finditer(sql):
+        keyword = (match.group(1) or "").upper()
+        if keyword in _SUBQUERY_ALLOWED_AFTER:
+            continue
+        where = f"after {keyword}" if keyword else "in an expression"
+        findings.append(Finding("SUBQUERY", FULL, f"subquery {where}; move it into the FROM clause as a join"))
+    for match in _OVER.finditer(sql):
+        window = _parenthesized(sql, match.end() - 1)
+        if re.search(r"\bPARTITION\s+BY\b", window, re.IGNORECASE):
+            findings.append(Finding(
+                "WINDOW", NOTE,
+                "window function recomputes every partition touched by a change; keep partitions narrow",
+            ))
+        else:
+            findings.append(Finding("WINDOW", FULL, "window function without PARTITION BY spans the whole table"))
+    return list(dict.fromkeys(findings))
@@ -0,0 +1,319 @@
+"""
+Per-table refresh profile and tiered TARGET_LAG recommendations.
+
+Tiering rules:
+  * A dynamic table that only other dynamic tables read from is intermediate
+    and gets TARGET_LAG = DOWNSTREAM: it refreshes only when a consumer needs
+    it. Tables that are also queried directly (by a non-dynamic table or view
+    in the scripts, a dashboard, or the semantic model's fact fallback) are
+    treated as leaves: under DOWNSTREAM those readers would only see data as
+    fresh as the last refresh a dynamic table happened to trigger.
+  * A leaf table gets the lag of its tier (by schema), the loosest freshness
+    its consumers accept. Slow-changing tiers (reference data) move to the tier
+    lag outright. Other tiers move only when the refresh history shows that
+    changes arrive often enough for the longer lag to batch them, i.e. the
+    projected number of data-carrying refreshes drops by at least a fifth.
+  * Lags are never tightened.
+
+Projected refreshes count the distinct lag-sized windows that contain a
+data-carrying refresh today. Projected credits scale the observed credits by
+the same ratio, which assumes a refresh costs about the same regardless of how
+many changes it batches. Treat the saving as an upper bound.
+"""
+
+from __future__ import annotations
+
+import re
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ..deployer.catalog import REPO_ROOT, Catalog
+from ..semantic_layer.model import MODEL_SCRIPT
+from .history import RefreshHistory, RefreshRecord
+from .lint import FULL, Finding, find_full_refresh_constructs
+
+
+DOWNSTREAM = "DOWNSTREAM"
+LAG_UNITS = {"SECOND": 1, "MINUTE": 60, "HOUR": 3600, "DAY": 86400}
+MIN_REFRESH_REDUCTION = 0.2
+
+# Files outside the deployed scripts that query tables directly.
+DEFAULT_CONSUMERS = (REPO_ROOT / "streamlit", MODEL_SCRIPT)
+
+_REFERENCE = re.compile(r"\b(MEDICORE_\w+_DB\.\w+\.\w+)\b", re.IGNORECASE)
+
+
+def parse_lag(text: str) -> int | None:
+    """Seconds for ``'5 minutes'`` / ``1 day``; None for DOWNSTREAM."""
+    value = text.strip().strip("'").strip().upper()
+    if value == DOWNSTREAM:
+        return None
+    match = re.fullmatch(r"(\d+)\s*(SECOND|MINUTE|HOUR|DAY)S?", value)
+    if not match:
+        raise ValueError(f"Unrecognized TARGET_LAG {text!r}")
+    return int(match.group(1)) * LAG_UNITS[match.group(2)]
+
+
+def format_lag(seconds: int | None) -> str:
+    if seconds is None:
+        return DOWNSTREAM
+    for unit in ("DAY", "HOUR", "MINUTE", "SECOND"):
+        size = LAG_UNITS[unit]
+        if seconds % size == 0:
+            count = seconds // size
+            return f"'{count} {unit.lower()}{'s' if count != 1 else ''}'"
+    return f"'{seconds} seconds'"
+
+
+@dataclass(frozen=True)
+class LagTier:
+    name: str
+    schema_suffix: str
+    max_lag: str
+    slow_changing: bool = False
+
+    def matches(self, table_name: str) -> bool:
+        parts = table_name.split(".")
+        return len(parts) == 3 and parts[1].endswith(self.schema_suffix)
+
+
+DEFAULT_TIERS = (
+    LagTier("reference", "_REFERENCE", "1 day", slow_changing=True),
+    LagTier("operational", "", "15 minutes"),
+)
+
+
+@dataclass
+class TableProfile:
+    table_name: str
+    target_lag: str
+    warehouse: str | None
+    declared_mode: str | None
+    effective_mode: str
+    mode_reason: str | None = None
+    refreshes: int = 0
+    actions: dict[str, int] = field(default_factory=dict)
+    failed: int = 0
+    p50_seconds: float | None = None
+    p95_seconds: float | None = None
+    rows_changed: int = 0
+    credits: float = 0.0
+    data_interval_minutes: float | None = None
+    findings: list[Finding] = field(default_factory=list)
+    dependents: list[str] = field(default_factory=list)
+    readers: list[str] = field(default_factory=list)
+
+    @property
+    def forces_full_refresh(self) -> bool:
+        return self.effective_mode == "FULL" or any(f.severity == FULL for f in self.findings)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class LagRecommendation:
+    table_name: str
+    current_lag: str
+    recommended_lag: str
+    tier: str
+    reason: str
+    current_refreshes: int = 0
+    projected_refreshes: int | None = None
+    current_credits: float | None = None
+    projected_credits: float | None = None
+    script: str | None = None
+
+    @property
+    def changed(self) -> bool:
+        return self.recommended_lag.upper() != self.current_lag.upper()
+
+    def alter_statement(self) -> str | None:
+        if not self.changed:
+            return None
+        return f"ALTER DYNAMIC TABLE {self.table_name} SET TARGET_LAG = {self.recommended_lag};"
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "changed": self.changed, "alter_statement": self.alter_statement()}
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct * len(ordered) + 0.5) - 1))]
+
+
+def _declared_mode(definition: str) -> str:
+    match = re.search(r"\bREFRESH_MODE\s*=\s*(\w+)", definition, re.IGNORECASE)
+    return match.group(1).upper() if match else "AUTO"
+
+
+def _data_starts(refreshes: list[RefreshRecord]) -> list:
+    return sorted(r.start_time for r in refreshes if r.carries_data)
+
+
+def direct_readers(catalog: Catalog, consumers=DEFAULT_CONSUMERS) -> dict[str, set[str]]:
+    """Readers of each table other than dynamic tables: non-dynamic objects of
+    the catalog (``SCHEMA.OBJECT``) and consumer files (file name)."""
+    readers: dict[str, set[str]] = {}
+    for obj in catalog.objects.values():
+        if obj.kind != "DYNAMIC TABLE":
+            for name in obj.dependencies:
+                readers.setdefault(name, set()).add(".".join(obj.name.split(".")[-2:]))
+    for root in consumers:
+        root = Path(root)
+        paths = [root] if root.is_file() else sorted(p for p in root.rglob("*") if p.suffix in (".py", ".sql"))
+        for path in paths:
+            for name in {ref.upper() for ref in _REFERENCE.findall(path.read_text())}:
+                readers.setdefault(name, set()).add(path.name)
+    return readers
+
+
+def profile_tables(
+    catalog: Catalog, history: RefreshHistory | None = None, consumers=DEFAULT_CONSUMERS
+) -> dict[str, TableProfile]:
+    history = history or RefreshHistory()
+    dynamic = {n: o for n, o in catalog.objects.items() if o.kind == "DYNAMIC TABLE"}
+    readers = direct_readers(catalog, consumers)
+    profiles = {}
+    for name in sorted(set(dynamic) | set(history.tables) | {r.table_name for r in history.refreshes}):
+        obj = dynamic.get(name)
+        info = history.tables.get(name)
+        refreshes = history.for_table(name)
+        data = [r for r in refreshes if r.carries_data]
+        actions: dict[str, int] = {}
+        for r in refreshes:
+            actions[r.action] = actions.get(r.action, 0) + 1
+
+        if info is not None:
+            effective = info.refresh_mode
+        elif actions.get("FULL", 0) or actions.get("INCREMENTAL", 0):
+            effective = "FULL" if actions.get("FULL", 0) > actions.get("INCREMENTAL", 0) else "INCREMENTAL"
+        else:
+            effective = "UNKNOWN"
+
+        starts = _data_starts(refreshes)
+        gaps = [(b - a).total_seconds() / 60 for a, b in zip(starts, starts[1:])]
+        profiles[name] = TableProfile(
+            table_name=name,
+            target_lag=info.target_lag if info else (obj.properties.get("TARGET_LAG", DOWNSTREAM) if obj else "?"),
+            warehouse=info.warehouse if info else (obj.properties.get("WAREHOUSE") if obj else None),
+            declared_mode=_declared_mode(obj.create) if obj else None,
+            effective_mode=effective,
+            mode_reason=info.refresh_mode_reason if info else None,
+            refreshes=len(refreshes),
+            actions=actions,
+            failed=sum(1 for r in refreshes if r.state == "FAILED"),
+            p50_seconds=_percentile([r.seconds for r in data], 0.50),
+            p95_seconds=_percentile([r.seconds for r in data], 0.95),
+            rows_changed=sum(r.rows_inserted + r.rows_deleted for r in data),
+            credits=sum(r.credits or 0.0 for r in refreshes),
+            data_interval_minutes=statistics.median(gaps) if gaps else None,
+            findings=find_full_refresh_constructs(obj.create) if obj else [],
+            dependents=sorted(d for d in catalog.dependents(name) if d in dynamic) if obj else [],
+            readers=sorted(readers.get(name, ())),
+        )
+    return profiles
+
+
+def _windows(starts: list, lag_seconds: int) -> int:
+    if not starts:
+        return 0
+    return len({int((s - starts[0]).total_seconds() // lag_seconds) for s in starts})
+
+
+def recommend_lags(
+    catalog: Catalog,
+    profiles: dict[str, TableProfile],
+    history: RefreshHistory | None = None,
+    tiers: tuple[LagTier, ...] = DEFAULT_TIERS,
+) -> list[LagRecommendation]:
+    history = history or RefreshHistory()
+    recommendations: dict[str, LagRecommendation] = {}
+
+    def projection(rec: LagRecommendation, profile: TableProfile, lag_seconds: int | None) -> None:
+        starts = _data_starts(history.for_table(profile.table_name))
+        rec.current_refreshes = len(starts)
+        rec.current_credits = profile.credits if starts else None
+        if starts and lag_seconds:
+            rec.projected_refreshes = min(len(starts), _windows(starts, lag_seconds))
+            rec.projected_credits = profile.credits * rec.projected_refreshes / len(starts)
+
+    def leaf(profile: TableProfile) -> LagRecommendation:
+        tier = next(t for t in tiers if t.matches(profile.table_name))
+        cap = parse_lag(tier.max_lag)
+        current = parse_lag(profile.target_lag)
+        keep = LagRecommendation(profile.table_name, profile.target_lag, profile.target_lag, tier.name, "")
+        move = LagRecommendation(profile.table_name, profile.target_lag, format_lag(cap), tier.name, "")
+        starts = _data_starts(history.for_table(profile.table_name))
+
+        if current is None:
+            move.reason = ("DOWNSTREAM refreshes it only when a dynamic table reading it refreshes"
+                           if profile.dependents else
+                           "no dynamic table reads from it, so DOWNSTREAM never refreshes it on schedule")
+            chosen = move
+        elif current >= cap:
+            keep.reason = f"already at or above the {tier.name} tier lag {format_lag(cap)}"
+            chosen = keep
+        elif not starts:
+            if tier.slow_changing:
+                move.reason = f"{tier.name} data changes rarely; no refresh history to project from"
+                chosen = move
+            else:
+                keep.reason = "no refresh history; profile it before loosening the lag"
+                chosen = keep
+        else:
+            projected = _windows(starts, cap)
+            if tier.slow_changing or projected <= (1 - MIN_REFRESH_REDUCTION) * len(starts):
+                move.reason = f"{len(starts)} data refreshes would batch into ~{projected} at {format_lag(cap)}"
+                chosen = move
+            else:
+                keep.reason = f"changes arrive less often than {format_lag(cap)}; a longer lag saves little"
+                chosen = keep
+        projection(chosen, profile, parse_lag(chosen.recommended_lag))
+        return chosen
+
+    def effective_seconds(name: str) -> int | None:
+        """Lag that ends up driving ``name``: its own, or its tightest consumer's."""
+        rec = recommend(name)
+        if rec.recommended_lag != DOWNSTREAM:
+            return parse_lag(rec.recommended_lag)
+        lags = [s for s in (effective_seconds(d) for d in profiles[name].dependents) if s is not None]
+        return min(lags) if lags else None
+
+    def recommend(name: str) -> LagRecommendation:
+        if name in recommendations:
+            return recommendations[name]
+        profile = profiles[name]
+        if profile.dependents and not profile.readers:
+            tier = next(t for t in tiers if t.matches(name))
+            rec = LagRecommendation(
+                name, profile.target_lag, DOWNSTREAM, tier.name,
+                f"intermediate: read by {', '.join(d.split('.')[-1] for d in profile.dependents)}",
+            )
+            recommendations[name] = rec
+            projection(rec, profile, effective_seconds(name))
+        else:
+            rec = recommendations[name] = leaf(profile)
+            if profile.readers:
+                rec.reason = f"queried directly by {', '.join(profile.readers)}; {rec.reason}"
+        recommendations[name].script = catalog.objects[name].script
+        return recommendations[name]
+
+    return [recommend(name) for name in sorted(profiles) if name in catalog.objects]
+
+
+def warehouse_summary(profiles: dict[str, TableProfile], history: RefreshHistory) -> dict[str, dict[str, float]]:
+    """Metered credits per dynamic-table warehouse, and the share attributed to refreshes."""
+    summary: dict[str, dict[str, float]] = {}
+    for profile in profiles.values():
+        if profile.warehouse:
+            entry = summary.setdefault(profile.warehouse, {"attributed_credits": 0.0})
+            entry["attributed_credits"] += profile.credits
+    for warehouse, entry in summary.items():
+        metered = history.metered_credits.get(warehouse)
+        entry["metered_credits"] = metered if metered is not None else float("nan")
+        entry["attributed_share"] = entry["attributed_credits"] / metered if metered else float("nan")
+    return summary
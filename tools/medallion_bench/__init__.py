@@ -0,0 +1,25 @@
+from .bench import (
+    ScaleResult,
+    StageResult,
+    compare_to_baseline,
+    report_markdown,
+    run_benchmark,
+    run_scale,
+    scaling_curves,
+)
+from .synthetic import generation_sql, row_counts
+from .translate import translate_file, translate_script
+
+__all__ = [
+    "ScaleResult",
+    "StageResult",
+    "compare_to_baseline",
+    "generation_sql",
+    "report_markdown",
+    "row_counts",
+    "run_benchmark",
+    "run_scale",
+    "scaling_curves",
+    "translate_file",
+    "translate_script",
+]
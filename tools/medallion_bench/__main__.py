@@ -0,0 +1,75 @@
+"""
+Usage:
+    python -m tools.medallion_bench [--scales 1 10 100] [--out results.json] [--markdown report.md]
+    python -m tools.medallion_bench --scales 1 10 --baseline results.json [--tolerance 0.25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+from .bench import (
+    DEFAULT_AS_OF,
+    DEFAULT_SCALES,
+    compare_to_baseline,
+    report_markdown,
+    run_benchmark,
+    scaling_curves,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.medallion_bench")
+    parser.add_argument("--scales", type=float, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Multiples of the seed row counts (default: 1 10 100)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=DEFAULT_AS_OF,
+                        help="Date substituted for CURRENT_DATE() (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--invalid-rate", type=float, default=0.01,
+                        help="Share of rows per rule given a quarantine-triggering value")
+    parser.add_argument("--threads", type=int)
+    parser.add_argument("--memory-limit", help="DuckDB memory_limit, e.g. 8GB")
+    parser.add_argument("--out", type=Path, help="Write results as JSON")
+    parser.add_argument("--markdown", type=Path, help="Write the report as Markdown")
+    parser.add_argument("--baseline", type=Path, help="Previous --out file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed rows/sec drop against the baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        [int(s) if s.is_integer() else s for s in args.scales],
+        as_of=args.as_of,
+        seed=args.seed,
+        invalid_rate=args.invalid_rate,
+        threads=args.threads,
+        memory_limit=args.memory_limit,
+    )
+    report = report_markdown(results)
+    print(report)
+
+    if args.out:
+        args.out.write_text(json.dumps({
+            "as_of": args.as_of.isoformat(),
+            "seed": args.seed,
+            "invalid_rate": args.invalid_rate,
+            "runs": [r.as_dict() for r in results],
+            "scaling_curves": scaling_curves(results),
+        }, indent=2))
+    if args.markdown:
+        args.markdown.write_text(report)
+
+    if args.baseline:
+        findings = compare_to_baseline(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for finding in findings:
+            print(finding, file=sys.stderr)
+        if findings:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
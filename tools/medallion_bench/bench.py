@@ -0,0 +1,372 @@
+"""
+RAW -> Silver -> Gold pipeline benchmark on DuckDB.
+
+Each scale runs in a fresh in-memory database:
+  1. RAW      DDL from infrastructure/12_hcls-data, synthetic data load
+  2. SILVER   every 11_medallion/01_transform_layer script (quarantine + validated MERGE)
+  3. GOLD     every 11_medallion/02_analytics_layer script (dynamic tables run as
+              full-refresh CTAS, then executive KPIs and de-identified tables)
+
+Per object it records wall time, rows/sec, how far process memory rose above
+its level at the start of the object (earlier stages' tables stay resident in
+the in-memory database, so absolute RSS would mostly measure them), and for
+Silver tables the quarantine ratio.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import resource
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+
+from .synthetic import RAW_TABLES, generation_sql, macro_sql, row_counts
+from .translate import Statement, translate_file
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+RAW_DDL_DIR = REPO_ROOT / "infrastructure" / "12_hcls-data"
+TRANSFORM_DIR = REPO_ROOT / "infrastructure" / "11_medallion" / "01_transform_layer"
+ANALYTICS_DIR = REPO_ROOT / "infrastructure" / "11_medallion" / "02_analytics_layer"
+
+DATABASES = ("MEDICORE_RAW_DB", "MEDICORE_TRANSFORM_DB", "MEDICORE_ANALYTICS_DB")
+# Created by Phase 04 in Snowflake; several layer scripts assume they exist.
+SCHEMAS = {
+    "MEDICORE_RAW_DB": ("DEV_REFERENCE", "DEV_CLINICAL", "DEV_BILLING"),
+    "MEDICORE_TRANSFORM_DB": ("DEV_REFERENCE", "DEV_CLINICAL", "DEV_BILLING"),
+    "MEDICORE_ANALYTICS_DB": (
+        "DEV_REFERENCE", "DEV_CLINICAL", "DEV_BILLING", "DEV_EXECUTIVE", "DEV_DEIDENTIFIED",
+    ),
+}
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_AS_OF = date(2026, 3, 1)
+
+
+@dataclass
+class StageResult:
+    stage: str
+    object_name: str
+    script: str
+    seconds: float
+    rows_in: int
+    rows_out: int
+    peak_memory_delta_mb: float
+    quarantined_rows: int | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_in / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def quarantine_ratio(self) -> float | None:
+        if self.quarantined_rows is None or not self.rows_in:
+            return None
+        return self.quarantined_rows / self.rows_in
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["rows_per_second"] = round(self.rows_per_second, 1)
+        data["quarantine_ratio"] = None if self.quarantine_ratio is None else round(self.quarantine_ratio, 6)
+        data["seconds"] = round(self.seconds, 4)
+        data["peak_memory_delta_mb"] = round(self.peak_memory_delta_mb, 1)
+        return data
+
+
+@dataclass
+class ScaleResult:
+    scale: float
+    raw_row_counts: dict[str, int]
+    stages: list[StageResult] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(s.seconds for s in self.stages)
+
+    def as_dict(self) -> dict:
+        return {
+            "scale": self.scale,
+            "raw_row_counts": self.raw_row_counts,
+            "total_seconds": round(self.total_seconds, 4),
+            "stages": [s.as_dict() for s in self.stages],
+        }
+
+
+class PeakMemorySampler:
+    """Samples resident set size on a background thread while a stage runs and
+    reports the peak relative to the RSS at stage start.
+
+    Where /proc is not available it falls back to the process high-water mark
+    (ru_maxrss). The delta then only shows how far a stage pushed the peak past
+    every earlier stage, so it is a lower bound and often 0.
+    """
+
+    _STATM = Path("/proc/self/statm")
+
+    def __init__(self, interval_seconds: float = 0.005):
+        self.interval_seconds = interval_seconds
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    def _rss(self) -> int:
+        try:
+            return int(self._STATM.read_text().split()[1]) * self._page_size
+        except (OSError, IndexError, ValueError):
+            # ru_maxrss is in bytes on macOS, KiB elsewhere.
+            unit = 1 if sys.platform == "darwin" else 1024
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self._rss())
+            self._stop.wait(self.interval_seconds)
+
+    def __enter__(self) -> "PeakMemorySampler":
+        self.start_bytes = self.peak_bytes = self._rss()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._rss())
+
+    @property
+    def peak_delta_mb(self) -> float:
+        return max(0, self.peak_bytes - self.start_bytes) / (1024 * 1024)
+
+
+def _count(con, table: str) -> int:
+    return con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _run_timed(con, statements: list[str]) -> tuple[float, float]:
+    with PeakMemorySampler() as sampler:
+        started = time.perf_counter()
+        for sql in statements:
+            con.execute(sql)
+        elapsed = time.perf_counter() - started
+    return elapsed, sampler.peak_delta_mb
+
+
+def _scripts(directory: Path) -> list[Path]:
+    # NN_*.sql in numbered folders; 99_* run-order files are orchestration only.
+    return sorted(p for p in directory.glob("[0-9][0-9]_*/[0-9][0-9]_*.sql") if not p.name.startswith("99_"))
+
+
+def _source_tables(statement: Statement) -> list[str]:
+    return sorted({m.upper() for m in re.findall(r"\bMEDICORE_\w+_DB\.\w+\.\w+", statement.sql)} - {statement.target})
+
+
+def _raw_source(statement: Statement) -> str:
+    """The RAW_DB table a Silver MERGE loads from. Reference tables it joins
+    are not its input."""
+    raw = [t for t in _source_tables(statement) if t.startswith("MEDICORE_RAW_DB.")]
+    if len(raw) != 1:
+        raise ValueError(f"{statement.target}: expected one MEDICORE_RAW_DB source, found {raw or 'none'}")
+    return raw[0]
+
+
+def connect(threads: int | None = None, memory_limit: str | None = None):
+    import duckdb
+
+    con = duckdb.connect()
+    if threads:
+        con.execute(f"SET threads = {int(threads)}")
+    if memory_limit:
+        con.execute(f"SET memory_limit = '{memory_limit}'")
+    for database in DATABASES:
+        con.execute(f"ATTACH ':memory:' AS {database}")
+        for schema in SCHEMAS[database]:
+            con.execute(f"CREATE SCHEMA {database}.{schema}")
+    return con
+
+
+def run_scale(
+    scale: float,
+    as_of: date = DEFAULT_AS_OF,
+    seed: int = 42,
+    invalid_rate: float = 0.01,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+    con=None,
+) -> ScaleResult:
+    """Pass an open connection from ``connect()`` as ``con`` to keep the loaded
+    tables after the run; otherwise a fresh database is used and closed."""
+    owned = con is None
+    if owned:
+        con = connect(threads, memory_limit)
+    result = ScaleResult(scale=scale, raw_row_counts=row_counts(scale))
+    try:
+        for path in sorted(RAW_DDL_DIR.glob("0[1-3]_*.sql")):
+            for statement in translate_file(path, as_of):
+                con.execute(statement.sql)
+        for sql in macro_sql(seed, invalid_rate):
+            con.execute(sql)
+
+        for table, sql in generation_sql(scale, as_of).items():
+            seconds, peak = _run_timed(con, [sql])
+            rows = _count(con, RAW_TABLES[table])
+            result.stages.append(StageResult("RAW", RAW_TABLES[table], "synthetic", seconds, rows, rows, peak))
+
+        for path in _scripts(TRANSFORM_DIR):
+            result.stages.append(_run_silver_script(con, path, as_of))
+
+        for path in _scripts(ANALYTICS_DIR):
+            result.stages.extend(_run_gold_script(con, path, as_of))
+    finally:
+        if owned:
+            con.close()
+    return result
+
+
+def _run_silver_script(con, path: Path, as_of: date) -> StageResult:
+    statements = translate_file(path, as_of)
+    merges = [s for s in statements if s.kind == "MERGE"]
+    for s in statements:
+        if s.kind in ("CREATE_SCHEMA", "CREATE_TABLE"):
+            con.execute(s.sql)
+    validated = next(s for s in merges if not s.target.endswith("_QUARANTINE"))
+    quarantine = next(s for s in merges if s.target.endswith("_QUARANTINE"))
+    source = _raw_source(validated)
+    seconds, peak = _run_timed(con, [s.sql for s in merges])
+    return StageResult(
+        stage="SILVER",
+        object_name=validated.target,
+        script=str(path.relative_to(REPO_ROOT)),
+        seconds=seconds,
+        rows_in=_count(con, source),
+        rows_out=_count(con, validated.target),
+        peak_memory_delta_mb=peak,
+        quarantined_rows=_count(con, quarantine.target),
+    )
+
+
+def _run_gold_script(con, path: Path, as_of: date) -> list[StageResult]:
+    results = []
+    for statement in translate_file(path, as_of):
+        if statement.kind != "CTAS":
+            con.execute(statement.sql)
+            continue
+        sources = _source_tables(statement)
+        seconds, peak = _run_timed(con, [statement.sql])
+        results.append(StageResult(
+            stage="GOLD",
+            object_name=statement.target,
+            script=str(path.relative_to(REPO_ROOT)),
+            seconds=seconds,
+            rows_in=sum(_count(con, t) for t in sources),
+            rows_out=_count(con, statement.target),
+            peak_memory_delta_mb=peak,
+        ))
+    return results
+
+
+def run_benchmark(scales=DEFAULT_SCALES, **kwargs) -> list[ScaleResult]:
+    return [run_scale(scale, **kwargs) for scale in scales]
+
+
+def scaling_curves(results: list[ScaleResult]) -> dict[str, dict]:
+    """Per object: seconds at each scale and the log-log slope between the
+    smallest and largest scale (1.0 = linear, > 1.0 = super-linear)."""
+    curves: dict[str, dict] = {}
+    for result in sorted(results, key=lambda r: r.scale):
+        for stage in result.stages:
+            curve = curves.setdefault(stage.object_name, {"stage": stage.stage, "points": []})
+            curve["points"].append({
+                "scale": result.scale,
+                "seconds": round(stage.seconds, 4),
+                "rows_per_second": round(stage.rows_per_second, 1),
+                "peak_memory_delta_mb": round(stage.peak_memory_delta_mb, 1),
+            })
+    for curve in curves.values():
+        first, last = curve["points"][0], curve["points"][-1]
+        exponent = None
+        if last["scale"] > first["scale"] and first["seconds"] > 0 and last["seconds"] > 0:
+            exponent = math.log(last["seconds"] / first["seconds"]) / math.log(last["scale"] / first["scale"])
+        curve["scaling_exponent"] = None if exponent is None else round(exponent, 3)
+    return curves
+
+
+def compare_to_baseline(
+    results: list[ScaleResult],
+    baseline: dict,
+    tolerance: float = 0.25,
+    min_seconds: float = 0.05,
+) -> list[str]:
+    """Throughput drops beyond ``tolerance`` and any quarantine ratio change.
+
+    Objects that ran faster than ``min_seconds`` in the baseline are too noisy
+    for a throughput comparison and are only checked for quarantine changes.
+    """
+    findings = []
+    previous = {
+        (run["scale"], stage["object_name"]): stage
+        for run in baseline.get("runs", [])
+        for stage in run["stages"]
+    }
+    for result in results:
+        for stage in result.stages:
+            before = previous.get((result.scale, stage.object_name))
+            if before is None:
+                continue
+            if before["seconds"] >= min_seconds and before["rows_per_second"] > 0:
+                change = stage.rows_per_second / before["rows_per_second"] - 1
+                if change < -tolerance:
+                    findings.append(
+                        f"REGRESSION {stage.object_name} @ {result.scale}x: "
+                        f"{stage.rows_per_second:,.0f} rows/s vs {before['rows_per_second']:,.0f} ({change:+.0%})"
+                    )
+            ratio = stage.quarantine_ratio
+            if ratio is not None and before.get("quarantine_ratio") is not None:
+                if abs(ratio - before["quarantine_ratio"]) > 1e-6:
+                    findings.append(
+                        f"QUARANTINE {stage.object_name} @ {result.scale}x: "
+                        f"{ratio:.2%} vs {before['quarantine_ratio']:.2%}"
+                    )
+    return findings
+
+
+def report_markdown(results: list[ScaleResult]) -> str:
+    lines = ["# Medallion Pipeline Benchmark", ""]
+    for result in results:
+        lines += [
+            f"## Scale {result.scale:g}x ({result.total_seconds:.2f}s total)",
+            "",
+            "| Stage | Object | Rows In | Rows Out | Seconds | Rows/sec | Peak +MB | Quarantine |",
+            "|-------|--------|---------|----------|---------|----------|----------|------------|",
+        ]
+        for s in result.stages:
+            quarantine = "" if s.quarantine_ratio is None else f"{s.quarantine_ratio:.2%}"
+            lines.append(
+                f"| {s.stage} | {s.object_name} | {s.rows_in:,} | {s.rows_out:,} | {s.seconds:.3f} | "
+                f"{s.rows_per_second:,.0f} | {s.peak_memory_delta_mb:,.0f} | {quarantine} |"
+            )
+        lines.append("")
+
+    scales = sorted({r.scale for r in results})
+    if len(scales) > 1:
+        header = " | ".join(f"{s:g}x s" for s in scales)
+        lines += [
+            "## Scaling Curves",
+            "",
+            f"| Object | {header} | Exponent |",
+            "|--------|" + "------|" * len(scales) + "----------|",
+        ]
+        for name, curve in scaling_curves(results).items():
+            by_scale = {p["scale"]: p["seconds"] for p in curve["points"]}
+            cells = " | ".join(f"{by_scale[s]:.3f}" if s in by_scale else "" for s in scales)
+            exponent = "" if curve["scaling_exponent"] is None else f"{curve['scaling_exponent']:.2f}"
+            lines.append(f"| {name} | {cells} | {exponent} |")
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,234 @@
+"""
+Deterministic synthetic RAW data for the medallion benchmark.
+
+Mirrors the distributions and messy cases of
+infrastructure/12_hcls-data/04_seed_dev_data.sql (NULL names and MRNs,
+lower-case codes and statuses, '??' lab values, NULL units, '123-456' phone
+numbers, 3-digit ZIPs, ICD-10 codes outside the dimension, discharge dates
+after the as-of date). Scale 1 matches the seed's row counts.
+
+The seed never trips most of the Silver quarantine rules, so a small share of
+rows (``invalid_rate``) additionally carries a rule violation per table:
+future dates, NULL keys, negative amounts, zero quantities.
+
+Snowflake's UNIFORM(lo, hi, RANDOM()) is replaced by a hash of
+(seed, column, row number), so every run at a given scale produces identical
+data regardless of thread count.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+BASE_ROW_COUNTS = {
+    "DIM_DEPARTMENTS": 15,
+    "DIM_ICD10_CODES": 200,
+    "PATIENTS": 5_000,
+    "PROVIDERS": 100,
+    "ENCOUNTERS": 20_000,
+    "LAB_RESULTS": 50_000,
+    "CLAIMS": 15_000,
+    "CLAIM_LINE_ITEMS": 40_000,
+}
+
+# Reference dimensions do not grow with patient volume.
+FIXED_SIZE_TABLES = {"DIM_DEPARTMENTS", "DIM_ICD10_CODES"}
+
+RAW_TABLES = {
+    "DIM_DEPARTMENTS": "MEDICORE_RAW_DB.DEV_REFERENCE.DIM_DEPARTMENTS",
+    "DIM_ICD10_CODES": "MEDICORE_RAW_DB.DEV_REFERENCE.DIM_ICD10_CODES",
+    "PATIENTS": "MEDICORE_RAW_DB.DEV_CLINICAL.PATIENTS",
+    "PROVIDERS": "MEDICORE_RAW_DB.DEV_CLINICAL.PROVIDERS",
+    "ENCOUNTERS": "MEDICORE_RAW_DB.DEV_CLINICAL.ENCOUNTERS",
+    "LAB_RESULTS": "MEDICORE_RAW_DB.DEV_CLINICAL.LAB_RESULTS",
+    "CLAIMS": "MEDICORE_RAW_DB.DEV_BILLING.CLAIMS",
+    "CLAIM_LINE_ITEMS": "MEDICORE_RAW_DB.DEV_BILLING.CLAIM_LINE_ITEMS",
+}
+
+_DEPARTMENTS = [
+    "Emergency Department", "Cardiology", "Oncology", "Pediatrics",
+    "Orthopedics", "Neurology", "Radiology", "Pathology",
+    "Internal Medicine", "General Surgery", "ICU", "Labor & Delivery",
+    "Pharmacy", "Physical Therapy", "Psychiatry",
+]
+_DIAGNOSES = [
+    "Acute myocardial infarction", "Type 2 diabetes mellitus", "Essential hypertension",
+    "Chronic kidney disease", "Congestive heart failure", "Atrial fibrillation",
+    "Pneumonia", "Urinary tract infection", "Sepsis", "Acute bronchitis",
+    "Osteoarthritis", "COPD exacerbation", "Anemia", "Hypothyroidism", "Hyperlipidemia",
+    "Chest pain", "Shortness of breath", "Abdominal pain", "Back pain", "Headache",
+]
+_FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Christopher", "Karen", "Charles", "Lisa", "Daniel", "Nancy",
+    "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
+    "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+]
+_LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+]
+
+
+def _list(values: list[str]) -> str:
+    return "[" + ", ".join("'" + v.replace("'", "''") + "'" for v in values) + "]"
+
+
+def row_counts(scale: float) -> dict[str, int]:
+    return {
+        table: count if table in FIXED_SIZE_TABLES else max(1, int(round(count * scale)))
+        for table, count in BASE_ROW_COUNTS.items()
+    }
+
+
+def macro_sql(seed: int = 42, invalid_rate: float = 0.01) -> list[str]:
+    # uni(col, i, lo, hi) ~ UNIFORM(lo, hi, RANDOM()); bad(col, i) is true for invalid_rate of rows.
+    return [
+        f"CREATE OR REPLACE TEMP MACRO uni(col, i, lo, hi) AS "
+        f"(lo + (hash({seed}, col, i) % ((hi) - (lo) + 1))::BIGINT)",
+        f"CREATE OR REPLACE TEMP MACRO bad(col, i) AS "
+        f"((hash({seed}, 'invalid', col, i) % 100000) < {int(invalid_rate * 100000)})",
+    ]
+
+
+def generation_sql(scale: float, as_of: date) -> dict[str, str]:
+    """One INSERT per RAW table, in dependency order. Requires ``macro_sql``."""
+    n = row_counts(scale)
+    today = f"DATE '{as_of.isoformat()}'"
+    now = f"TIMESTAMP '{as_of.isoformat()} 00:00:00'"
+    first, last = _list(_FIRST_NAMES), _list(_LAST_NAMES)
+    sql = {}
+
+    sql["DIM_DEPARTMENTS"] = f"""
+        INSERT INTO {RAW_TABLES['DIM_DEPARTMENTS']}
+        SELECT
+            i + 1,
+            CASE WHEN uni('dept_name', i, 1, 10) < 3 THEN NULL
+                 ELSE {_list(_DEPARTMENTS)}[i % 15 + 1] END,
+            CASE WHEN uni('dept_fac', i, 1, 10) < 4 THEN 'fac_' || uni('dept_fac_n', i, 1, 5)
+                 ELSE 'FAC-' || uni('dept_fac_n', i, 1, 5) END,
+            uni('dept_active', i, 0, 1) = 1,
+            {now} - uni('dept_created', i, 1, 365) * INTERVAL 1 DAY
+        FROM range({n['DIM_DEPARTMENTS']}) t(i)
+    """
+
+    sql["DIM_ICD10_CODES"] = f"""
+        INSERT INTO {RAW_TABLES['DIM_ICD10_CODES']}
+        SELECT
+            'A' || LPAD(i::VARCHAR, 3, '0'),
+            CASE WHEN uni('icd_desc', i, 1, 10) < 3 THEN NULL
+                 ELSE {_list(_DIAGNOSES)}[i % 20 + 1] END,
+            CASE WHEN uni('icd_cat', i, 1, 10) < 4 THEN 'cardiology' ELSE 'General' END,
+            uni('icd_chronic', i, 0, 1) = 1,
+            {now}
+        FROM range({n['DIM_ICD10_CODES']}) t(i)
+    """
+
+    sql["PATIENTS"] = f"""
+        INSERT INTO {RAW_TABLES['PATIENTS']}
+        SELECT
+            i + 1,
+            CASE WHEN uni('pat_mrn_null', i, 1, 10) < 2 THEN NULL
+                 ELSE 'MRN' || uni('pat_mrn', i, 10000, 99999) END,
+            {first}[i % 40 + 1],
+            {last}[i % 40 + 1],
+            CASE WHEN bad('pat_dob', i) AND i % 2 = 0 THEN {today} + INTERVAL 30 DAY
+                 WHEN bad('pat_dob', i) THEN {today} - INTERVAL 130 YEAR
+                 ELSE {today} - uni('pat_age', i, 1, 90) * INTERVAL 1 YEAR END::DATE,
+            CASE WHEN uni('pat_gender_m', i, 1, 10) < 4 THEN 'M'
+                 WHEN uni('pat_gender_f', i, 1, 10) < 7 THEN 'F'
+                 ELSE 'unknown' END,
+            CASE WHEN uni('pat_phone_bad', i, 1, 10) < 3 THEN '123-456'
+                 ELSE '98' || uni('pat_phone', i, 10000000, 99999999) END,
+            CASE WHEN uni('pat_zip_bad', i, 1, 10) < 3 THEN '123'
+                 ELSE LPAD(uni('pat_zip', i, 10000, 99999)::VARCHAR, 5, '0') END,
+            {now}
+        FROM range({n['PATIENTS']}) t(i)
+    """
+
+    sql["PROVIDERS"] = f"""
+        INSERT INTO {RAW_TABLES['PROVIDERS']}
+        SELECT
+            i + 1,
+            CASE WHEN bad('prov_name', i) THEN NULL
+                 ELSE ['Dr. ', 'Dr. ', 'Dr. ', ''][i % 4 + 1]
+                      || {first}[i % 40 + 1] || ' ' || {last}[(i + 7) % 40 + 1]
+                      || [', MD', ', DO', ', MD, PhD', ', MD'][i % 4 + 1] END,
+            CASE WHEN uni('prov_spec', i, 1, 10) < 5 THEN 'Cardiology' ELSE 'internal medicine' END,
+            uni('prov_dept', i, 1, 15),
+            {now}
+        FROM range({n['PROVIDERS']}) t(i)
+    """
+
+    sql["ENCOUNTERS"] = f"""
+        INSERT INTO {RAW_TABLES['ENCOUNTERS']}
+        SELECT
+            i + 1,
+            CASE WHEN bad('enc_patient', i) THEN NULL
+                 ELSE uni('enc_patient', i, 1, {n['PATIENTS']}) END,
+            uni('enc_provider', i, 1, {n['PROVIDERS']}),
+            uni('enc_dept', i, 1, 15),
+            CASE WHEN bad('enc_admit', i) THEN {today} + uni('enc_future', i, 1, 30) * INTERVAL 1 DAY
+                 ELSE {today} - uni('enc_admit', i, 1, 1000) * INTERVAL 1 DAY END::DATE,
+            ({today} + uni('enc_discharge', i, 0, 10) * INTERVAL 1 DAY)::DATE,
+            CASE WHEN uni('enc_type', i, 1, 10) < 5 THEN 'INPATIENT' ELSE 'outpatient' END,
+            'A' || LPAD(uni('enc_icd', i, 1, 200)::VARCHAR, 3, '0'),
+            {now}
+        FROM range({n['ENCOUNTERS']}) t(i)
+    """
+
+    sql["LAB_RESULTS"] = f"""
+        INSERT INTO {RAW_TABLES['LAB_RESULTS']}
+        SELECT
+            i + 1,
+            uni('lab_enc', i, 1, {n['ENCOUNTERS']}),
+            CASE WHEN uni('lab_test', i, 1, 10) < 5 THEN 'HbA1c' ELSE 'Glucose' END,
+            CASE WHEN uni('lab_value_bad', i, 1, 10) < 3 THEN '??'
+                 ELSE uni('lab_value', i, 70, 200)::VARCHAR END,
+            CASE WHEN uni('lab_unit', i, 1, 10) < 4 THEN NULL ELSE 'mg/dL' END,
+            CASE WHEN bad('lab_date', i) AND i % 2 = 0 THEN NULL
+                 WHEN bad('lab_date', i) THEN ({today} + INTERVAL 7 DAY)::DATE
+                 ELSE ({today} - uni('lab_date', i, 1, 365) * INTERVAL 1 DAY)::DATE END,
+            uni('lab_abnormal', i, 0, 1) = 1,
+            {now}
+        FROM range({n['LAB_RESULTS']}) t(i)
+    """
+
+    sql["CLAIMS"] = f"""
+        INSERT INTO {RAW_TABLES['CLAIMS']}
+        SELECT
+            i + 1,
+            uni('clm_enc', i, 1, {n['ENCOUNTERS']}),
+            uni('clm_patient', i, 1, {n['PATIENTS']}),
+            CASE WHEN bad('clm_amount', i) THEN -uni('clm_amount', i, 100, 10000)
+                 ELSE uni('clm_amount', i, 100, 10000) END,
+            CASE WHEN uni('clm_status_d', i, 1, 10) < 3 THEN 'denied'
+                 WHEN uni('clm_status_a', i, 1, 10) < 6 THEN 'APPROVED'
+                 ELSE 'submitted' END,
+            CASE WHEN uni('clm_payer', i, 1, 10) < 5 THEN 'COMMERCIAL' ELSE 'medicare' END,
+            CASE WHEN bad('clm_date', i) THEN ({today} + INTERVAL 14 DAY)::DATE
+                 ELSE ({today} - uni('clm_date', i, 1, 365) * INTERVAL 1 DAY)::DATE END,
+            {now}
+        FROM range({n['CLAIMS']}) t(i)
+    """
+
+    sql["CLAIM_LINE_ITEMS"] = f"""
+        INSERT INTO {RAW_TABLES['CLAIM_LINE_ITEMS']}
+        SELECT
+            i + 1,
+            uni('cli_claim', i, 1, {n['CLAIMS']}),
+            'PROC_' || uni('cli_proc', i, 100, 999),
+            CASE WHEN bad('cli_amount', i) AND i % 2 = 0 THEN -uni('cli_amount', i, 50, 2000)
+                 ELSE uni('cli_amount', i, 50, 2000) END,
+            CASE WHEN bad('cli_amount', i) AND i % 2 = 1 THEN 0
+                 ELSE uni('cli_qty', i, 1, 5) END,
+            {now}
+        FROM range({n['CLAIM_LINE_ITEMS']}) t(i)
+    """
+
+    return sql
@@ -0,0 +1,192 @@
+"""
+Snowflake -> DuckDB translation for the 11_medallion and 12_hcls-data scripts.
+
+Covers only the dialect the repo's pipeline SQL uses. Anything else passes
+through unchanged and fails loudly in DuckDB, so a new construct in the
+pipeline shows up as a benchmark error rather than silently diverging.
+
+  Snowflake                                   DuckDB
+  ------------------------------------------  ------------------------------------
+  NUMBER / NUMBER(p) / NUMBER(p,s)            DECIMAL(38,0) / DECIMAL(p,0) / DECIMAL(p,s)
+  TIMESTAMP_NTZ / TIMESTAMP_LTZ               TIMESTAMP / TIMESTAMPTZ
+  CREATE OR REPLACE DYNAMIC TABLE ... AS      CREATE OR REPLACE TABLE ... AS (full refresh)
+  DATEADD(unit, n, expr)                      (expr + (n) * INTERVAL 1 unit)
+  MERGE ... UPDATE SET tgt.col = ...          UPDATE SET col = ...
+  CURRENT_DATE() / CURRENT_TIMESTAMP()        fixed as-of literals (deterministic runs)
+  UUID_STRING()                               uuid()::VARCHAR
+  COMMENT '...' / COMMENT = '...'             removed
+  CONSTRAINT ... PRIMARY KEY (...)            removed (not enforced by Snowflake either)
+  USE / ALTER ... SET TAG / GRANT / SELECT    skipped
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+
+
+_STRING = r"'(?:[^']|'')*'"
+_KEPT_STATEMENTS = ("CREATE", "MERGE", "INSERT")
+
+
+@dataclass(frozen=True)
+class Statement:
+    kind: str
+    target: str
+    sql: str
+
+
+def strip_comments(sql: str) -> str:
+    out = []
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch == "'":
+            end = i + 1
+            while end < n:
+                if sql[end] == "'" and end + 1 < n and sql[end + 1] == "'":
+                    end += 2
+                    continue
+                if sql[end] == "'":
+                    break
+                end += 1
+            out.append(sql[i:end + 1])
+            i = end + 1
+        elif sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end == -1 else end
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def split_statements(sql: str) -> list[str]:
+    statements, current, in_string = [], [], False
+    for ch in strip_comments(sql):
+        if ch == "'":
+            in_string = not in_string
+        if ch == ";" and not in_string:
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(ch)
+    tail = "".join(current).strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+def _split_args(body: str) -> list[str]:
+    args, depth, start, in_string = [], 0, 0, False
+    for i, ch in enumerate(body):
+        if ch == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            args.append(body[start:i].strip())
+            start = i + 1
+    args.append(body[start:].strip())
+    return args
+
+
+def _rewrite_dateadd(sql: str) -> str:
+    pattern = re.compile(r"\bDATEADD\s*\(", re.IGNORECASE)
+    while True:
+        match = pattern.search(sql)
+        if not match:
+            return sql
+        depth, end = 1, match.end()
+        while depth:
+            if sql[end] == "(":
+                depth += 1
+            elif sql[end] == ")":
+                depth -= 1
+            end += 1
+        unit, amount, expr = _split_args(sql[match.end():end - 1])
+        unit = unit.strip("'\"").upper()
+        sql = f"{sql[:match.start()]}({expr} + ({amount}) * INTERVAL 1 {unit}){sql[end:]}"
+
+
+def _unqualify_update_set(sql: str) -> str:
+    match = re.match(r"MERGE\s+INTO\s+\S+\s+(?:AS\s+)?(\w+)", sql, re.IGNORECASE)
+    if not match:
+        return sql
+    alias = re.escape(match.group(1))
+
+    def unqualify(block: re.Match) -> str:
+        return re.sub(rf"(\bSET\b|,)(\s*){alias}\.(\w+)(\s*=)", r"\1\2\3\4", block.group(0), flags=re.IGNORECASE)
+
+    return re.sub(r"UPDATE\s+SET\b.*?(?=\bWHEN\b|$)", unqualify, sql, flags=re.IGNORECASE | re.DOTALL)
+
+
+def translate_statement(sql: str, as_of: date) -> str:
+    as_of_ts = datetime.combine(as_of, time(0, 0))
+    sql = re.sub(rf"\s+COMMENT\s*=\s*{_STRING}", "", sql, flags=re.IGNORECASE)
+    sql = re.sub(rf"\s+COMMENT\s+{_STRING}", "", sql, flags=re.IGNORECASE)
+    sql = re.sub(r",\s*CONSTRAINT\s+\w+\s+PRIMARY\s+KEY\s*\([^)]*\)", "", sql, flags=re.IGNORECASE)
+    sql = re.sub(
+        r"CREATE\s+OR\s+REPLACE\s+DYNAMIC\s+TABLE\s+(\S+).*?\bAS\b",
+        r"CREATE OR REPLACE TABLE \1 AS",
+        sql,
+        count=1,
+        flags=re.IGNORECASE | re.DOTALL,
+    )
+    sql = re.sub(r"\bNUMBER\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)", r"DECIMAL(\1,\2)", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bNUMBER\s*\(\s*(\d+)\s*\)", r"DECIMAL(\1,0)", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bNUMBER\b", "DECIMAL(38,0)", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bTIMESTAMP_NTZ\b", "TIMESTAMP", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bTIMESTAMP_LTZ\b", "TIMESTAMPTZ", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bUUID_STRING\s*\(\s*\)", "(uuid()::VARCHAR)", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bCURRENT_TIMESTAMP\s*\(\s*\)", f"TIMESTAMP '{as_of_ts.isoformat(sep=' ')}'", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"\bCURRENT_DATE\s*\(\s*\)", f"DATE '{as_of.isoformat()}'", sql, flags=re.IGNORECASE)
+    return _unqualify_update_set(_rewrite_dateadd(sql))
+
+
+def _target(sql: str) -> str:
+    match = re.search(
+        r"^(?:MERGE\s+INTO|INSERT\s+INTO|CREATE\s+(?:OR\s+REPLACE\s+)?(?:DYNAMIC\s+)?"
+        r"(?:TABLE|VIEW|SCHEMA)(?:\s+IF\s+NOT\s+EXISTS)?)\s+([\w.]+)",
+        sql,
+        re.IGNORECASE,
+    )
+    return match.group(1).upper() if match else ""
+
+
+def _kind(sql: str) -> str:
+    first = sql.split(None, 1)[0].upper()
+    if first in ("MERGE", "INSERT"):
+        return first
+    if re.match(r"CREATE\s+(OR\s+REPLACE\s+)?SCHEMA\b", sql, re.IGNORECASE):
+        return "CREATE_SCHEMA"
+    if re.search(r"\bAS\s+(SELECT|WITH)\b", sql, re.IGNORECASE):
+        return "CTAS"
+    return "CREATE_TABLE"
+
+
+def translate_script(sql: str, as_of: date) -> list[Statement]:
+    statements = []
+    for raw in split_statements(sql):
+        first = raw.split(None, 1)[0].upper()
+        if first not in _KEPT_STATEMENTS:
+            continue
+        if re.match(r"CREATE\s+(OR\s+REPLACE\s+)?(TASK|TAG|ALERT|PROCEDURE)\b", raw, re.IGNORECASE):
+            continue
+        statements.append(Statement(_kind(raw), _target(raw), translate_statement(raw, as_of)))
+    return statements
+
+
+def translate_file(path: Path, as_of: date) -> list[Statement]:
+    return translate_script(path.read_text(), as_of)
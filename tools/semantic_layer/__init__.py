@@ -0,0 +1,14 @@
+from .model import SemanticModel, load_model, load_model_from_script
+from .planner import Filter, MetricRequest, PlanningError, QueryPlan, QueryPlanner, parse_filter
+
+__all__ = [
+    "Filter",
+    "MetricRequest",
+    "PlanningError",
+    "QueryPlan",
+    "QueryPlanner",
+    "SemanticModel",
+    "load_model",
+    "load_model_from_script",
+    "parse_filter",
+]
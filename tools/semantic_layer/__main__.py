@@ -0,0 +1,69 @@
+"""
+Usage:
+    python -m tools.semantic_layer metrics
+    python -m tools.semantic_layer plan --metric DENIAL_RATE --by QUARTER --where "YEAR = 2025"
+    python -m tools.semantic_layer plan --metric ENCOUNTERS --metric NET_REVENUE --by MONTH \\
+        --connection medicore [--run]
+
+Without --connection the model is read from the checked-in semantic model
+script and sources are ranked without row counts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from .model import ModelError, load_model, load_model_from_script, snowflake_query
+from .planner import MetricRequest, PlanningError, QueryPlanner, parse_filter, source_row_counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.semantic_layer")
+    parser.add_argument("--connection", help="connections.toml entry; default reads the model script")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("metrics", help="List metrics, dimensions and sources")
+
+    plan = commands.add_parser("plan", help="Route a metric request and print the SQL")
+    plan.add_argument("--metric", action="append", required=True)
+    plan.add_argument("--by", action="append", default=[], help="Dimension to group by")
+    plan.add_argument("--where", action="append", default=[], help="e.g. 'YEAR >= 2025'")
+    plan.add_argument("--facts-only", action="store_true", help="Ignore AGGREGATE sources")
+    plan.add_argument("--run", action="store_true", help="Execute the plan (needs --connection)")
+
+    args = parser.parse_args(argv)
+
+    query = snowflake_query(args.connection) if args.connection else None
+    model = load_model(query) if query else load_model_from_script()
+
+    if args.command == "metrics":
+        for metric in model.metrics.values():
+            print(f"{metric.name:<20} {metric.additivity:<13} {metric.unit:<8} {metric.description}")
+        print()
+        for source in model.sources.values():
+            print(f"{source.kind:<10} {source.name}")
+            print(f"           metrics:    {', '.join(sorted(source.metrics))}")
+            print(f"           dimensions: {', '.join(sorted(source.dimensions))}")
+        return 0
+
+    if args.run and query is None:
+        parser.error("--run needs --connection")
+    try:
+        request = MetricRequest(tuple(args.metric), tuple(args.by), tuple(parse_filter(w) for w in args.where))
+        planner = QueryPlanner(model, source_row_counts(query, model) if query else None)
+        result = planner.plan(request, allow_aggregates=not args.facts_only)
+    except (ModelError, PlanningError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    print("-- " + result.explain().replace("\n", "\n-- "))
+    print(result.sql + ";")
+    if args.run:
+        for row in query(result.sql):
+            print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
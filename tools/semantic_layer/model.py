@@ -0,0 +1,187 @@
+"""
+Semantic model for the query planner.
+
+The model lives in MEDICORE_AI_READY_DB.DEV_SEMANTIC (see
+infrastructure/11_medallion/03_ai_ready_layer/03_semantic/01_medicore_semantic_model.sql).
+``load_model`` reads it from any engine through a ``query`` callable that
+returns rows as tuples. ``load_model_from_script`` runs the script's model
+statements in an in-memory DuckDB, so plans can be compiled offline from the
+checked-in definition.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..medallion_bench.translate import translate_file
+
+
+MODEL_SCHEMA = "MEDICORE_AI_READY_DB.DEV_SEMANTIC"
+MODEL_SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "infrastructure" / "11_medallion" / "03_ai_ready_layer" / "03_semantic"
+    / "01_medicore_semantic_model.sql"
+)
+
+ADDITIVITIES = ("ADDITIVE", "RATIO", "NON_ADDITIVE")
+SOURCE_KINDS = ("AGGREGATE", "FACT")
+
+Query = Callable[[str], Iterable[tuple]]
+
+
+class ModelError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    additivity: str
+    unit: str
+    description: str
+    numerator: str | None = None
+    denominator: str | None = None
+    multiplier: float = 1.0
+
+
+@dataclass(frozen=True)
+class Dimension:
+    name: str
+    description: str
+    derived_from: str | None = None
+    derivation: str | None = None
+
+    def expression(self, base_column: str) -> str:
+        if self.derivation is None:
+            return base_column
+        return self.derivation.replace("{" + self.derived_from + "}", base_column)
+
+
+@dataclass
+class Source:
+    name: str
+    kind: str
+    description: str
+    filter: str | None = None
+    metrics: dict[str, str] = field(default_factory=dict)
+    dimensions: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_aggregate(self) -> bool:
+        return self.kind == "AGGREGATE"
+
+
+@dataclass
+class SemanticModel:
+    metrics: dict[str, Metric]
+    dimensions: dict[str, Dimension]
+    sources: dict[str, Source]
+
+    def metric(self, name: str) -> Metric:
+        try:
+            return self.metrics[name.upper()]
+        except KeyError:
+            raise ModelError(f"Unknown metric {name!r}. Defined: {', '.join(sorted(self.metrics))}") from None
+
+    def dimension(self, name: str) -> Dimension:
+        try:
+            return self.dimensions[name.upper()]
+        except KeyError:
+            raise ModelError(f"Unknown dimension {name!r}. Defined: {', '.join(sorted(self.dimensions))}") from None
+
+    def validate(self) -> None:
+        for metric in self.metrics.values():
+            if metric.additivity not in ADDITIVITIES:
+                raise ModelError(f"{metric.name}: unknown additivity {metric.additivity!r}")
+            if metric.additivity == "RATIO":
+                for component in (metric.numerator, metric.denominator):
+                    if component not in self.metrics or self.metrics[component].additivity != "ADDITIVE":
+                        raise ModelError(f"{metric.name}: ratio component {component!r} must be an ADDITIVE metric")
+        for dimension in self.dimensions.values():
+            if dimension.derived_from is not None and dimension.derived_from not in self.dimensions:
+                raise ModelError(f"{dimension.name}: derived from unknown dimension {dimension.derived_from!r}")
+        for source in self.sources.values():
+            if source.kind not in SOURCE_KINDS:
+                raise ModelError(f"{source.name}: unknown source kind {source.kind!r}")
+            for name in source.metrics:
+                if name not in self.metrics:
+                    raise ModelError(f"{source.name}: maps unknown metric {name!r}")
+                if self.metrics[name].additivity == "RATIO":
+                    raise ModelError(f"{source.name}: RATIO metric {name} is computed from its components, not mapped")
+            for name in source.dimensions:
+                if name not in self.dimensions:
+                    raise ModelError(f"{source.name}: maps unknown dimension {name!r}")
+
+
+def load_model(query: Query, schema: str = MODEL_SCHEMA) -> SemanticModel:
+    metrics = {
+        name: Metric(
+            name=name,
+            additivity=additivity,
+            unit=unit,
+            description=description,
+            numerator=numerator,
+            denominator=denominator,
+            multiplier=float(multiplier) if multiplier is not None else 1.0,
+        )
+        for name, additivity, numerator, denominator, multiplier, unit, description in query(
+            f"SELECT METRIC_NAME, ADDITIVITY, NUMERATOR_METRIC, DENOMINATOR_METRIC, MULTIPLIER, UNIT, DESCRIPTION "
+            f"FROM {schema}.SEMANTIC_METRICS"
+        )
+    }
+    dimensions = {
+        name: Dimension(name, description, derived_from, derivation)
+        for name, derived_from, derivation, description in query(
+            f"SELECT DIMENSION_NAME, DERIVED_FROM, DERIVATION, DESCRIPTION FROM {schema}.SEMANTIC_DIMENSIONS"
+        )
+    }
+    sources = {
+        name: Source(name, kind, description, source_filter)
+        for name, kind, source_filter, description in query(
+            f"SELECT SOURCE_NAME, SOURCE_KIND, SOURCE_FILTER, DESCRIPTION FROM {schema}.SEMANTIC_SOURCES"
+        )
+    }
+    for source_name, metric_name, expression in query(
+        f"SELECT SOURCE_NAME, METRIC_NAME, AGGREGATE_EXPRESSION FROM {schema}.SEMANTIC_SOURCE_METRICS"
+    ):
+        _source(sources, source_name).metrics[metric_name] = expression
+    for source_name, dimension_name, column in query(
+        f"SELECT SOURCE_NAME, DIMENSION_NAME, COLUMN_EXPRESSION FROM {schema}.SEMANTIC_SOURCE_DIMENSIONS"
+    ):
+        _source(sources, source_name).dimensions[dimension_name] = column
+
+    model = SemanticModel(metrics, dimensions, sources)
+    model.validate()
+    return model
+
+
+def _source(sources: dict[str, Source], name: str) -> Source:
+    if name not in sources:
+        raise ModelError(f"{name} is mapped but not listed in SEMANTIC_SOURCES")
+    return sources[name]
+
+
+def load_model_from_script(path: Path = MODEL_SCRIPT) -> SemanticModel:
+    import duckdb
+
+    database = MODEL_SCHEMA.split(".")[0]
+    con = duckdb.connect()
+    try:
+        con.execute(f"ATTACH ':memory:' AS {database}")
+        con.execute(f"CREATE SCHEMA {MODEL_SCHEMA}")
+        for statement in translate_file(path, date.today()):
+            if statement.target.split(".")[-1].startswith("SEMANTIC_"):
+                con.execute(statement.sql)
+        return load_model(lambda sql: con.execute(sql).fetchall())
+    finally:
+        con.close()
+
+
+def snowflake_query(connection_name: str) -> Query:
+    from snowflake.snowpark import Session
+
+    session = Session.builder.config("connection_name", connection_name).create()
+    return lambda sql: [tuple(row) for row in session.sql(sql).collect()]
@@ -0,0 +1,270 @@
+"""
+Aggregate-aware query planner over the semantic model.
+
+For each requested metric the planner picks the cheapest source that can
+answer it: AGGREGATE sources before FACT sources, then fewest rows. A source
+can answer when:
+  * it maps the metric (RATIO: both components) and every requested and
+    filtered dimension, directly or by derivation (YEAR from MONTH);
+  * for NON_ADDITIVE metrics on an AGGREGATE, the requested base dimensions
+    are exactly the source grain, so no re-aggregation is needed.
+
+Metrics routed to the same source share one GROUP BY; different sources are
+FULL OUTER JOINed on the requested dimensions.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+
+from .model import Metric, Query, SemanticModel, Source
+
+
+OPERATORS = ("=", "!=", "<>", "<=", ">=", "<", ">", "IN")
+
+
+class PlanningError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Filter:
+    dimension: str
+    operator: str
+    value: object
+
+    def __post_init__(self):
+        object.__setattr__(self, "dimension", self.dimension.upper())
+        object.__setattr__(self, "operator", self.operator.upper())
+        if self.operator not in OPERATORS:
+            raise PlanningError(f"Unsupported operator {self.operator!r}; use one of {', '.join(OPERATORS)}")
+
+
+@dataclass(frozen=True)
+class MetricRequest:
+    metrics: tuple[str, ...]
+    dimensions: tuple[str, ...] = ()
+    filters: tuple[Filter, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "metrics", tuple(dict.fromkeys(m.upper() for m in self.metrics)))
+        object.__setattr__(self, "dimensions", tuple(dict.fromkeys(d.upper() for d in self.dimensions)))
+        object.__setattr__(self, "filters", tuple(self.filters))
+        if not self.metrics:
+            raise PlanningError("A request needs at least one metric")
+
+
+@dataclass
+class QueryPlan:
+    request: MetricRequest
+    routes: dict[str, str]
+    sql: str
+    rejected: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    def explain(self) -> str:
+        lines = []
+        for metric, source in self.routes.items():
+            lines.append(f"{metric} -> {source}")
+            for name, reason in self.rejected.get(metric, {}).items():
+                lines.append(f"    skipped {name}: {reason}")
+        return "\n".join(lines)
+
+
+def sql_literal(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _parse_value(text: str):
+    text = text.strip()
+    if re.fullmatch(r"-?\d+", text):
+        return int(text)
+    if re.fullmatch(r"-?\d+\.\d*", text):
+        return float(text)
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+        return date.fromisoformat(text)
+    return text.strip("'\"")
+
+
+def parse_filter(text: str) -> Filter:
+    """``"YEAR >= 2025"``, ``"MONTH = 2025-06-01"``, ``"PAYER_TYPE IN MEDICARE,MEDICAID"``."""
+    match = re.fullmatch(r"\s*(\w+)\s*(!=|<>|<=|>=|=|<|>)\s*(.+?)\s*", text, re.IGNORECASE)
+    if not match:
+        match = re.fullmatch(r"\s*(\w+)\s+(IN)\s+(.+?)\s*", text, re.IGNORECASE)
+    if not match:
+        raise PlanningError(f"Cannot parse filter {text!r}; expected '<DIMENSION> <OP> <VALUE>'")
+    dimension, operator, value = match.group(1), match.group(2).strip().upper(), match.group(3)
+    if operator == "IN":
+        return Filter(dimension, operator, tuple(_parse_value(v) for v in value.strip("()").split(",")))
+    return Filter(dimension, operator, _parse_value(value))
+
+
+def source_row_counts(query: Query, model: SemanticModel) -> dict[str, int]:
+    """Row counts for AGGREGATE sources. Facts always rank after aggregates,
+    so they are not counted (V_INPATIENT_STAYS would run its window)."""
+    return {
+        name: list(query(f"SELECT COUNT(*) FROM {name}"))[0][0]
+        for name, source in model.sources.items()
+        if source.is_aggregate
+    }
+
+
+class QueryPlanner:
+    def __init__(self, model: SemanticModel, row_counts: dict[str, int] | None = None):
+        self.model = model
+        self.row_counts = row_counts or {}
+
+    def dimension_column(self, source: Source, name: str) -> str | None:
+        if name in source.dimensions:
+            return source.dimensions[name]
+        dimension = self.model.dimension(name)
+        if dimension.derived_from is None:
+            return None
+        base = self.dimension_column(source, dimension.derived_from)
+        return None if base is None else dimension.expression(base)
+
+    def metric_expression(self, source: Source, metric: Metric) -> str | None:
+        if metric.additivity != "RATIO":
+            return source.metrics.get(metric.name)
+        numerator = source.metrics.get(metric.numerator)
+        denominator = source.metrics.get(metric.denominator)
+        if numerator is None or denominator is None:
+            return None
+        return f"{numerator} * {metric.multiplier!r} / NULLIF({denominator}, 0)"
+
+    def rejection(self, source: Source, metric: Metric, request: MetricRequest) -> str | None:
+        """Why ``source`` cannot answer ``metric`` for ``request``; None if it can."""
+        if self.metric_expression(source, metric) is None:
+            return f"does not carry {metric.name}"
+        for name in (*request.dimensions, *(f.dimension for f in request.filters)):
+            if self.dimension_column(source, name) is None:
+                return f"has no {name}"
+        if metric.additivity == "NON_ADDITIVE" and source.is_aggregate:
+            requested = {d for d in request.dimensions if d in source.dimensions}
+            if requested != set(source.dimensions):
+                grain = ", ".join(sorted(source.dimensions))
+                return f"{metric.name} is NON_ADDITIVE and can only be read at the source grain ({grain})"
+        return None
+
+    def _cost(self, source: Source) -> tuple:
+        return (0 if source.is_aggregate else 1, self.row_counts.get(source.name, math.inf), source.name)
+
+    def route(
+        self, metric_name: str, request: MetricRequest, allow_aggregates: bool = True
+    ) -> tuple[Source, dict[str, str]]:
+        metric = self.model.metric(metric_name)
+        rejected, candidates = {}, []
+        for source in sorted(self.model.sources.values(), key=self._cost):
+            if source.is_aggregate and not allow_aggregates:
+                continue
+            reason = self.rejection(source, metric, request)
+            if reason is None:
+                candidates.append(source)
+            else:
+                rejected[source.name] = reason
+        if not candidates:
+            details = "; ".join(f"{name} {reason}" for name, reason in rejected.items())
+            raise PlanningError(f"No source can answer {metric.name} for this request: {details}")
+        chosen = candidates[0]
+        # Only explain cheaper sources that carry the metric but were unusable.
+        skipped = {
+            name: reason for name, reason in rejected.items()
+            if self._cost(self.model.sources[name]) < self._cost(chosen)
+            and self.metric_expression(self.model.sources[name], metric) is not None
+        }
+        return chosen, skipped
+
+    def plan(self, request: MetricRequest, allow_aggregates: bool = True) -> QueryPlan:
+        for name in request.dimensions:
+            self.model.dimension(name)
+        for f in request.filters:
+            self.model.dimension(f.dimension)
+
+        routes, rejected, by_source = {}, {}, {}
+        for metric_name in request.metrics:
+            source, skipped = self.route(metric_name, request, allow_aggregates)
+            routes[metric_name] = source.name
+            if skipped:
+                rejected[metric_name] = skipped
+            by_source.setdefault(source.name, []).append(metric_name)
+
+        subqueries = [
+            self._subquery(self.model.sources[name], metrics, request)
+            for name, metrics in by_source.items()
+        ]
+        if len(subqueries) == 1:
+            sql = subqueries[0]
+            if request.dimensions:
+                sql += "\nORDER BY " + ", ".join(str(i + 1) for i in range(len(request.dimensions)))
+        else:
+            sql = self._join(subqueries, list(by_source.values()), request)
+        return QueryPlan(request, routes, sql, rejected)
+
+    def _subquery(self, source: Source, metric_names: list[str], request: MetricRequest) -> str:
+        dimensions = [(name, self.dimension_column(source, name)) for name in request.dimensions]
+        columns = [f"{expression} AS {name}" for name, expression in dimensions]
+        columns += [
+            f"{self.metric_expression(source, self.model.metric(name))} AS {name}"
+            for name in metric_names
+        ]
+        predicates = [source.filter] if source.filter else []
+        for f in request.filters:
+            column = self.dimension_column(source, f.dimension)
+            if f.operator == "IN":
+                values = f.value if isinstance(f.value, (list, tuple, set)) else (f.value,)
+                predicates.append(f"{column} IN ({', '.join(sql_literal(v) for v in values)})")
+            else:
+                predicates.append(f"{column} {f.operator} {sql_literal(f.value)}")
+
+        sql = "SELECT\n    " + ",\n    ".join(columns) + f"\nFROM {source.name}"
+        if predicates:
+            sql += "\nWHERE " + "\n  AND ".join(f"({p})" for p in predicates)
+        if dimensions:
+            sql += "\nGROUP BY " + ", ".join(expression for _, expression in dimensions)
+        return sql
+
+    def _join(self, subqueries: list[str], metric_groups: list[list[str]], request: MetricRequest) -> str:
+        aliases = [f"q{i + 1}" for i in range(len(subqueries))]
+        ctes = ",\n".join(
+            f"{alias} AS (\n" + "\n".join("    " + line for line in sql.splitlines()) + "\n)"
+            for alias, sql in zip(aliases, subqueries)
+        )
+
+        def coalesced(dimension: str, upto: int) -> str:
+            if upto == 1:
+                return f"{aliases[0]}.{dimension}"
+            return "COALESCE(" + ", ".join(f"{a}.{dimension}" for a in aliases[:upto]) + ")"
+
+        columns = [f"{coalesced(d, len(aliases))} AS {d}" for d in request.dimensions]
+        columns += [
+            f"{alias}.{metric}"
+            for alias, metrics in zip(aliases, metric_groups)
+            for metric in metrics
+        ]
+        joins = aliases[0]
+        for i, alias in enumerate(aliases[1:], start=1):
+            if request.dimensions:
+                condition = "\n    AND ".join(
+                    f"{coalesced(d, i)} IS NOT DISTINCT FROM {alias}.{d}" for d in request.dimensions
+                )
+                joins += f"\nFULL OUTER JOIN {alias}\n    ON {condition}"
+            else:
+                joins += f"\nCROSS JOIN {alias}"
+
+        sql = f"WITH {ctes}\nSELECT\n    " + ",\n    ".join(columns) + f"\nFROM {joins}"
+        if request.dimensions:
+            sql += "\nORDER BY " + ", ".join(str(i + 1) for i in range(len(request.dimensions)))
+        return sql
@@ -0,0 +1,13 @@
+from .advisor import advise, recommend_warehouse
+from .simulator import QueryRecord, WarehouseConfig, simulate
+from .workload import Workload, load_workload
+
+__all__ = [
+    "QueryRecord",
+    "WarehouseConfig",
+    "Workload",
+    "advise",
+    "load_workload",
+    "recommend_warehouse",
+    "simulate",
+]
@@ -0,0 +1,93 @@
+"""
+Usage:
+    python -m tools.warehouse_advisor export --connection medicore --out workload/
+    python -m tools.warehouse_advisor recommend --workload workload/ [--enterprise] [--format json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .advisor import advise
+from .workload import export_workload, load_workload
+
+
+def _print_text(recommendations, quota_checks) -> None:
+    for rec in recommendations:
+        print(f"== {rec.warehouse_name} ({rec.query_count} queries, "
+              f"p95 queue target {rec.queue_target_seconds:.0f}s, "
+              f"calibration {rec.calibration_factor:.2f}x)")
+        for key, value in rec.observed.items():
+            print(f"   observed {key}: {value}")
+        print(f"   current:     {rec.current.config.label():<45} "
+              f"{rec.current.monthly_credits:8.1f} credits/month  "
+              f"p95 queue {rec.current.result.p95_queue_seconds:7.1f}s")
+        print(f"   recommended: {rec.recommended.config.label():<45} "
+              f"{rec.recommended.monthly_credits:8.1f} credits/month  "
+              f"p95 queue {rec.recommended.result.p95_queue_seconds:7.1f}s")
+        print("   credits vs queue-time frontier:")
+        for candidate in rec.frontier:
+            print(f"     {candidate.config.label():<45} {candidate.monthly_credits:8.1f}  "
+                  f"{candidate.result.p95_queue_seconds:7.1f}s")
+        for warning in rec.warnings:
+            print(f"   WARNING: {warning}")
+        print()
+
+    print("== Resource monitor check (projected monthly credits)")
+    for check in quota_checks:
+        print(f"   {check.monitor_name:<28} quota {check.credit_quota:6.0f}  "
+              f"current {check.current_monthly_credits:7.1f}  "
+              f"projected {check.projected_monthly_credits:7.1f} "
+              f"({check.projected_percent:5.1f}%)  {check.status}")
+
+    statements = [r.alter_statement() for r in recommendations if r.alter_statement()]
+    if statements:
+        print()
+        print("-- Recommended changes (review before running as MEDICORE_PLATFORM_ADMIN)")
+        print("\n".join(statements))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.warehouse_advisor")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Extract monitoring views to CSV")
+    export.add_argument("--connection", required=True, help="connections.toml entry")
+    export.add_argument("--out", type=Path, required=True)
+
+    recommend = commands.add_parser("recommend", help="Replay an extract and recommend settings")
+    recommend.add_argument("--workload", type=Path, required=True)
+    recommend.add_argument("--warehouse", action="append", help="Limit to one or more warehouses")
+    recommend.add_argument("--enterprise", action="store_true",
+                           help="Include multi-cluster candidates (Enterprise Edition)")
+    recommend.add_argument("--format", choices=("text", "json"), default="text")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        for path in export_workload(args.connection, args.out):
+            print(path)
+        return 0
+
+    workload = load_workload(args.workload)
+    if not workload.queries:
+        print(f"No queries found in {args.workload / 'query_performance.csv'}", file=sys.stderr)
+        return 1
+    recommendations, quota_checks = advise(workload, args.enterprise, args.warehouse)
+    if args.format == "json":
+        json.dump({
+            "window_days": round(workload.window_days(), 2),
+            "warehouses": [r.as_dict() for r in recommendations],
+            "resource_monitors": [c.as_dict() for c in quota_checks],
+        }, sys.stdout, indent=2)
+        print()
+    else:
+        _print_text(recommendations, quota_checks)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""
+MediCore warehouse sizing and auto-suspend advisor.
+
+For each warehouse, replays the recorded workload against a grid of candidate
+configurations, projects monthly credits and queue time for each, picks the
+cheapest configuration that meets the warehouse's queue-time target, and
+checks the projected spend against the Phase 05 resource monitor quotas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .simulator import (
+    WAREHOUSE_SIZES,
+    SimulationResult,
+    WarehouseConfig,
+    percentile,
+    simulate,
+)
+from .workload import Workload
+
+
+DAYS_PER_MONTH = 30
+
+# Mirrors infrastructure/03_warehouses/03_warehouse_management.sql
+CURRENT_CONFIGS = {
+    "MEDICORE_ADMIN_WH": WarehouseConfig("XSMALL", 60),
+    "MEDICORE_ETL_WH": WarehouseConfig("MEDIUM", 300),
+    "MEDICORE_ANALYTICS_WH": WarehouseConfig("SMALL", 120),
+    "MEDICORE_ML_WH": WarehouseConfig("LARGE", 300),
+}
+
+# Mirrors infrastructure/05_resource-monitors/05_resource_monitors.sql.
+# MEDICORE_ADMIN_WH has no warehouse-level monitor; it only counts against
+# the account monitor.
+RESOURCE_MONITORS = {
+    "MEDICORE_ACCOUNT_MONITOR": (500.0, tuple(CURRENT_CONFIGS)),
+    "MEDICORE_ETL_MONITOR": (200.0, ("MEDICORE_ETL_WH",)),
+    "MEDICORE_ANALYTICS_MONITOR": (150.0, ("MEDICORE_ANALYTICS_WH",)),
+    "MEDICORE_ML_MONITOR": (100.0, ("MEDICORE_ML_WH",)),
+}
+
+# p95 queue-time targets: interactive dashboards need near-zero queueing,
+# batch ETL and ML can absorb minutes.
+QUEUE_TARGET_SECONDS = {
+    "MEDICORE_ADMIN_WH": 30.0,
+    "MEDICORE_ETL_WH": 300.0,
+    "MEDICORE_ANALYTICS_WH": 5.0,
+    "MEDICORE_ML_WH": 120.0,
+}
+DEFAULT_QUEUE_TARGET_SECONDS = 60.0
+
+CANDIDATE_SIZES = WAREHOUSE_SIZES[:5]
+CANDIDATE_AUTO_SUSPEND_SECONDS = (60, 120, 300, 600)
+# Multi-cluster warehouses require Enterprise Edition (docs/03 compatibility table).
+ENTERPRISE_CLUSTER_RANGES = ((1, 2), (1, 3))
+
+# Phase 05 warehouse monitors NOTIFY at 75% and 90% and SUSPEND at 100%; the
+# 90% notification is also where ALERT_RESOURCE_MONITOR_CRITICAL fires. Budget
+# the recommended configuration within that critical level, which leaves the
+# last tenth of the quota for month-to-month variance before suspension.
+QUOTA_HEADROOM = 0.90
+CALIBRATION_WARN_RANGE = (0.5, 2.0)
+
+
+@dataclass
+class Candidate:
+    config: WarehouseConfig
+    result: SimulationResult
+    monthly_credits: float
+
+    def as_dict(self) -> dict:
+        return {
+            "config": self.config.label(),
+            "size": self.config.size,
+            "auto_suspend_seconds": self.config.auto_suspend_seconds,
+            "min_cluster_count": self.config.min_cluster_count,
+            "max_cluster_count": self.config.max_cluster_count,
+            "monthly_credits": round(self.monthly_credits, 2),
+            "avg_queue_seconds": round(self.result.avg_queue_seconds, 2),
+            "p95_queue_seconds": round(self.result.p95_queue_seconds, 2),
+            "max_queue_seconds": round(self.result.max_queue_seconds, 2),
+            "resume_count": self.result.resume_count,
+            "idle_ratio": round(self.result.idle_ratio, 3),
+        }
+
+
+@dataclass
+class WarehouseRecommendation:
+    warehouse_name: str
+    query_count: int
+    queue_target_seconds: float
+    calibration_factor: float
+    current: Candidate
+    recommended: Candidate
+    frontier: list[Candidate]
+    observed: dict[str, float] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+
+    def alter_statement(self) -> str | None:
+        current, target = self.current.config, self.recommended.config
+        settings = []
+        if target.size != current.size:
+            settings.append(f"WAREHOUSE_SIZE = '{target.size}'")
+        if target.auto_suspend_seconds != current.auto_suspend_seconds:
+            settings.append(f"AUTO_SUSPEND = {target.auto_suspend_seconds}")
+        if target.max_cluster_count != current.max_cluster_count:
+            settings.append(f"MIN_CLUSTER_COUNT = {target.min_cluster_count}")
+            settings.append(f"MAX_CLUSTER_COUNT = {target.max_cluster_count}")
+            settings.append(f"SCALING_POLICY = '{target.scaling_policy}'")
+        if not settings:
+            return None
+        return f"ALTER WAREHOUSE {self.warehouse_name} SET\n    " + "\n    ".join(settings) + ";"
+
+    def as_dict(self) -> dict:
+        return {
+            "warehouse_name": self.warehouse_name,
+            "query_count": self.query_count,
+            "queue_target_seconds": self.queue_target_seconds,
+            "calibration_factor": round(self.calibration_factor, 3),
+            "observed": self.observed,
+            "current": self.current.as_dict(),
+            "recommended": self.recommended.as_dict(),
+            "frontier": [c.as_dict() for c in self.frontier],
+            "alter_statement": self.alter_statement(),
+            "warnings": self.warnings,
+        }
+
+
+@dataclass
+class QuotaCheck:
+    monitor_name: str
+    credit_quota: float
+    current_monthly_credits: float
+    projected_monthly_credits: float
+
+    @property
+    def projected_percent(self) -> float:
+        return self.projected_monthly_credits / self.credit_quota * 100 if self.credit_quota else 0.0
+
+    @property
+    def status(self) -> str:
+        # Bands follow the Phase 05 triggers: NOTIFY 75, NOTIFY 90 (critical,
+        # also ALERT_RESOURCE_MONITOR_CRITICAL), SUSPEND 100. EXCEEDS means the
+        # monitor would suspend its warehouses before the month ends.
+        if self.projected_percent >= 100:
+            return "EXCEEDS"
+        if self.projected_percent >= 90:
+            return "AT_RISK"
+        if self.projected_percent >= 75:
+            return "NOTIFY"
+        return "OK"
+
+    def as_dict(self) -> dict:
+        return {
+            "monitor_name": self.monitor_name,
+            "credit_quota": self.credit_quota,
+            "current_monthly_credits": round(self.current_monthly_credits, 2),
+            "projected_monthly_credits": round(self.projected_monthly_credits, 2),
+            "projected_percent": round(self.projected_percent, 1),
+            "status": self.status,
+        }
+
+
+def candidate_configs(current: WarehouseConfig, enterprise: bool = False) -> list[WarehouseConfig]:
+    configs = {current}
+    for size in CANDIDATE_SIZES:
+        for auto_suspend in CANDIDATE_AUTO_SUSPEND_SECONDS:
+            configs.add(WarehouseConfig(size, auto_suspend))
+            if enterprise:
+                for low, high in ENTERPRISE_CLUSTER_RANGES:
+                    for policy in ("STANDARD", "ECONOMY"):
+                        configs.add(WarehouseConfig(size, auto_suspend, low, high, policy))
+    return sorted(
+        configs,
+        key=lambda c: (WAREHOUSE_SIZES.index(c.size), c.auto_suspend_seconds, c.max_cluster_count, c.scaling_policy),
+    )
+
+
+def calibration_factor(workload: Workload, warehouse_name: str, simulated_monthly: float) -> float:
+    """Ratio of metered to simulated credits for the current configuration.
+
+    Uses complete months only. V_COST_BY_WAREHOUSE_MONTH covers the last 12
+    months from today, so its earliest month starts mid-month and its latest
+    is still accruing; both are dropped.
+    """
+    months = workload.monthly_credits.get(warehouse_name, {})
+    complete = [credits for month, credits in sorted(months.items())[1:-1]]
+    if not complete or simulated_monthly <= 0:
+        return 1.0
+    return (sum(complete) / len(complete)) / simulated_monthly
+
+
+def pareto_frontier(candidates: list[Candidate]) -> list[Candidate]:
+    """Candidates not beaten on both monthly credits and p95 queue time."""
+    frontier = []
+    best_queue = float("inf")
+    for candidate in sorted(candidates, key=lambda c: (c.monthly_credits, c.result.p95_queue_seconds)):
+        if candidate.result.p95_queue_seconds < best_queue:
+            frontier.append(candidate)
+            best_queue = candidate.result.p95_queue_seconds
+    return frontier
+
+
+def _warehouse_quota(warehouse_name: str, quotas: dict[str, float]) -> float | None:
+    for monitor_name, (_, warehouses) in RESOURCE_MONITORS.items():
+        if monitor_name != "MEDICORE_ACCOUNT_MONITOR" and warehouses == (warehouse_name,):
+            return quotas[monitor_name]
+    return None
+
+
+def recommend_warehouse(
+    workload: Workload,
+    warehouse_name: str,
+    enterprise: bool = False,
+    quotas: dict[str, float] | None = None,
+) -> WarehouseRecommendation:
+    quotas = quotas or monitor_quotas(workload)
+    queries = workload.queries_for(warehouse_name)
+    window_seconds = workload.window_days() * 86400
+    months_in_window = workload.window_days() / DAYS_PER_MONTH
+    current_config = CURRENT_CONFIGS.get(warehouse_name, WarehouseConfig(queries[0].warehouse_size, 300))
+    queue_target = QUEUE_TARGET_SECONDS.get(warehouse_name, DEFAULT_QUEUE_TARGET_SECONDS)
+
+    raw = {
+        config: simulate(queries, config, window_seconds=window_seconds)
+        for config in candidate_configs(current_config, enterprise)
+    }
+    factor = calibration_factor(workload, warehouse_name, raw[current_config].credits / months_in_window)
+    candidates = {
+        config: Candidate(config, result, result.credits / months_in_window * factor)
+        for config, result in raw.items()
+    }
+    current = candidates[current_config]
+
+    warnings = []
+    low, high = CALIBRATION_WARN_RANGE
+    if not low <= factor <= high:
+        warnings.append(
+            f"Simulated credits differ from metered credits by {factor:.2f}x; "
+            "the extract may not cover the full workload."
+        )
+
+    quota = _warehouse_quota(warehouse_name, quotas)
+    budget = quota * QUOTA_HEADROOM if quota else float("inf")
+    eligible = [
+        c for c in candidates.values()
+        if c.result.p95_queue_seconds <= queue_target and c.monthly_credits <= budget
+    ]
+    if eligible:
+        recommended = min(
+            eligible,
+            key=lambda c: (round(c.monthly_credits, 2), c.result.p95_queue_seconds, c.config != current_config),
+        )
+    else:
+        recommended = min(candidates.values(), key=lambda c: (c.result.p95_queue_seconds, c.monthly_credits))
+        warnings.append(
+            f"No candidate meets the {queue_target:.0f}s p95 queue target within "
+            f"{QUOTA_HEADROOM:.0%} of the monitor quota; recommending the lowest queue time."
+        )
+
+    observed = {}
+    if warehouse_name in workload.utilization:
+        observed.update(workload.utilization[warehouse_name])
+        observed["simulated_avg_running"] = round(current.result.avg_running, 3)
+    if warehouse_name in workload.peak_load:
+        observed.update(workload.peak_load[warehouse_name])
+    observed["recorded_p95_queue_seconds"] = round(
+        percentile([q.queued_seconds for q in queries], 95), 2
+    )
+
+    return WarehouseRecommendation(
+        warehouse_name=warehouse_name,
+        query_count=len(queries),
+        queue_target_seconds=queue_target,
+        calibration_factor=factor,
+        current=current,
+        recommended=recommended,
+        frontier=pareto_frontier(list(candidates.values())),
+        observed=observed,
+        warnings=warnings,
+    )
+
+
+def monitor_quotas(workload: Workload) -> dict[str, float]:
+    """Phase 05 quotas, overridden by live values from V_RESOURCE_MONITOR_STATUS."""
+    quotas = {name: quota for name, (quota, _) in RESOURCE_MONITORS.items()}
+    quotas.update({k: v for k, v in workload.monitor_quotas.items() if k in quotas})
+    return quotas
+
+
+def check_quotas(
+    recommendations: list[WarehouseRecommendation],
+    quotas: dict[str, float],
+) -> list[QuotaCheck]:
+    by_warehouse = {r.warehouse_name: r for r in recommendations}
+    checks = []
+    for monitor_name, (_, warehouses) in RESOURCE_MONITORS.items():
+        covered = [by_warehouse[w] for w in warehouses if w in by_warehouse]
+        checks.append(QuotaCheck(
+            monitor_name=monitor_name,
+            credit_quota=quotas[monitor_name],
+            current_monthly_credits=sum(r.current.monthly_credits for r in covered),
+            projected_monthly_credits=sum(r.recommended.monthly_credits for r in covered),
+        ))
+    return checks
+
+
+def advise(
+    workload: Workload,
+    enterprise: bool = False,
+    warehouses: list[str] | None = None,
+) -> tuple[list[WarehouseRecommendation], list[QuotaCheck]]:
+    quotas = monitor_quotas(workload)
+    names = warehouses or workload.warehouses()
+    recommendations = [
+        recommend_warehouse(workload, name, enterprise, quotas)
+        for name in names
+        if workload.queries_for(name)
+    ]
+    return recommendations, check_quotas(recommendations, quotas)
@@ -0,0 +1,282 @@
+"""
+MediCore warehouse workload simulator.
+
+Replays a recorded query stream (arrival time + execution seconds) against a
+candidate warehouse configuration and reports the credits that configuration
+would bill and the queue time it would impose.
+
+Model:
+  - Credits per hour per cluster follow the Snowflake size ladder
+    (XSMALL = 1, doubling per size).
+  - Each cluster resume is billed per second with a 60-second minimum.
+  - Each cluster runs up to MAX_CONCURRENCY_LEVEL queries at once; further
+    queries wait in a FIFO queue.
+  - The warehouse suspends after AUTO_SUSPEND seconds with no running or
+    queued queries, and resumes on the next arrival.
+  - Multi-cluster warehouses (Enterprise Edition) start an extra cluster when
+    a query queues (STANDARD) or when queued work would keep a cluster busy
+    for 6 minutes (ECONOMY). Extra clusters stop after sitting idle.
+  - Execution time at a different size scales by
+    (credits_observed / credits_target) ** scaling_exponent. An exponent of 1
+    means perfectly parallel work; 0 means size has no effect.
+
+The model ignores resume latency, query acceleration, and result-cache hits.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+WAREHOUSE_SIZES = [
+    "XSMALL", "SMALL", "MEDIUM", "LARGE", "XLARGE", "XXLARGE", "XXXLARGE", "X4LARGE",
+]
+
+CREDITS_PER_HOUR = {size: 2 ** i for i, size in enumerate(WAREHOUSE_SIZES)}
+
+# QUERY_HISTORY reports sizes as 'X-Small', 'Medium', '2X-Large', ...
+_SIZE_ALIASES = {
+    "XSMALL": "XSMALL", "SMALL": "SMALL", "MEDIUM": "MEDIUM", "LARGE": "LARGE",
+    "XLARGE": "XLARGE", "2XLARGE": "XXLARGE", "XXLARGE": "XXLARGE",
+    "3XLARGE": "XXXLARGE", "XXXLARGE": "XXXLARGE", "4XLARGE": "X4LARGE", "X4LARGE": "X4LARGE",
+}
+
+MINIMUM_BILLED_SECONDS = 60
+DEFAULT_SCALING_EXPONENT = 0.8
+ECONOMY_QUEUED_WORK_SECONDS = 360
+SCALE_IN_IDLE_SECONDS = {"STANDARD": 120, "ECONOMY": 360}
+
+
+def normalize_size(size: str | None) -> str | None:
+    if not size:
+        return None
+    return _SIZE_ALIASES.get(size.upper().replace("-", "").replace("_", "").strip())
+
+
+def scaled_execution_seconds(
+    seconds: float,
+    observed_size: str,
+    target_size: str,
+    scaling_exponent: float = DEFAULT_SCALING_EXPONENT,
+) -> float:
+    ratio = CREDITS_PER_HOUR[observed_size] / CREDITS_PER_HOUR[target_size]
+    return seconds * ratio ** scaling_exponent
+
+
+@dataclass(frozen=True)
+class WarehouseConfig:
+    size: str
+    auto_suspend_seconds: int
+    min_cluster_count: int = 1
+    max_cluster_count: int = 1
+    scaling_policy: str = "STANDARD"
+    max_concurrency_level: int = 8
+
+    @property
+    def is_multi_cluster(self) -> bool:
+        return self.max_cluster_count > 1
+
+    def label(self) -> str:
+        clusters = ""
+        if self.is_multi_cluster:
+            clusters = f", {self.min_cluster_count}-{self.max_cluster_count} clusters {self.scaling_policy}"
+        return f"{self.size}, suspend {self.auto_suspend_seconds}s{clusters}"
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    warehouse_name: str
+    start_time: datetime
+    execution_seconds: float
+    warehouse_size: str
+    queued_seconds: float = 0.0
+
+
+@dataclass
+class SimulationResult:
+    config: WarehouseConfig
+    window_seconds: float
+    credits: float = 0.0
+    billed_seconds: float = 0.0
+    busy_seconds: float = 0.0
+    resume_count: int = 0
+    queue_seconds: list[float] = field(default_factory=list)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queue_seconds)
+
+    @property
+    def avg_queue_seconds(self) -> float:
+        return sum(self.queue_seconds) / len(self.queue_seconds) if self.queue_seconds else 0.0
+
+    @property
+    def p95_queue_seconds(self) -> float:
+        return percentile(self.queue_seconds, 95)
+
+    @property
+    def max_queue_seconds(self) -> float:
+        return max(self.queue_seconds, default=0.0)
+
+    @property
+    def avg_running(self) -> float:
+        """Average concurrently running queries, comparable to AVG_QUERIES_RUNNING."""
+        return self.busy_seconds / self.window_seconds if self.window_seconds else 0.0
+
+    @property
+    def idle_ratio(self) -> float:
+        """Share of billed cluster-seconds with no query running."""
+        if not self.billed_seconds:
+            return 0.0
+        concurrency = self.config.max_concurrency_level
+        return max(0.0, 1.0 - self.busy_seconds / concurrency / self.billed_seconds)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+@dataclass
+class _Cluster:
+    active: bool = False
+    running: int = 0
+    session_start: float = 0.0
+    generation: int = 0
+
+
+_ARRIVAL, _FINISH, _SUSPEND, _CLUSTER_IDLE = range(4)
+
+
+def simulate(
+    queries: list[QueryRecord],
+    config: WarehouseConfig,
+    scaling_exponent: float = DEFAULT_SCALING_EXPONENT,
+    window_seconds: float | None = None,
+) -> SimulationResult:
+    """Replay ``queries`` on ``config`` and return billed credits and queue times."""
+    arrivals = sorted(queries, key=lambda q: q.start_time)
+    if not arrivals:
+        return SimulationResult(config=config, window_seconds=window_seconds or 0.0)
+
+    origin = arrivals[0].start_time
+    if window_seconds is None:
+        window_seconds = max((arrivals[-1].start_time - origin).total_seconds(), 1.0)
+    result = SimulationResult(config=config, window_seconds=window_seconds)
+
+    events: list[tuple[float, int, int, object]] = []
+    sequence = itertools.count()
+
+    def schedule(at: float, kind: int, payload: object = None) -> None:
+        heapq.heappush(events, (at, next(sequence), kind, payload))
+
+    for query in arrivals:
+        duration = scaled_execution_seconds(
+            query.execution_seconds, query.warehouse_size, config.size, scaling_exponent
+        )
+        schedule((query.start_time - origin).total_seconds(), _ARRIVAL, duration)
+
+    clusters = [_Cluster() for _ in range(config.max_cluster_count)]
+    queue: deque[tuple[float, float]] = deque()
+    resumed = False
+    suspend_generation = 0
+    now = 0.0
+
+    def start_cluster(index: int, at: float) -> None:
+        cluster = clusters[index]
+        cluster.active = True
+        cluster.running = 0
+        cluster.session_start = at
+        cluster.generation += 1
+
+    def stop_cluster(index: int, at: float) -> None:
+        cluster = clusters[index]
+        billed = max(at - cluster.session_start, MINIMUM_BILLED_SECONDS)
+        result.billed_seconds += billed
+        result.credits += billed / 3600 * CREDITS_PER_HOUR[config.size]
+        cluster.active = False
+        cluster.generation += 1
+
+    def dispatch(at: float) -> None:
+        while queue:
+            candidates = [
+                i for i, c in enumerate(clusters)
+                if c.active and c.running < config.max_concurrency_level
+            ]
+            if not candidates:
+                return
+            index = min(candidates, key=lambda i: clusters[i].running)
+            arrived_at, duration = queue.popleft()
+            result.queue_seconds.append(at - arrived_at)
+            result.busy_seconds += duration
+            clusters[index].running += 1
+            clusters[index].generation += 1
+            schedule(at + duration, _FINISH, index)
+
+    def scale_out(at: float) -> None:
+        if not queue:
+            return
+        idle = [i for i, c in enumerate(clusters) if not c.active]
+        if not idle:
+            return
+        if config.scaling_policy == "ECONOMY":
+            if sum(duration for _, duration in queue) < ECONOMY_QUEUED_WORK_SECONDS:
+                return
+        start_cluster(idle[0], at)
+
+    while events:
+        now, _, kind, payload = heapq.heappop(events)
+
+        if kind == _ARRIVAL:
+            if not resumed:
+                resumed = True
+                result.resume_count += 1
+                for index in range(config.min_cluster_count):
+                    start_cluster(index, now)
+            suspend_generation += 1
+            queue.append((now, payload))
+            dispatch(now)
+            scale_out(now)
+            dispatch(now)
+
+        elif kind == _FINISH:
+            index = payload
+            clusters[index].running -= 1
+            dispatch(now)
+            cluster = clusters[index]
+            if cluster.running == 0 and not queue and index >= config.min_cluster_count:
+                schedule(
+                    now + SCALE_IN_IDLE_SECONDS.get(config.scaling_policy, 120),
+                    _CLUSTER_IDLE,
+                    (index, cluster.generation),
+                )
+            if not queue and all(c.running == 0 for c in clusters) and config.auto_suspend_seconds > 0:
+                schedule(now + config.auto_suspend_seconds, _SUSPEND, suspend_generation)
+
+        elif kind == _SUSPEND:
+            if payload == suspend_generation and not queue and all(c.running == 0 for c in clusters):
+                for index, cluster in enumerate(clusters):
+                    if cluster.active:
+                        stop_cluster(index, now)
+                resumed = False
+
+        elif kind == _CLUSTER_IDLE:
+            index, generation = payload
+            cluster = clusters[index]
+            if cluster.active and cluster.generation == generation and cluster.running == 0:
+                stop_cluster(index, now)
+
+    # AUTO_SUSPEND = 0 never suspends; bill until the end of the replay window.
+    for index, cluster in enumerate(clusters):
+        if cluster.active:
+            stop_cluster(index, max(now, window_seconds))
+
+    return result
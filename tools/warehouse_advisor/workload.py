@@ -0,0 +1,152 @@
+"""
+Workload extract for the warehouse advisor.
+
+The advisor runs offline against CSV extracts of the Phase 06 monitoring
+views, so a recommendation can be reproduced (and reviewed) without a live
+connection. ``export_workload`` pulls the extracts through Snowpark;
+``load_workload`` reads them back.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .simulator import QueryRecord, normalize_size
+
+
+AUDIT_SCHEMA = "MEDICORE_GOVERNANCE_DB.AUDIT"
+
+# COMPILE_TIME_SECONDS in V_QUERY_PERFORMANCE is QUERY_HISTORY.EXECUTION_TIME,
+# i.e. time spent executing on the warehouse, which is what the simulator needs.
+# EXECUTION_TIME_SECONDS is TOTAL_ELAPSED_TIME and already includes queueing.
+EXTRACTS = {
+    "query_performance": f"""
+        SELECT WAREHOUSE_NAME, WAREHOUSE_SIZE, START_TIME,
+               COMPILE_TIME_SECONDS AS WAREHOUSE_EXECUTION_SECONDS,
+               QUEUED_TIME_SECONDS
+        FROM {AUDIT_SCHEMA}.V_QUERY_PERFORMANCE
+        WHERE WAREHOUSE_SIZE IS NOT NULL
+          AND COMPILE_TIME_SECONDS > 0
+        ORDER BY START_TIME
+    """,
+    "warehouse_utilization": f"""
+        SELECT WAREHOUSE_NAME,
+               AVG(AVG_QUERIES_RUNNING) AS AVG_QUERIES_RUNNING,
+               AVG(AVG_QUERIES_QUEUED)  AS AVG_QUERIES_QUEUED,
+               COUNT(*)                 AS SAMPLE_COUNT
+        FROM {AUDIT_SCHEMA}.V_WAREHOUSE_UTILIZATION
+        GROUP BY WAREHOUSE_NAME
+    """,
+    "active_warehouse_load": f"""
+        SELECT WAREHOUSE_NAME, PEAK_QUERIES_RUNNING, PEAK_QUERIES_QUEUED
+        FROM {AUDIT_SCHEMA}.V_ACTIVE_WAREHOUSE_LOAD
+    """,
+    "cost_by_warehouse_month": f"""
+        SELECT WAREHOUSE_NAME, USAGE_MONTH, CREDITS_USED_COMPUTE, ACTIVE_DAYS
+        FROM {AUDIT_SCHEMA}.V_COST_BY_WAREHOUSE_MONTH
+        ORDER BY USAGE_MONTH
+    """,
+    "resource_monitor_status": f"""
+        SELECT MONITOR_NAME, CREDIT_QUOTA, USED_CREDITS
+        FROM {AUDIT_SCHEMA}.V_RESOURCE_MONITOR_STATUS
+    """,
+}
+
+
+@dataclass
+class Workload:
+    queries: list[QueryRecord] = field(default_factory=list)
+    utilization: dict[str, dict[str, float]] = field(default_factory=dict)
+    peak_load: dict[str, dict[str, float]] = field(default_factory=dict)
+    monthly_credits: dict[str, dict[str, float]] = field(default_factory=dict)
+    monitor_quotas: dict[str, float] = field(default_factory=dict)
+
+    def warehouses(self) -> list[str]:
+        return sorted({q.warehouse_name for q in self.queries})
+
+    def queries_for(self, warehouse_name: str) -> list[QueryRecord]:
+        return [q for q in self.queries if q.warehouse_name == warehouse_name]
+
+    def window_days(self) -> float:
+        if not self.queries:
+            return 0.0
+        starts = [q.start_time for q in self.queries]
+        return max((max(starts) - min(starts)).total_seconds() / 86400, 1.0)
+
+
+def export_workload(connection_name: str, out_dir: Path) -> list[Path]:
+    """Write one CSV per monitoring view extract into ``out_dir``."""
+    from snowflake.snowpark import Session
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    session = Session.builder.config("connection_name", connection_name).create()
+    written = []
+    try:
+        for name, sql in EXTRACTS.items():
+            rows = session.sql(sql).collect()
+            path = out_dir / f"{name}.csv"
+            with path.open("w", newline="") as handle:
+                writer = csv.writer(handle)
+                if rows:
+                    writer.writerow(rows[0].as_dict().keys())
+                    writer.writerows(row.as_dict().values() for row in rows)
+            written.append(path)
+    finally:
+        session.close()
+    return written
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    if not path.exists():
+        return []
+    with path.open(newline="") as handle:
+        return [{k.upper(): v for k, v in row.items()} for row in csv.DictReader(handle)]
+
+
+def _parse_time(value: str) -> datetime:
+    value = value.strip()
+    # Snowpark writes TIMESTAMP_LTZ as '2026-03-01 08:00:00.123000-08:00'
+    return datetime.fromisoformat(value.replace(" ", "T", 1))
+
+
+def load_workload(directory: Path) -> Workload:
+    workload = Workload()
+
+    for row in _read_csv(directory / "query_performance.csv"):
+        size = normalize_size(row["WAREHOUSE_SIZE"])
+        if size is None:
+            continue
+        workload.queries.append(QueryRecord(
+            warehouse_name=row["WAREHOUSE_NAME"],
+            start_time=_parse_time(row["START_TIME"]),
+            execution_seconds=float(row["WAREHOUSE_EXECUTION_SECONDS"]),
+            warehouse_size=size,
+            queued_seconds=float(row.get("QUEUED_TIME_SECONDS") or 0),
+        ))
+
+    for row in _read_csv(directory / "warehouse_utilization.csv"):
+        workload.utilization[row["WAREHOUSE_NAME"]] = {
+            "avg_running": float(row["AVG_QUERIES_RUNNING"] or 0),
+            "avg_queued": float(row["AVG_QUERIES_QUEUED"] or 0),
+        }
+
+    for row in _read_csv(directory / "active_warehouse_load.csv"):
+        workload.peak_load[row["WAREHOUSE_NAME"]] = {
+            "peak_running": float(row["PEAK_QUERIES_RUNNING"] or 0),
+            "peak_queued": float(row["PEAK_QUERIES_QUEUED"] or 0),
+        }
+
+    for row in _read_csv(directory / "cost_by_warehouse_month.csv"):
+        month = row["USAGE_MONTH"][:7]
+        workload.monthly_credits.setdefault(row["WAREHOUSE_NAME"], {})[month] = float(
+            row["CREDITS_USED_COMPUTE"] or 0
+        )
+
+    for row in _read_csv(directory / "resource_monitor_status.csv"):
+        if row.get("CREDIT_QUOTA"):
+            workload.monitor_quotas[row["MONITOR_NAME"]] = float(row["CREDIT_QUOTA"])
+
+    return workload